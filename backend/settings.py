@@ -153,6 +153,7 @@ TRACKER_STORAGE = {
     'MAX_RETRIES': 3,
     'RETRY_DELAY': 2,             # Exponential backoff base
     'CHUNK_SIZE': 8192,           # 8 KB chunks
+    'DOWNLOAD_WORKERS': 8,        # Concurrent downloads per batch
     
     # Features
     'ORGANIZE_BY_CATEGORY': True,  # Create category subfolders
@@ -160,6 +161,41 @@ TRACKER_STORAGE = {
     'CLEANUP_ON_DELETE': True,     # Delete files when tracker deleted
 }
 
+# Assembled mod download ZIPs, reused while the mod's files are unchanged.
+# Kept outside MEDIA_ROOT so backups and the media server never see them.
+# One archive is kept per mod, and the least recently used ones are removed
+# past MOD_ZIP_CACHE_MAX_BYTES whenever a new one is written; trim by hand
+# with `python manage.py prune_mod_zip_cache`.
+MOD_ZIP_CACHE_DIR = os.path.join(BASE_DIR, "cache", "mod_zips")
+MOD_ZIP_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+
+# Tracker download-files ZIPs, built by a Django-Q task once a tracker's
+# files are downloaded and served as-is while those files are unchanged.
+# One archive is kept per tracker, and the cache is trimmed to
+# TRACKER_ZIP_CACHE_MAX_BYTES whenever one is written; trim by hand with
+# `python manage.py prune_tracker_zip_cache`.
+TRACKER_ZIP_CACHE_DIR = os.path.join(BASE_DIR, "cache", "tracker_zips")
+TRACKER_ZIP_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB
+
+# Internal nginx location serving BASE_DIR/cache. When set, cached ZIPs are
+# answered with X-Accel-Redirect and nginx sends the file itself; leave
+# empty when Django is not behind the bundled nginx.
+ZIP_CACHE_ACCEL_REDIRECT_URL = os.environ.get("ZIP_CACHE_ACCEL_REDIRECT_URL", "")
+
+# Response cache (dashboard, tracker details, URL metadata). It must be shared
+# by every process: the version keys in inventory/models.py are bumped by
+# signals that also fire in the qcluster worker, management commands and
+# shell sessions, and a per-process LocMemCache would never let the web
+# process see those bumps. Lives next to the ZIP caches, which the compose
+# files already mount into both the backend and qcluster containers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(BASE_DIR, "cache", "django"),
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    }
+}
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -23,5 +23,8 @@ echo "Collecting static files..."
 python manage.py collectstatic --settings=backend.production --noinput
 
 # Start the Gunicorn web server.
+# Threads let requests that wait on remote servers (URL metadata lookups,
+# GitHub crawls, tracker downloads) overlap instead of holding the one
+# worker; override the count with GUNICORN_THREADS in .env.
 echo "Starting Gunicorn server..."
-python -m gunicorn backend.wsgi:application --bind 0.0.0.0:8000 --timeout 300
\ No newline at end of file
+python -m gunicorn backend.wsgi:application --bind 0.0.0.0:8000 --timeout 300 --threads "${GUNICORN_THREADS:-8}"
\ No newline at end of file
@@ -1,5 +1,11 @@
 # printvault/inventory/filters.py
+import operator
+from functools import reduce
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
 from django_filters import rest_framework as filters
+from rest_framework.filters import SearchFilter
 from .models import InventoryItem, Printer, Project, Material
 
 class MaterialFilter(filters.FilterSet):
@@ -33,4 +39,85 @@ class ProjectFilter(filters.FilterSet):
         model = Project
         fields = {
             'status': ['exact'],
-        }
\ No newline at end of file
+        }
+
+class QueryParamFilterBackend(filters.DjangoFilterBackend):
+    """
+    DjangoFilterBackend that skips the FilterSet when no filter is requested.
+
+    base_filters are built once per class (every Meta.fields above is an
+    explicit dict, never '__all__'), but each request still deep-copies them
+    into a new FilterSet and validates a form. Plain list calls - the common
+    case on the inventory, printer and project pages - need none of that.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is not None and filterset_class.base_filters.keys().isdisjoint(request.query_params):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+
+class IndexedSearchFilter(SearchFilter):
+    """
+    SearchFilter that keeps each term's OR on the searched table.
+
+    The stock filter ORs `brand__name__icontains` and friends across LEFT
+    JOINs, which leaves Postgres no choice but a sequential scan. Here a
+    single-hop related field is resolved to its matching ids first (brands,
+    part types and locations are small tables), so every arm is a column of
+    the searched table itself: the trigram indexes from migration 0049 cover
+    the text columns and the FK indexes cover the id lists.
+
+    Anything else - a lookup prefix such as "^" or "=", an explicit lookup,
+    more than one hop, or a to-many relation that needs distinct() - goes
+    to the stock SearchFilter unchanged.
+    """
+
+    def _split_search_field(self, model, search_field):
+        """
+        Return (relation, column) for a plain column or one forward FK hop.
+
+        relation is '' for a column of the searched table. Returns None for
+        any field this filter does not handle itself.
+        """
+        if search_field[:1] in self.lookup_prefixes:
+            return None
+        relation, _, column = search_field.rpartition('__')
+        if '__' in relation:
+            return None
+        try:
+            if relation:
+                field = model._meta.get_field(relation)
+                if not (field.many_to_one or (field.one_to_one and field.concrete)):
+                    return None
+                model = field.related_model
+            if model._meta.get_field(column).is_relation:
+                return None
+        except FieldDoesNotExist:
+            return None
+        return relation, column
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        split_fields = [self._split_search_field(queryset.model, str(field)) for field in search_fields]
+        if None in split_fields:
+            return super().filter_queryset(request, queryset, view)
+
+        conditions = []
+        for term in search_terms:
+            queries = []
+            for relation, column in split_fields:
+                if relation:
+                    related = queryset.model._meta.get_field(relation).related_model.objects.all()
+                    lookup = self.construct_search(column, related)
+                    ids = list(related.filter(**{lookup: term}).values_list('pk', flat=True))
+                    queries.append(Q(**{f'{relation}__in': ids}))
+                else:
+                    queries.append(Q(**{self.construct_search(column, queryset): term}))
+            conditions.append(reduce(operator.or_, queries))
+        return queryset.filter(reduce(operator.and_, conditions))
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from inventory.services.zip_archives import prune_zip_cache
+
+
+class Command(BaseCommand):
+    help = 'Delete the least recently used mod download ZIPs until the cache fits MOD_ZIP_CACHE_MAX_BYTES'
+    # prune_tracker_zip_cache reuses this command with its own settings
+    cache_dir_setting = 'MOD_ZIP_CACHE_DIR'
+    max_bytes_setting = 'MOD_ZIP_CACHE_MAX_BYTES'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-bytes',
+            type=int,
+            default=getattr(settings, self.max_bytes_setting),
+            help=f'Size the cache is trimmed to (default: {self.max_bytes_setting})',
+        )
+
+    def handle(self, *args, **options):
+        cache_dir = getattr(settings, self.cache_dir_setting)
+        removed, total = prune_zip_cache(cache_dir, options['max_bytes'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Removed {removed} cached ZIP(s); {total} bytes remain in {cache_dir}'
+            )
+        )
@@ -0,0 +1,7 @@
+from .prune_mod_zip_cache import Command as PruneModZipCacheCommand
+
+
+class Command(PruneModZipCacheCommand):
+    help = 'Delete the least recently used tracker download ZIPs until the cache fits TRACKER_ZIP_CACHE_MAX_BYTES'
+    cache_dir_setting = 'TRACKER_ZIP_CACHE_DIR'
+    max_bytes_setting = 'TRACKER_ZIP_CACHE_MAX_BYTES'
@@ -0,0 +1,22 @@
+# Hand-written (dev-environment convention: makemigrations is run by the user;
+# verify with `python manage.py makemigrations --check --dry-run`).
+# Stores the canonical state JSON next to state_hash so the dashboard can
+# compare it directly. Existing rows keep a NULL state_json and fall back to
+# the hash comparison until they are next dismissed.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0044_appconfiguration'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alertdismissal',
+            name='state_json',
+            field=models.TextField(blank=True, help_text='Canonical JSON of the hashed state; compared directly so unchanged state needs no re-hash', null=True),
+        ),
+    ]
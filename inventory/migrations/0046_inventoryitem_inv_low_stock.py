@@ -0,0 +1,21 @@
+# Hand-written (dev-environment convention: makemigrations is run by the user;
+# verify with `python manage.py makemigrations --check --dry-run`).
+# Partial index covering the dashboard's low-stock filter, so the alert pass
+# reads only the items at or below their threshold. Both Postgres and SQLite
+# support partial indexes.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0045_alertdismissal_state_json'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventoryitem',
+            index=models.Index(condition=models.Q(('is_consumable', True), ('quantity__lte', models.F('low_stock_threshold'))), fields=['id'], name='inv_low_stock'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Hand-written (dev-environment convention: makemigrations is run by the user;
+# verify with `python manage.py makemigrations --check --dry-run`).
+# CRC-32 and source size of the pre-deflated copy cached next to each mod
+# file. Existing rows stay NULL and are deflated per download until they are
+# next saved.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0046_inventoryitem_inv_low_stock'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='modfile',
+            name='deflate_crc32',
+            field=models.BigIntegerField(blank=True, help_text='CRC-32 of the file when a pre-deflated copy is cached next to it', null=True),
+        ),
+        migrations.AddField(
+            model_name='modfile',
+            name='deflate_source_size',
+            field=models.BigIntegerField(blank=True, help_text='Uncompressed size the cached deflated copy was built from', null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Hand-written (dev-environment convention: makemigrations is run by the user;
+# verify with `python manage.py makemigrations --check --dry-run`).
+# Stored generated column for the low-stock predicate, and the inv_low_stock
+# partial index rebuilt on it so both the dashboard alert and /api/low-stock/
+# filter on a plain boolean the index predicate matches exactly.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0047_modfile_deflate_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inventoryitem',
+            name='is_low_stock',
+            field=models.GeneratedField(db_persist=True, expression=models.ExpressionWrapper(models.Q(('is_consumable', True), ('low_stock_threshold__isnull', False), ('quantity__lte', models.F('low_stock_threshold'))), output_field=models.BooleanField()), output_field=models.BooleanField()),
+        ),
+        migrations.RemoveIndex(
+            model_name='inventoryitem',
+            name='inv_low_stock',
+        ),
+        migrations.AddIndex(
+            model_name='inventoryitem',
+            index=models.Index(condition=models.Q(('is_low_stock', True)), fields=['id'], name='inv_low_stock'),
+        ),
+    ]
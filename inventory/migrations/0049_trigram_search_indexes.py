@@ -0,0 +1,50 @@
+# Hand-written (dev-environment convention: makemigrations is run by the user;
+# verify with `python manage.py makemigrations --check --dry-run`).
+# Trigram GIN indexes for the inventory, printer and project searches. Django
+# compiles icontains on Postgres to UPPER("col"::text) LIKE UPPER(%s), so the
+# indexes are built on that exact expression and serve the existing
+# substring search unchanged. Postgres only; SQLite (dev) has no GIN/pg_trgm
+# and the operation is a no-op there, which is also why the indexes are not
+# declared on the models.
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ('inv_title_trgm', 'inventory_inventoryitem', 'title'),
+    ('inv_notes_trgm', 'inventory_inventoryitem', 'notes'),
+    ('printer_title_trgm', 'inventory_printer', 'title'),
+    ('printer_serial_trgm', 'inventory_printer', 'serial_number'),
+    ('printer_notes_trgm', 'inventory_printer', 'notes'),
+    ('project_name_trgm', 'inventory_project', 'project_name'),
+    ('project_description_trgm', 'inventory_project', 'description'),
+    ('project_notes_trgm', 'inventory_project', 'notes'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0048_inventoryitem_is_low_stock'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,20 @@
+# Hand-written (dev-environment convention: makemigrations is run by the user;
+# verify with `python manage.py makemigrations --check --dry-run`).
+# Composite index for the per-tracker download_status filters in
+# download_progress, download-files and the add-files completeness check.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0049_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='trackerfile',
+            index=models.Index(fields=['tracker', 'download_status'], name='trackerfile_dl_status'),
+        ),
+    ]
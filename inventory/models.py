@@ -1,9 +1,12 @@
 # printvault/inventory/models.py
 import os
+import time
 from datetime import timedelta
 from django.db import models
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 from django.core.validators import MinValueValidator
 
 def get_project_upload_path(instance, filename):
@@ -724,13 +727,32 @@ class Mod(models.Model):
 class ModFile(models.Model):
     mod = models.ForeignKey(Mod, related_name='files', on_delete=models.CASCADE)
     file = models.FileField(upload_to=get_mod_upload_path)
+
+    # --- Pre-deflated copy for the download-files ZIP (see services/mod_file_cache.py) ---
+    deflate_crc32 = models.BigIntegerField(
+        null=True, blank=True,
+        help_text="CRC-32 of the file when a pre-deflated copy is cached next to it"
+    )
+    deflate_source_size = models.BigIntegerField(
+        null=True, blank=True,
+        help_text="Uncompressed size the cached deflated copy was built from"
+    )
+
     def __str__(self):
         return os.path.basename(self.file.name)
 
 @receiver(post_delete, sender=ModFile)
 def submission_delete(sender, instance, **kwargs):
+    from inventory.services.mod_file_cache import delete_deflate_cache
+    delete_deflate_cache(instance)
     instance.file.delete(False)
 
+@receiver(post_save, sender=ModFile)
+def cache_deflated_mod_file(sender, instance, **kwargs):
+    """Deflate the file once on save so downloads can reuse the compressed bytes."""
+    from inventory.services.mod_file_cache import refresh_deflate_cache
+    refresh_deflate_cache(instance)
+
 class InventoryItem(models.Model):
     title = models.CharField(max_length=255, null=False)
     brand = models.ForeignKey(Brand, on_delete=models.SET_NULL, null=True, blank=True)
@@ -744,6 +766,17 @@ class InventoryItem(models.Model):
     # --- New Fields for Consumables ---
     is_consumable = models.BooleanField(default=False)
     low_stock_threshold = models.IntegerField(null=True, blank=True)
+    # Maintained by the database so low-stock lookups hit the partial index below
+    is_low_stock = models.GeneratedField(
+        expression=models.ExpressionWrapper(
+            models.Q(is_consumable=True)
+            & models.Q(low_stock_threshold__isnull=False)
+            & models.Q(quantity__lte=models.F('low_stock_threshold')),
+            output_field=models.BooleanField(),
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
     
     # --- Vendor and Model Fields ---
     vendor = models.ForeignKey(Vendor, on_delete=models.SET_NULL, null=True, blank=True)
@@ -760,6 +793,15 @@ class InventoryItem(models.Model):
         verbose_name = "Inventory Item"
         verbose_name_plural = "Inventory Items"
         ordering = ['title']
+        indexes = [
+            # Partial index over is_low_stock; only the handful of items at or
+            # below their threshold are indexed.
+            models.Index(
+                fields=['id'],
+                condition=models.Q(is_low_stock=True),
+                name='inv_low_stock',
+            ),
+        ]
     def __str__(self):
         return self.title
 
@@ -1080,12 +1122,11 @@ class Tracker(models.Model):
         """Recalculate and update cached statistics from files."""
         from django.db.models import Sum
         
-        # Calculate totals
-        quantity_result = self.files.aggregate(total=Sum('quantity'))
-        printed_result = self.files.aggregate(total=Sum('printed_quantity'))
+        # Calculate totals in one query
+        totals = self.files.aggregate(quantity=Sum('quantity'), printed=Sum('printed_quantity'))
         
-        self.total_quantity = quantity_result['total'] or 0
-        self.printed_quantity_total = printed_result['total'] or 0
+        self.total_quantity = totals['quantity'] or 0
+        self.printed_quantity_total = totals['printed'] or 0
         
         # Calculate percentage
         if self.total_quantity == 0:
@@ -1096,11 +1137,15 @@ class Tracker(models.Model):
     @property
     def total_count(self):
         """Total number of files in this tracker."""
+        if hasattr(self, 'file_count'):  # annotated by the tracker list queryset
+            return self.file_count
         return self.files.count()
     
     @property
     def completed_count(self):
         """Number of files marked as completed."""
+        if hasattr(self, 'completed_file_count'):  # annotated by the tracker list queryset
+            return self.completed_file_count
         return self.files.filter(status='completed').count()
     
     @property
@@ -1292,6 +1337,11 @@ class TrackerFile(models.Model):
         verbose_name_plural = "Tracker Files"
         ordering = ['directory_path', 'filename']
         unique_together = ('tracker', 'directory_path', 'filename')
+        indexes = [
+            # download_progress counts and the add-files completeness check
+            # filter a tracker's files by download_status.
+            models.Index(fields=['tracker', 'download_status'], name='trackerfile_dl_status'),
+        ]
     
     def __str__(self):
         if self.directory_path:
@@ -1659,6 +1709,11 @@ class AlertDismissal(models.Model):
         blank=True,
         help_text='SHA256 hash of the state that caused this alert (for invalidation detection)'
     )
+    state_json = models.TextField(
+        null=True,
+        blank=True,
+        help_text='Canonical JSON of the hashed state; compared directly so unchanged state needs no re-hash'
+    )
     
     class Meta:
         verbose_name = "Alert Dismissal"
@@ -1680,6 +1735,68 @@ def update_tracker_stats_on_delete(sender, instance, **kwargs):
     tracker.save(update_fields=['total_quantity', 'printed_quantity_total', 'progress_percentage', 'updated_date'])
 
 
+# ============================================================================
+# DASHBOARD CACHE INVALIDATION
+# ============================================================================
+
+DASHBOARD_CACHE_VERSION_KEY = 'dashboard:version'
+
+
+def get_dashboard_cache_version():
+    """Return the current dashboard cache version, seeding it on first use."""
+    # Seed with a timestamp rather than 0 so a version key evicted from the
+    # cache can never collide with responses cached under an older version.
+    return cache.get_or_set(DASHBOARD_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_dashboard_cache(**kwargs):
+    """Bump the dashboard cache version so the next request rebuilds it."""
+    try:
+        cache.incr(DASHBOARD_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(DASHBOARD_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+# Every model the dashboard reads from. Connected per sender (not globally) so
+# unrelated models keep Django's fast-delete path.
+for _dashboard_model in (Printer, Project, ProjectPrinters, InventoryItem, Tracker, TrackerFile, AlertDismissal):
+    post_save.connect(invalidate_dashboard_cache, sender=_dashboard_model, dispatch_uid=f'dashboard_save_{_dashboard_model.__name__}')
+    post_delete.connect(invalidate_dashboard_cache, sender=_dashboard_model, dispatch_uid=f'dashboard_delete_{_dashboard_model.__name__}')
+m2m_changed.connect(invalidate_dashboard_cache, sender=ProjectPrinters, dispatch_uid='dashboard_project_printers')
+
+
+# ============================================================================
+# TRACKER DETAIL CACHE INVALIDATION
+# ============================================================================
+
+TRACKER_DETAIL_CACHE_VERSION_KEY = 'tracker_detail:version'
+
+
+def get_tracker_detail_cache_version():
+    """Return the current tracker detail cache version, seeding it on first use."""
+    return cache.get_or_set(TRACKER_DETAIL_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_tracker_detail_cache(**kwargs):
+    """Bump the tracker detail cache version so every cached detail is rebuilt."""
+    try:
+        cache.incr(TRACKER_DETAIL_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(TRACKER_DETAIL_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+# Every model TrackerSerializer reads from, directly or through a nested
+# serializer (the filament and material badges pull in spools, materials and
+# their brand, vendor, features and photos).
+for _tracker_detail_model in (
+    Tracker, TrackerFile, TrackerFileImage, Project, FilamentSpool,
+    Material, Brand, Vendor, MaterialFeature, MaterialPhoto,
+):
+    post_save.connect(invalidate_tracker_detail_cache, sender=_tracker_detail_model, dispatch_uid=f'tracker_detail_save_{_tracker_detail_model.__name__}')
+    post_delete.connect(invalidate_tracker_detail_cache, sender=_tracker_detail_model, dispatch_uid=f'tracker_detail_delete_{_tracker_detail_model.__name__}')
+m2m_changed.connect(invalidate_tracker_detail_cache, sender=Material.features.through, dispatch_uid='tracker_detail_material_features')
+
+
 # Sidebar modules that a user is allowed to hide from navigation. Dashboard and
 # Settings are deliberately excluded — they are structurally always-visible
 # (Settings so a user can never lock themselves out of this very toggle;
@@ -6,7 +6,7 @@ from .models import (
     Brand, PartType, Location, Material, MaterialPhoto, MaterialFeature, Vendor, Printer, Mod, ModFile,
     InventoryItem, Project, ProjectLink, ProjectFile, ProjectInventory, ProjectPrinters,
     ProjectBOMItem, Tracker, TrackerFile, TrackerFileImage, FilamentSpool,
-    AppConfiguration, HIDEABLE_MODULE_KEYS
+    AppConfiguration, HIDEABLE_MODULE_KEYS, invalidate_tracker_detail_cache,
 )
 from .services.storage_manager import StorageManager, InsufficientStorageError, StoragePermissionError
 from .services.file_download_service import (
@@ -15,6 +15,7 @@ from .services.file_download_service import (
     FileTooLargeError, 
     DownloadTimeoutError
 )
+from .services.tracker_downloads import set_download_state, apply_download_results
 
 class BrandSerializer(serializers.ModelSerializer):
     class Meta:
@@ -495,7 +496,7 @@ class FilamentSpoolSerializer(serializers.ModelSerializer):
 class ModFileSerializer(serializers.ModelSerializer):
     class Meta:
         model = ModFile
-        fields = '__all__'
+        exclude = ['deflate_crc32', 'deflate_source_size']
 
 class ModSerializer(serializers.ModelSerializer):
     files = ModFileSerializer(many=True, read_only=True)
@@ -588,7 +589,7 @@ class InventoryItemSerializer(serializers.ModelSerializer):
 class PrinterSerializer(serializers.ModelSerializer):
     manufacturer = BrandSerializer(read_only=True)
     mods = ModSerializer(many=True, read_only=True)
-    associated_projects = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    associated_projects = serializers.SerializerMethodField()
     
     # Filament fields - nested serialization for read, FK handling for write
     primary_filament_blueprint = MaterialSerializer(read_only=True)
@@ -600,6 +601,10 @@ class PrinterSerializer(serializers.ModelSerializer):
         model = Printer
         fields = '__all__'
     
+    def get_associated_projects(self, obj):
+        """Project ids read from the link rows; the project rows themselves are never loaded."""
+        return [link.project_id for link in obj.projectprinters_set.all()]
+
     def get_additional_filaments_display(self, obj):
         """Enrich additional_filaments with full material blueprint data"""
         if not obj.additional_filaments:
@@ -735,6 +740,7 @@ class ProjectSerializer(serializers.ModelSerializer):
             # Update trackers to point to this project
             from .models import Tracker
             Tracker.objects.filter(id__in=tracker_ids).update(project=project)
+            invalidate_tracker_detail_cache()
         return project
 
     def update(self, instance, validated_data):
@@ -751,6 +757,7 @@ class ProjectSerializer(serializers.ModelSerializer):
             Tracker.objects.filter(project=instance).exclude(id__in=tracker_ids).update(project=None)
             # Associate selected trackers with this project
             Tracker.objects.filter(id__in=tracker_ids).update(project=instance)
+            invalidate_tracker_detail_cache()
         return instance
 
 class ProjectInventorySerializer(serializers.ModelSerializer):
@@ -1078,10 +1085,11 @@ class TrackerCreateSerializer(serializers.ModelSerializer):
             space_check = storage_manager.check_available_space(total_size)
             if not space_check['sufficient']:
                 # Mark all files as failed due to insufficient space
-                for tf in tracker_files:
-                    tf.download_status = 'failed'
-                    tf.download_error = f"Insufficient disk space. Need {storage_manager._format_bytes(total_size)}, only {space_check['available_formatted']} available."
-                    tf.save()
+                set_download_state(
+                    tracker_files,
+                    download_status='failed',
+                    download_error=f"Insufficient disk space. Need {storage_manager._format_bytes(total_size)}, only {space_check['available_formatted']} available."
+                )
                 
                 return {
                     'successful': [],
@@ -1097,10 +1105,7 @@ class TrackerCreateSerializer(serializers.ModelSerializer):
                 }
         except InsufficientStorageError as e:
             # Same handling as above but with exception
-            for tf in tracker_files:
-                tf.download_status = 'failed'
-                tf.download_error = str(e)
-                tf.save()
+            set_download_state(tracker_files, download_status='failed', download_error=str(e))
             
             return {
                 'successful': [],
@@ -1116,10 +1121,11 @@ class TrackerCreateSerializer(serializers.ModelSerializer):
             }
         except StoragePermissionError as e:
             # Permission error - can't create storage directories
-            for tf in tracker_files:
-                tf.download_status = 'failed'
-                tf.download_error = f"Storage permission error: {str(e)}"
-                tf.save()
+            set_download_state(
+                tracker_files,
+                download_status='failed',
+                download_error=f"Storage permission error: {str(e)}"
+            )
             
             return {
                 'successful': [],
@@ -1141,10 +1147,11 @@ class TrackerCreateSerializer(serializers.ModelSerializer):
             tracker.save()
         except Exception as e:
             # Failed to create storage path
-            for tf in tracker_files:
-                tf.download_status = 'failed'
-                tf.download_error = f"Failed to create storage path: {str(e)}"
-                tf.save()
+            set_download_state(
+                tracker_files,
+                download_status='failed',
+                download_error=f"Failed to create storage path: {str(e)}"
+            )
             
             return {
                 'successful': [],
@@ -1164,13 +1171,11 @@ class TrackerCreateSerializer(serializers.ModelSerializer):
         file_list = []
         file_path_mapping = {}  # Maps tracker_file_id to relative path from MEDIA_ROOT
         
+        category_paths, safe_categories = storage_manager.prepare_category_paths(tracker.id, tracker_files)
+        
         for tracker_file in tracker_files:
-            # Get category path (directory_path is used as category)
-            category_path = storage_manager.get_category_path(
-                tracker.id, 
-                tracker_file.directory_path or 'uncategorized',
-                create=True
-            )
+            category = tracker_file.directory_path or 'uncategorized'
+            category_path = category_paths[category]
             
             # Sanitize filename
             safe_filename = storage_manager.sanitize_filename(tracker_file.filename)
@@ -1179,8 +1184,7 @@ class TrackerCreateSerializer(serializers.ModelSerializer):
             # Build relative path for FileField (relative to MEDIA_ROOT)
             # destination is absolute, e.g., C:\...\media\trackers\8\files\test\file.stl
             # We need: trackers/8/files/test/file.stl
-            category = tracker_file.directory_path or 'uncategorized'
-            safe_category = storage_manager.sanitize_filename(category)
+            safe_category = safe_categories[category]
             relative_path = f"trackers/{tracker.id}/files/{safe_category}/{safe_filename}"
             file_path_mapping[tracker_file.id] = relative_path
             
@@ -1190,74 +1194,15 @@ class TrackerCreateSerializer(serializers.ModelSerializer):
                 'name': tracker_file.filename,
                 'tracker_file_id': tracker_file.id
             })
-            
-            # Mark as downloading
-            tracker_file.download_status = 'downloading'
-            tracker_file.save()
+        
+        # Mark as downloading
+        set_download_state(tracker_files, download_status='downloading')
         
         # Download files in batch
         results = download_service.download_files_batch(file_list)
+        storage_manager.forget_disk_usage()
         
-        # Process results and update tracker files
-        successful_downloads = []
-        failed_downloads = []
-        total_bytes_downloaded = 0
-        
-        for success_info in results['successful']:
-            # Find the tracker file
-            tracker_file = next(
-                (tf for tf in tracker_files if tf.id == success_info.get('tracker_file_id')),
-                None
-            )
-            
-            if tracker_file:
-                tracker_file.download_status = 'completed'
-                tracker_file.downloaded_at = timezone.now()
-                tracker_file.file_checksum = success_info.get('checksum', '')
-                tracker_file.actual_file_size = success_info.get('bytes_downloaded', 0)
-                tracker_file.download_error = ''
-                # Set the local_file path (relative to MEDIA_ROOT)
-                tracker_file.local_file = file_path_mapping.get(tracker_file.id, '')
-                tracker_file.storage_type = 'local'
-                tracker_file.save()
-                
-                total_bytes_downloaded += success_info.get('bytes_downloaded', 0)
-                successful_downloads.append({
-                    'file_id': tracker_file.id,
-                    'filename': tracker_file.filename,
-                    'bytes_downloaded': success_info.get('bytes_downloaded', 0),
-                    'duration': success_info.get('duration', 0)
-                })
-        
-        for fail_info in results['failed']:
-            # Find the tracker file
-            tracker_file = next(
-                (tf for tf in tracker_files if tf.id == fail_info.get('tracker_file_id')),
-                None
-            )
-            
-            if tracker_file:
-                tracker_file.download_status = 'failed'
-                tracker_file.download_error = fail_info.get('error', 'Unknown error')
-                tracker_file.save()
-                
-                failed_downloads.append({
-                    'file_id': tracker_file.id,
-                    'filename': tracker_file.filename,
-                    'error': fail_info.get('error', 'Unknown error')
-                })
-        
-        # Update tracker totals
-        tracker.total_storage_used = total_bytes_downloaded
-        tracker.files_downloaded = len(failed_downloads) == 0  # True if no failures
-        tracker.save()
-        
-        return {
-            'successful': successful_downloads,
-            'failed': failed_downloads,
-            'total_bytes': total_bytes_downloaded,
-            'duration': results.get('duration', 0)
-        }
+        return apply_download_results(tracker, tracker_files, results, file_path_mapping)
 
 
 class TrackerListSerializer(serializers.ModelSerializer):
@@ -16,12 +16,15 @@ Features:
 - Checksum verification (optional)
 """
 
+import errno
 import os
 import time
 import hashlib
 import socket
 import ipaddress
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, quote
 from django.conf import settings
 
@@ -54,6 +57,22 @@ class FileDownloadService:
         self.chunk_size = tracker_storage.get('CHUNK_SIZE', 8192)
         self.max_file_size = tracker_storage.get('MAX_FILE_SIZE', 5 * 1024 * 1024 * 1024)  # 5 GB
         self.verify_checksums = tracker_storage.get('VERIFY_CHECKSUMS', False)
+        self.download_workers = tracker_storage.get('DOWNLOAD_WORKERS', 8)
+        self._local = threading.local()
+    
+    def _session(self):
+        """
+        Per-thread requests.Session.
+        
+        Each download_files_batch worker keeps its connection open between
+        the files it fetches, so a batch from one host (usually
+        raw.githubusercontent.com) pays for DOWNLOAD_WORKERS TLS handshakes
+        rather than one per file.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
     
     def validate_url(self, url):
         """
@@ -165,7 +184,7 @@ class FileDownloadService:
             # Don't re-encode URLs - they should already be properly encoded
             # Just use the URL as-is to avoid double-encoding issues
             # Make request with streaming
-            response = requests.get(
+            response = self._session().get(
                 url,
                 stream=True,
                 timeout=timeout,
@@ -186,6 +205,7 @@ class FileDownloadService:
             checksum = hashlib.sha256() if self.verify_checksums else None
             
             with open(destination, 'wb') as f:
+                self._preallocate(f, total_size)
                 for chunk in response.iter_content(chunk_size=self.chunk_size):
                     if chunk:  # Filter out keep-alive chunks
                         f.write(chunk)
@@ -198,6 +218,8 @@ class FileDownloadService:
                         if progress_callback and total_size > 0:
                             percentage = (downloaded / total_size) * 100
                             progress_callback(downloaded, total_size, percentage)
+                # Drop any pre-allocated tail a short response did not fill
+                f.truncate()
             
             duration = time.time() - start_time
             
@@ -236,6 +258,23 @@ class FileDownloadService:
                 os.remove(destination)  # Cleanup partial file
             raise DownloadError(f"File write error: {str(e)}") from e
     
+    @staticmethod
+    def _preallocate(f, size):
+        """
+        Reserve size bytes for f before writing, so the file is laid out in one
+        piece and a full disk fails here rather than midway through the body.
+        
+        Only ENOSPC is raised; filesystems without fallocate support just
+        grow the file as it is written.
+        """
+        if size <= 0 or not hasattr(os, 'posix_fallocate'):
+            return
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                raise
+    
     def download_with_retry(self, url, destination, max_retries=None, progress_callback=None):
         """
         Download file with automatic retry on failure.
@@ -301,7 +340,11 @@ class FileDownloadService:
     
     def download_files_batch(self, file_list, progress_callback=None):
         """
-        Download multiple files.
+        Download multiple files, up to DOWNLOAD_WORKERS at a time.
+        
+        Downloads are network-bound, so they run on a thread pool; results
+        keep the order of file_list. progress_callback may be called from
+        the worker threads.
         
         Args:
             file_list (list): List of dicts with 'url', 'destination', 'name', 'tracker_file_id' (optional)
@@ -324,83 +367,99 @@ class FileDownloadService:
         
         start_time = time.time()
         
-        for index, file_info in enumerate(file_list):
-            url = file_info['url']
-            destination = file_info['destination']
-            name = file_info.get('name', os.path.basename(destination))
-            tracker_file_id = file_info.get('tracker_file_id')
-            
-            # Create per-file progress callback
-            def file_progress(downloaded, total, percentage):
-                if progress_callback:
-                    progress_callback(
-                        current_file=index + 1,
-                        total_files=len(file_list),
-                        file_name=name,
-                        file_downloaded=downloaded,
-                        file_total=total,
-                        file_percentage=percentage
-                    )
-            
-            try:
-                # Convert GitHub blob URLs to raw URLs if needed
-                download_url = url
-                if 'github.com' in url and 'raw.githubusercontent.com' not in url:
-                    # Convert: https://github.com/user/repo/blob/main/file.stl
-                    # To: https://raw.githubusercontent.com/user/repo/main/file.stl
-                    download_url = url.replace('github.com', 'raw.githubusercontent.com')
-                    download_url = download_url.replace('/blob/', '/')
-                
-                result = self.download_with_retry(
-                    download_url,
-                    destination,
-                    progress_callback=file_progress
-                )
-                
-                # Compute checksum of downloaded file
-                checksum = ''
-                try:
-                    if os.path.exists(destination):
-                        checksum = self.compute_checksum(destination)
-                except Exception:
-                    pass  # Checksum is optional
-                
-                success_result = {
-                    'name': name,
-                    'url': url,
-                    'destination': destination,
-                    'bytes_downloaded': result['bytes_downloaded'],
-                    'duration': result['duration'],
-                    'attempts': result.get('attempts', 1),
-                    'checksum': checksum
-                }
-                
-                # Include tracker_file_id if provided
-                if tracker_file_id is not None:
-                    success_result['tracker_file_id'] = tracker_file_id
-                
-                results['successful'].append(success_result)
-                results['total_bytes'] += result['bytes_downloaded']
-                
-            except Exception as e:
-                fail_result = {
-                    'name': name,
-                    'url': url,
-                    'destination': destination,
-                    'error': str(e),
-                    'error_type': type(e).__name__
-                }
-                
-                # Include tracker_file_id if provided
-                if tracker_file_id is not None:
-                    fail_result['tracker_file_id'] = tracker_file_id
-                
-                results['failed'].append(fail_result)
+        workers = max(1, min(self.download_workers, len(file_list)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = pool.map(
+                lambda indexed: self._download_batch_entry(*indexed, len(file_list), progress_callback),
+                enumerate(file_list)
+            )
+            for outcome, entry in outcomes:
+                results[outcome].append(entry)
+                if outcome == 'successful':
+                    results['total_bytes'] += entry['bytes_downloaded']
         
         results['duration'] = time.time() - start_time
         
         return results
     
+    def _download_batch_entry(self, index, file_info, total_files, progress_callback):
+        """
+        Download one download_files_batch entry.
+        
+        Returns ('successful', result) or ('failed', error info); errors are
+        reported, never raised, so one bad file doesn't stop the batch.
+        """
+        url = file_info['url']
+        destination = file_info['destination']
+        name = file_info.get('name', os.path.basename(destination))
+        tracker_file_id = file_info.get('tracker_file_id')
+        
+        # Create per-file progress callback
+        def file_progress(downloaded, total, percentage):
+            if progress_callback:
+                progress_callback(
+                    current_file=index + 1,
+                    total_files=total_files,
+                    file_name=name,
+                    file_downloaded=downloaded,
+                    file_total=total,
+                    file_percentage=percentage
+                )
+        
+        try:
+            # Convert GitHub blob URLs to raw URLs if needed
+            download_url = url
+            if 'github.com' in url and 'raw.githubusercontent.com' not in url:
+                # Convert: https://github.com/user/repo/blob/main/file.stl
+                # To: https://raw.githubusercontent.com/user/repo/main/file.stl
+                download_url = url.replace('github.com', 'raw.githubusercontent.com')
+                download_url = download_url.replace('/blob/', '/')
+            
+            result = self.download_with_retry(
+                download_url,
+                destination,
+                progress_callback=file_progress
+            )
+            
+            # Compute checksum of downloaded file
+            checksum = ''
+            try:
+                if os.path.exists(destination):
+                    checksum = self.compute_checksum(destination)
+            except Exception:
+                pass  # Checksum is optional
+            
+            success_result = {
+                'name': name,
+                'url': url,
+                'destination': destination,
+                'bytes_downloaded': result['bytes_downloaded'],
+                'duration': result['duration'],
+                'attempts': result.get('attempts', 1),
+                'checksum': checksum
+            }
+            
+            # Include tracker_file_id if provided
+            if tracker_file_id is not None:
+                success_result['tracker_file_id'] = tracker_file_id
+            
+            return 'successful', success_result
+            
+        except Exception as e:
+            fail_result = {
+                'name': name,
+                'url': url,
+                'destination': destination,
+                'error': str(e),
+                'error_type': type(e).__name__
+            }
+            
+            # Include tracker_file_id if provided
+            if tracker_file_id is not None:
+                fail_result['tracker_file_id'] = tracker_file_id
+            
+            return 'failed', fail_result
+    
     def verify_file(self, file_path, expected_size=None, expected_checksum=None):
         """
         Verify downloaded file integrity.
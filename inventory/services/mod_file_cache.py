@@ -0,0 +1,109 @@
+"""
+Pre-deflated copies of mod files for the download-files ZIP.
+
+ModViewSet.download_files used to deflate and CRC every file on every
+request. Small, compressible mod files are now deflated once when they are
+saved: the raw DEFLATE stream goes into a sibling "<file>.deflate" and the
+CRC-32 and uncompressed size are stored on the ModFile row, so a download
+can splice the entry into the archive without compressing anything.
+
+Entry points:
+    refresh_deflate_cache(mod_file)
+        (Re)build the cache after the file is saved; used by the ModFile
+        post_save signal.
+
+    read_deflate_cache(mod_file, file_stat) -> (crc, data) | None
+        Cached entry for the download path, or None when the cache is
+        missing or older than the file on disk.
+
+    delete_deflate_cache(mod_file)
+        Remove the sibling file; used by the ModFile post_delete signal.
+"""
+
+import logging
+import os
+import zlib
+
+logger = logging.getLogger(__name__)
+
+DEFLATE_SUFFIX = '.deflate'
+# Files up to this size are read and deflated in one call (and cached);
+# larger ones are streamed in chunks to keep memory bounded.
+ZIP_WHOLE_FILE_LIMIT = 2 * 1024 * 1024
+ZIP_SMALL_FILE_LEVEL = 6
+# Formats that are compressed already; deflating them again costs CPU for no gain.
+ALREADY_COMPRESSED_EXTENSIONS = frozenset({'.3mf', '.zip', '.gz', '.xz', '.7z'})
+
+
+def is_compressed_file(file_path):
+    return os.path.splitext(file_path)[1].lower() in ALREADY_COMPRESSED_EXTENSIONS
+
+
+def deflate_file(file_path, level):
+    """Read and raw-deflate a whole file as ZipFile would; returns (crc, size, data)."""
+    with open(file_path, 'rb') as src:
+        data = src.read()
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return zlib.crc32(data), len(data), compressor.compress(data) + compressor.flush()
+
+
+def _cache_path(mod_file):
+    return mod_file.file.path + DEFLATE_SUFFIX
+
+
+def delete_deflate_cache(mod_file):
+    if not mod_file.file:
+        return
+    try:
+        os.remove(_cache_path(mod_file))
+    except FileNotFoundError:
+        pass
+
+
+def refresh_deflate_cache(mod_file):
+    """
+    Deflate mod_file into its sibling cache file and record CRC and size.
+
+    Files that are already compressed or too large for a whole-file deflate
+    get no cache; any stale one is removed. Fields are written with
+    .update() so the post_save signal calling this does not fire again.
+    """
+    from inventory.models import ModFile
+
+    crc = size = None
+    if mod_file.file:
+        file_path = mod_file.file.path
+        cache_path = _cache_path(mod_file)
+        try:
+            if is_compressed_file(file_path) or os.path.getsize(file_path) > ZIP_WHOLE_FILE_LIMIT:
+                delete_deflate_cache(mod_file)
+            else:
+                crc, size, compressed = deflate_file(file_path, ZIP_SMALL_FILE_LEVEL)
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, 'wb') as dst:
+                    dst.write(compressed)
+                os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache deflated copy of {file_path}: {e}")
+            crc = size = None
+
+    ModFile.objects.filter(pk=mod_file.pk).update(deflate_crc32=crc, deflate_source_size=size)
+    mod_file.deflate_crc32, mod_file.deflate_source_size = crc, size
+
+
+def read_deflate_cache(mod_file, file_stat):
+    """
+    Return (crc, compressed) for mod_file, or None if there is no current cache.
+
+    file_stat is the caller's os.stat of the mod file itself.
+    """
+    if mod_file.deflate_crc32 is None or mod_file.deflate_source_size != file_stat.st_size:
+        return None
+    cache_path = _cache_path(mod_file)
+    try:
+        if os.path.getmtime(cache_path) < file_stat.st_mtime:
+            return None
+        with open(cache_path, 'rb') as src:
+            return mod_file.deflate_crc32, src.read()
+    except OSError:
+        return None
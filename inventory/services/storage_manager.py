@@ -11,10 +11,31 @@ Handles file storage operations including:
 import os
 import shutil
 import errno
+import hashlib
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from django.conf import settings
 
 
+# shutil.disk_usage() can take tens of milliseconds on network storage, so a
+# burst of tracker downloads shares one reading for this many seconds.
+DISK_USAGE_TTL = 1.0
+
+_disk_usage_cache = {}  # path -> (expires_at, usage)
+
+# Characters not allowed in file and directory names, mapped to '_'
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Unlinks are issued from this many threads when a tracker's files are
+# removed, so the filesystem sees many deletes in flight instead of one.
+CLEANUP_WORKERS = 8
+
+
 class InsufficientStorageError(Exception):
     """Raised when there is not enough disk space available."""
     pass
@@ -61,12 +82,8 @@ class StorageManager:
         Raises:
             InsufficientStorageError: If not enough space available
         """
-        # Ensure base path exists
-        if not os.path.exists(self.base_path):
-            os.makedirs(self.base_path, exist_ok=True)
-        
         # Get disk usage statistics
-        stat = shutil.disk_usage(self.base_path)
+        stat = self._disk_usage()
         available = stat.free
         
         # Add buffer (10% extra space required)
@@ -98,6 +115,25 @@ class StorageManager:
             )
         return result
     
+    def _disk_usage(self):
+        """shutil.disk_usage() of base_path, reused for DISK_USAGE_TTL seconds."""
+        now = time.monotonic()
+        cached = _disk_usage_cache.get(self.base_path)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        # Ensure base path exists
+        if not os.path.exists(self.base_path):
+            os.makedirs(self.base_path, exist_ok=True)
+        
+        usage = shutil.disk_usage(self.base_path)
+        _disk_usage_cache[self.base_path] = (now + DISK_USAGE_TTL, usage)
+        return usage
+    
+    def forget_disk_usage(self):
+        """Drop the cached disk usage once files have been written, so the next check sees them."""
+        _disk_usage_cache.pop(self.base_path, None)
+    
     def get_tracker_storage_path(self, tracker_id, create=True):
         """
         Get the storage path for a tracker.
@@ -160,6 +196,30 @@ class StorageManager:
         
         return category_path
     
+    def prepare_category_paths(self, tracker_id, tracker_files):
+        """
+        Create the category directories a batch of tracker files is downloaded into.
+        
+        Each category is created and sanitized once, however many files it
+        holds; files without one go to 'uncategorized'.
+        
+        Args:
+            tracker_id (int): Tracker ID
+            tracker_files (iterable): TrackerFile instances about to be downloaded
+            
+        Returns:
+            tuple: (category_paths, safe_categories), both keyed by category:
+                the absolute directory, and the sanitized name used in the
+                file's path relative to MEDIA_ROOT
+        """
+        categories = {tf.directory_path or 'uncategorized' for tf in tracker_files}
+        category_paths = {
+            category: self.get_category_path(tracker_id, category, create=True)
+            for category in categories
+        }
+        safe_categories = {category: self.sanitize_filename(category) for category in categories}
+        return category_paths, safe_categories
+    
     def cleanup_tracker_files(self, tracker_id):
         """
         Delete all files for a tracker.
@@ -186,23 +246,32 @@ class StorageManager:
             }
         
         try:
-            # Calculate size before deletion
+            # Collect files and their sizes in one pass; scandir entries carry
+            # the stat, and directories are listed parents before children
             total_size = 0
-            file_count = 0
+            file_paths = []
+            directories = [tracker_path]
+            for directory in directories:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(entry.path)
+                        else:
+                            file_paths.append(entry.path)
+                            total_size += entry.stat(follow_symlinks=False).st_size
             
-            for root, dirs, files in os.walk(tracker_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    total_size += os.path.getsize(file_path)
-                    file_count += 1
-            
-            # Delete the entire tracker directory
-            shutil.rmtree(tracker_path)
+            # Delete the files concurrently, then the emptied directories
+            # deepest first
+            with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as pool:
+                for _ in pool.map(os.unlink, file_paths):
+                    pass
+            for directory in reversed(directories):
+                os.rmdir(directory)
             
             return {
                 'success': True,
                 'deleted_bytes': total_size,
-                'deleted_files': file_count
+                'deleted_files': len(file_paths)
             }
             
         except Exception as e:
@@ -312,7 +381,7 @@ class StorageManager:
             relative_path (str): Relative path from MEDIA_ROOT (e.g., 'trackers/1/files/bracket.stl')
             
         Returns:
-            str: Relative path where file was saved
+            tuple: (relative path where file was saved, SHA256 hex digest)
             
         Raises:
             InsufficientStorageError: If not enough disk space
@@ -329,16 +398,31 @@ class StorageManager:
         if not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
         
-        # Check write permissions
-        self.check_write_permissions(directory)
+        # Creating the temporary file doubles as the write permission check
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.part')
+        except PermissionError as e:
+            raise StoragePermissionError(
+                f"No write permission for {directory}. "
+                f"Check directory ownership and permissions."
+            ) from e
         
-        # Save file in chunks
-        with open(full_path, 'wb+') as destination:
-            for chunk in uploaded_file.chunks():
-                destination.write(chunk)
+        # Copy in chunks, hashing as we go, and rename into place once
+        # complete so a replaced file is never seen half-written
+        checksum = hashlib.sha256()
+        try:
+            with os.fdopen(fd, 'wb') as destination:
+                for chunk in uploaded_file.chunks(UPLOAD_CHUNK_SIZE):
+                    destination.write(chunk)
+                    checksum.update(chunk)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, full_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         
         # Return relative path for database storage
-        return relative_path
+        return relative_path, checksum.hexdigest()
     
     @staticmethod
     def sanitize_filename(filename, max_length=255):
@@ -352,10 +436,8 @@ class StorageManager:
         Returns:
             str: Sanitized filename
         """
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        # Replace invalid characters in one pass
+        filename = filename.translate(_INVALID_FILENAME_CHARS)
         
         # Remove leading/trailing spaces and dots
         filename = filename.strip('. ')
@@ -0,0 +1,162 @@
+"""
+Download bookkeeping for tracker files.
+
+The tracker create serializer and TrackerViewSet's download actions hand a
+batch of TrackerFiles to FileDownloadService; these helpers record what
+came back and queue the work that follows a download.
+
+Entry points:
+    set_download_state(tracker_files, **fields)
+        Give every file the same download fields, e.g. all 'downloading'.
+
+    bulk_update_download_state(tracker_files, fields)
+        Write per-file download fields already set on the instances.
+
+    apply_download_results(tracker, tracker_files, results, file_path_mapping) -> dict
+        Record a download_files_batch result and return the summary the
+        download endpoints report.
+
+    queue_tracker_zip_build(tracker)
+        Queue the tracker's download-files ZIP once all its files are local.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+
+def bulk_update_download_state(tracker_files, fields):
+    """
+    Write per-file download bookkeeping for many tracker files in one UPDATE.
+
+    Stands in for a save() per file. None of these fields feed the
+    tracker's cached stats or the thumbnail color checks; the one post_save
+    effect that matters, queueing an auto-thumbnail once a file is local,
+    is left to the caller. bulk_update doesn't apply auto_now, so
+    updated_date is set here.
+    """
+    from inventory.models import TrackerFile, invalidate_tracker_detail_cache
+
+    now = timezone.now()
+    for tracker_file in tracker_files:
+        tracker_file.updated_date = now
+    TrackerFile.objects.bulk_update(tracker_files, [*fields, 'updated_date'])
+    # bulk_update sends no post_save, so drop cached tracker details here
+    invalidate_tracker_detail_cache()
+
+
+def set_download_state(tracker_files, **fields):
+    """
+    Give every file the same download fields in one UPDATE.
+
+    For the uniform transitions (all 'downloading', or all failed with one
+    error); per-file results go through bulk_update_download_state. The
+    instances are updated too, for callers that report them.
+    """
+    from inventory.models import TrackerFile, invalidate_tracker_detail_cache
+
+    fields['updated_date'] = timezone.now()
+    for tracker_file in tracker_files:
+        for name, value in fields.items():
+            setattr(tracker_file, name, value)
+    TrackerFile.objects.filter(id__in=[tf.id for tf in tracker_files]).update(**fields)
+    # .update() sends no post_save either
+    invalidate_tracker_detail_cache()
+
+
+def apply_download_results(tracker, tracker_files, results, file_path_mapping):
+    """
+    Record a FileDownloadService.download_files_batch result.
+
+    Downloaded files become local at their ``file_path_mapping`` path, failed
+    ones keep their error, and the tracker's storage total and
+    files_downloaded flag are brought up to date, all in one transaction so
+    download_progress never sees the files half-written. Returns the
+    summary the download endpoints report.
+    """
+    from inventory.models import TrackerFile, queue_auto_thumbnail_generation
+
+    successful_downloads = []
+    failed_downloads = []
+    total_bytes_downloaded = 0
+    tracker_files_by_id = {tf.id: tf for tf in tracker_files}
+    failed_by_error = defaultdict(list)
+
+    for success_info in results['successful']:
+        tracker_file = tracker_files_by_id.get(success_info.get('tracker_file_id'))
+
+        if tracker_file:
+            tracker_file.download_status = 'completed'
+            tracker_file.downloaded_at = timezone.now()
+            tracker_file.file_checksum = success_info.get('checksum', '')
+            tracker_file.actual_file_size = success_info.get('bytes_downloaded', 0)
+            tracker_file.download_error = ''
+            # Set the local_file path (relative to MEDIA_ROOT)
+            tracker_file.local_file = file_path_mapping.get(tracker_file.id, '')
+            tracker_file.storage_type = 'local'
+
+            total_bytes_downloaded += success_info.get('bytes_downloaded', 0)
+            successful_downloads.append({
+                'file_id': tracker_file.id,
+                'filename': tracker_file.filename,
+                'bytes_downloaded': success_info.get('bytes_downloaded', 0),
+                'duration': success_info.get('duration', 0)
+            })
+
+    for fail_info in results['failed']:
+        tracker_file = tracker_files_by_id.get(fail_info.get('tracker_file_id'))
+
+        if tracker_file:
+            failed_by_error[fail_info.get('error', 'Unknown error')].append(tracker_file)
+
+            failed_downloads.append({
+                'file_id': tracker_file.id,
+                'filename': tracker_file.filename,
+                'error': fail_info.get('error', 'Unknown error')
+            })
+
+    with transaction.atomic():
+        bulk_update_download_state([tracker_files_by_id[s['file_id']] for s in successful_downloads], [
+            'download_status', 'downloaded_at', 'file_checksum', 'actual_file_size',
+            'download_error', 'local_file', 'storage_type'
+        ])
+        for error, failed_files in failed_by_error.items():
+            set_download_state(failed_files, download_status='failed', download_error=error)
+
+        tracker.total_storage_used = (tracker.total_storage_used or 0) + total_bytes_downloaded
+        # True only if this batch succeeded and, for a local tracker, ALL of
+        # its files (old + new) are downloaded
+        tracker.files_downloaded = not failed_downloads and (tracker.storage_type != 'local' or not (
+            TrackerFile.objects.filter(tracker=tracker).exclude(download_status='completed').exists()
+        ))
+        tracker.save()
+
+    # bulk_update sends no post_save; files that just became local are
+    # now eligible for an auto-thumbnail. Queued after the commit so the
+    # task sees the local file.
+    for success_info in successful_downloads:
+        queue_auto_thumbnail_generation(TrackerFile, tracker_files_by_id[success_info['file_id']])
+    queue_tracker_zip_build(tracker)
+
+    return {
+        'successful': successful_downloads,
+        'failed': failed_downloads,
+        'total_bytes': total_bytes_downloaded,
+        'duration': results.get('duration', 0)
+    }
+
+
+def queue_tracker_zip_build(tracker):
+    """
+    Queue building a tracker's download-files ZIP once all its files are local.
+
+    Called by the download paths after they save the tracker, so the archive
+    is assembled on a Django-Q worker rather than in the request that asks
+    for it.
+    """
+    if tracker.storage_type != 'local' or not tracker.files_downloaded:
+        return
+
+    from django_q.tasks import async_task
+    async_task('inventory.tasks.build_tracker_zip_task', tracker.id)
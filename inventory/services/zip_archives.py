@@ -0,0 +1,537 @@
+"""
+Download-files ZIP archives for mods and trackers.
+
+Archives are written by ZipFile into an unseekable sink and handed on
+chunk by chunk, so none is held in memory as a whole. Small compressible
+files are deflated on a few threads ahead of the entry being written;
+already-compressed formats are stored.
+
+Entry points:
+    stream_zip(stated_files, zip_entries=_zip_entries)
+        Yield a ZIP of (file, stat) pairs; used by the mod download and,
+        through stream_downloaded_files_zip, the tracker one.
+
+    stream_tracker_zip(files, download_service, store_all=False)
+        Yield a ZIP of a tracker's files, fetching remote ones as it goes;
+        used by the download-zip action.
+
+    cache_zip(chunks, cache_path, max_bytes)
+        Pass an archive through while writing it to the ZIP cache, then drop
+        the mod's or tracker's older archives and trim the cache.
+
+    remove_cached_zips(cache_dir, owner_id) / prune_zip_cache(cache_dir, max_bytes)
+        Delete one owner's archives / the least recently used ones.
+
+    build_tracker_zip(tracker) -> str | None
+        Write a tracker's download-files ZIP to TRACKER_ZIP_CACHE_DIR; used
+        by build_tracker_zip_task in inventory/tasks.py.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from .file_download_service import DownloadError, DownloadTimeoutError, FileTooLargeError
+from .mod_file_cache import (
+    ZIP_SMALL_FILE_LEVEL,
+    ZIP_WHOLE_FILE_LIMIT,
+    deflate_file,
+    is_compressed_file,
+    read_deflate_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+# Read size for files streamed into the archive; 1 MiB keeps syscalls per
+# file low while still yielding to the client regularly.
+ZIP_STREAM_CHUNK_SIZE = 1024 * 1024
+# Deflate level for files streamed in chunks; big G-code/STL exports compress
+# nearly as well at level 1 for a fraction of the CPU.
+ZIP_LARGE_FILE_LEVEL = 1
+# Small files are deflated on this many threads (zlib releases the GIL) and
+# at most this many are read ahead of the entry being written.
+ZIP_COMPRESS_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _zip_compression(file_path, file_size):
+    """Return (compress_type, compresslevel) for one archive entry."""
+    if is_compressed_file(file_path):
+        return zipfile.ZIP_STORED, None
+    if file_size > ZIP_WHOLE_FILE_LIMIT:
+        return zipfile.ZIP_DEFLATED, ZIP_LARGE_FILE_LEVEL
+    return zipfile.ZIP_DEFLATED, ZIP_SMALL_FILE_LEVEL
+
+
+def stat_mod_files(mod_files):
+    """Pair each mod file with its os.stat result, or None when it is missing on disk."""
+    stated = []
+    for mod_file in mod_files:
+        try:
+            stat = os.stat(mod_file.file.path)
+        except FileNotFoundError:
+            logger.warning(f"Mod file {mod_file.pk} is missing on disk: {mod_file.file.path}")
+            stat = None
+        stated.append((mod_file, stat))
+    return stated
+
+
+def _zip_info(file_path, stat, arcname=None):
+    """ZipInfo.from_file, built from a stat result already in hand."""
+    info = zipfile.ZipInfo(arcname or os.path.basename(file_path), time.localtime(stat.st_mtime)[:6])
+    info.external_attr = (stat.st_mode & 0xFFFF) << 16
+    info.file_size = stat.st_size
+    return info
+
+
+def _open_sequential(file_path):
+    """Open unbuffered for one front-to-back read, hinting read-ahead to the kernel."""
+    src = open(file_path, 'rb', buffering=0)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return src
+
+
+def _write_deflated_entry(zf, info, crc, file_size, compressed):
+    """
+    Append an entry whose data was deflated up front.
+
+    ZipFile has no API for pre-compressed data, so this writes the local
+    header and payload itself and registers the entry for the central
+    directory the same way ZipFile.writestr does.
+    """
+    info.CRC = crc
+    info.file_size = file_size
+    info.compress_size = len(compressed)
+    info.header_offset = zf.fp.tell()
+    zf.fp.write(info.FileHeader())
+    zf.fp.write(compressed)
+    zf.filelist.append(info)
+    zf.NameToInfo[info.filename] = info
+    zf.start_dir = zf.fp.tell()
+    zf._didModify = True
+
+
+class _ZipStreamSink:
+    """Write-only target for ZipFile that hands written bytes to a generator."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _zip_entries(stated_files, pool):
+    """
+    Yield (file_path, info, deflated) per (mod_file, stat) pair on disk.
+
+    deflated is a future of (crc, size, data) for small compressible files:
+    already resolved from the mod file's deflate cache when it is current,
+    otherwise submitted to pool. It is None for entries ZipFile writes itself.
+    """
+    for mod_file, stat in stated_files:
+        if stat is None:
+            continue
+        file_path = mod_file.file.path
+        info = _zip_info(file_path, stat)
+        # ZipInfo has no public compress level until Python 3.13.
+        info.compress_type, info._compresslevel = _zip_compression(file_path, info.file_size)
+        deflated = None
+        if info.compress_type == zipfile.ZIP_DEFLATED and info.file_size <= ZIP_WHOLE_FILE_LIMIT:
+            cached = read_deflate_cache(mod_file, stat)
+            if cached is not None:
+                deflated = Future()
+                deflated.set_result((cached[0], info.file_size, cached[1]))
+            else:
+                deflated = pool.submit(deflate_file, file_path, info._compresslevel)
+        yield file_path, info, deflated
+
+
+def _tracker_zip_entries(stated_files, pool):
+    """
+    Yield (file_path, info, deflated) per (tracker_file, stat) pair, like _zip_entries.
+
+    Entries are named directory_path/filename. Tracker files have no
+    deflate cache, so every small compressible file is deflated on pool.
+    """
+    for tracker_file, stat in stated_files:
+        file_path = tracker_file.local_file.path
+        if tracker_file.directory_path:
+            arcname = f"{tracker_file.directory_path}/{tracker_file.filename}"
+        else:
+            arcname = tracker_file.filename
+        info = _zip_info(file_path, stat, arcname)
+        info.compress_type, info._compresslevel = _zip_compression(file_path, info.file_size)
+        deflated = None
+        if info.compress_type == zipfile.ZIP_DEFLATED and info.file_size <= ZIP_WHOLE_FILE_LIMIT:
+            deflated = pool.submit(deflate_file, file_path, info._compresslevel)
+        yield file_path, info, deflated
+
+
+def stream_zip(stated_files, zip_entries=_zip_entries):
+    """
+    Yield a ZIP archive of (file, stat) pairs chunk by chunk while it is compressed.
+
+    The archive is never held in memory as a whole; ZipFile writes to an
+    unseekable sink, so sizes and CRCs go into data descriptors after each
+    entry. Each entry gets its own compression settings from
+    _zip_compression. Small files reuse their cached deflated copy or are
+    deflated in parallel a few entries ahead of the one being written. Entry
+    headers come from the stat taken for the ETag, so no file is stat'ed twice.
+    zip_entries turns the pairs into entries; the default handles mod files.
+    """
+    sink = _ZipStreamSink()
+
+    def write_entry(zf, file_path, info, deflated):
+        if deflated is not None:
+            _write_deflated_entry(zf, info, *deflated.result())
+        elif info.file_size <= ZIP_WHOLE_FILE_LIMIT:
+            with open(file_path, 'rb') as src:
+                zf.writestr(info, src.read())
+        else:
+            with _open_sequential(file_path) as src, zf.open(info, 'w') as dst:
+                while chunk := src.read(ZIP_STREAM_CHUNK_SIZE):
+                    dst.write(chunk)
+                    if data := sink.drain():
+                        yield data
+        if data := sink.drain():
+            yield data
+
+    with ThreadPoolExecutor(max_workers=ZIP_COMPRESS_WORKERS) as pool, \
+            zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zf:
+        pending = deque()
+        for entry in zip_entries(stated_files, pool):
+            pending.append(entry)
+            if len(pending) > ZIP_COMPRESS_WORKERS:
+                yield from write_entry(zf, *pending.popleft())
+        while pending:
+            yield from write_entry(zf, *pending.popleft())
+    yield sink.drain()
+
+
+def _cache_stream(chunks, cache_path):
+    """
+    Pass chunks through while writing them to cache_path.
+
+    The archive goes to a temporary file beside cache_path and is renamed
+    into place only once the stream completes, so an aborted download never
+    leaves a truncated ZIP in the cache.
+    """
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.part')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            for chunk in chunks:
+                tmp.write(chunk)
+                yield chunk
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def remove_cached_zips(cache_dir, owner_id, keep=None):
+    """
+    Delete the cached archives of one mod or tracker, except keep.
+
+    Cache files are named <owner id>-<digest>.zip, so the owner's archives
+    are every file with that prefix.
+    """
+    prefix = f"{owner_id}-"
+    try:
+        entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.name.startswith(prefix) and entry.name.endswith('.zip') and entry.path != keep:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def prune_zip_cache(cache_dir, max_bytes, keep=None):
+    """
+    Delete the least recently used archives until cache_dir fits max_bytes.
+
+    Used by the prune_*_zip_cache commands and after every archive written
+    to the cache. Archives still being written (*.part) are left alone, and
+    so is keep. Returns (removed, remaining_bytes).
+    """
+    try:
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith('.zip') and entry.is_file()]
+    except FileNotFoundError:
+        entries = []
+
+    stats = []
+    for entry in entries:
+        try:
+            stats.append((entry.path, entry.stat()))
+        except FileNotFoundError:
+            pass  # Removed by a concurrent prune
+    # Oldest access first; serving a cached ZIP reads it and bumps atime
+    # (on mounts with noatime, mtime is the creation time and still works).
+    stats.sort(key=lambda item: max(item[1].st_atime, item[1].st_mtime))
+    total = sum(stat.st_size for _, stat in stats)
+    removed = 0
+    for path, stat in stats:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= stat.st_size
+        removed += 1
+    return removed, total
+
+
+def cache_zip(chunks, cache_path, max_bytes):
+    """
+    _cache_stream, then remove the owner's stale archives and trim the cache.
+
+    Once the new <owner id>-<digest>.zip is in place every other archive of
+    that mod or tracker is stale. The cache directory is then pruned to
+    max_bytes, so the size cap holds without a scheduled prune.
+    """
+    yield from _cache_stream(chunks, cache_path)
+    cache_dir, name = os.path.split(cache_path)
+    remove_cached_zips(cache_dir, name.split('-', 1)[0], keep=cache_path)
+    prune_zip_cache(cache_dir, max_bytes, keep=cache_path)
+
+
+def _local_files_present(files):
+    """
+    Ids of the tracker files whose local copy exists on disk.
+
+    Lists each storage directory once instead of stat-ing every file, which
+    matters when a tracker has hundreds of files on network storage.
+    """
+    listings = {}
+    present = set()
+    for file in files:
+        if not file.local_file:
+            continue
+        directory, name = os.path.split(file.local_file.name)
+        if directory not in listings:
+            try:
+                with os.scandir(file.local_file.storage.path(directory)) as entries:
+                    listings[directory] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                listings[directory] = frozenset()
+        if name in listings[directory]:
+            present.add(file.id)
+    return present
+
+
+@contextmanager
+def _prefetched_remote_files(download_service, files):
+    """
+    Download the given tracker files from their URLs into temp files, ahead of use.
+
+    Yields take(file) -> (temp_path, future), or None for a file not among
+    them. Downloads run DOWNLOAD_WORKERS at a time, and only
+    twice that many are started ahead of the file last taken, so a large
+    tracker never has all of its remote files sitting on temp disk at once.
+    Leftover temp files are removed on exit.
+    """
+    remote = iter(files)
+    prefetched = {}
+    temp_paths = []
+    pool = ThreadPoolExecutor(max_workers=download_service.download_workers)
+
+    def start_next():
+        file = next(remote, None)
+        if file is None:
+            return
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.stl') as temp_file:
+            temp_paths.append(temp_file.name)
+        future = pool.submit(download_service.download_with_retry, file.github_url, temp_file.name, max_retries=2)
+        prefetched[file.id] = (temp_file.name, future)
+
+    def take(file):
+        entry = prefetched.pop(file.id, None)
+        if entry is not None:
+            start_next()
+        return entry
+
+    try:
+        for _ in range(2 * download_service.download_workers):
+            start_next()
+        yield take
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        for temp_path in temp_paths:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass  # Already cleaned up after zipping
+
+
+def _zip_write_streamed(zip_file, sink, file_path, arcname, compress_type):
+    """zip_file.write(file_path, arcname), yielding the sink's bytes as each chunk is written."""
+    info = zipfile.ZipInfo.from_file(file_path, arcname)
+    info.compress_type = compress_type
+    with _open_sequential(file_path) as src, zip_file.open(info, 'w') as dst:
+        while chunk := src.read(ZIP_STREAM_CHUNK_SIZE):
+            dst.write(chunk)
+            if data := sink.drain():
+                yield data
+
+
+def stream_tracker_zip(files, download_service, store_all=False):
+    """
+    Yield a ZIP archive of a tracker's files chunk by chunk as it is written.
+
+    Local copies are read from storage; files with only a URL are downloaded
+    ahead of the entry being written. A file that can't be fetched gets a
+    "<name>.error.txt" entry instead of failing the archive. Already-
+    compressed formats, or every entry when store_all is set, are stored
+    rather than deflated.
+    """
+    sink = _ZipStreamSink()
+    local_ids = _local_files_present(files)
+    remote_files = [file for file in files if file.github_url and file.id not in local_ids]
+    with _prefetched_remote_files(download_service, remote_files) as take_remote, \
+            zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # Track files added to avoid duplicates
+        added_files = set()
+        
+        for file in files:
+            # Generate a unique filename with category prefix (using directory_path)
+            category_prefix = file.directory_path.replace('/', '_').replace('\\', '_') if file.directory_path else 'Uncategorized'
+            safe_filename = f"{category_prefix}/{file.filename}"
+            
+            # Avoid duplicate filenames
+            counter = 1
+            original_safe_filename = safe_filename
+            while safe_filename in added_files:
+                name, ext = os.path.splitext(original_safe_filename)
+                safe_filename = f"{name}_{counter}{ext}"
+                counter += 1
+            
+            stored = store_all or is_compressed_file(file.filename)
+            compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+            
+            try:
+                remote = take_remote(file)
+                if remote is not None:
+                    temp_path, download = remote
+                    
+                    try:
+                        # Wait for this file's download to finish
+                        download.result()
+                        
+                        # Add to ZIP
+                        yield from _zip_write_streamed(zip_file, sink, temp_path, safe_filename, compress_type)
+                        added_files.add(safe_filename)
+                    except (DownloadError, DownloadTimeoutError, FileTooLargeError) as download_err:
+                        # Add error note instead of failing completely
+                        error_filename = f"{safe_filename}.error.txt"
+                        error_msg = f"Failed to download: {file.github_url}\nError: {str(download_err)}\n"
+                        zip_file.writestr(error_filename, error_msg)
+                    finally:
+                        # Free temp disk now rather than when the archive is done
+                        try:
+                            os.remove(temp_path)
+                        except OSError:
+                            pass
+                elif file.id in local_ids:
+                    # Add local file to ZIP
+                    yield from _zip_write_streamed(zip_file, sink, file.local_file.path, safe_filename, compress_type)
+                    added_files.add(safe_filename)
+            except Exception as e:
+                # Log error but continue with other files
+                logger.error(f"Error processing file {file.filename}: {str(e)}", exc_info=True)
+                error_filename = f"{safe_filename}.error.txt"
+                error_msg = f"Error processing file: {str(e)}\nURL: {file.github_url or 'N/A'}\n"
+                zip_file.writestr(error_filename, error_msg)
+            
+            if data := sink.drain():
+                yield data
+    yield sink.drain()
+
+
+def stat_downloaded_files(tracker_files):
+    """Pair each tracker file with its os.stat result, leaving out files missing from storage."""
+    stated_files = []
+    for tracker_file in tracker_files:
+        if not tracker_file.local_file:
+            continue
+        try:
+            stated_files.append((tracker_file, os.stat(tracker_file.local_file.path)))
+        except FileNotFoundError:
+            logger.warning(f"Tracker file {tracker_file.pk} is missing on disk: {tracker_file.local_file.path}")
+    return stated_files
+
+
+def tracker_zip_cache_path(tracker, stated_files):
+    """
+    Path of the cached download-files ZIP for these stated files.
+
+    Like the mod download ETag, entry name, size and mtime identify the
+    archive contents, so an unchanged tracker maps to the same file and
+    any change to its files to a new one.
+    """
+    digest = hashlib.blake2b(str(tracker.pk).encode(), digest_size=16)
+    for tracker_file, stat in stated_files:
+        digest.update(
+            f"{tracker_file.pk}:{tracker_file.directory_path}/{tracker_file.filename}:"
+            f"{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+        )
+    return os.path.join(settings.TRACKER_ZIP_CACHE_DIR, f"{tracker.pk}-{digest.hexdigest()}.zip")
+
+
+def downloaded_tracker_files(tracker):
+    return tracker.files.filter(download_status='completed').only(
+        'local_file', 'directory_path', 'filename'
+    ).order_by('id')
+
+
+def stream_downloaded_files_zip(stated_files):
+    """
+    Yield a ZIP of a tracker's stated files chunk by chunk as it is written.
+
+    The archive is written by stream_zip, so small files are read and
+    deflated on a few threads ahead of the entry being written and
+    already-compressed formats are stored.
+    """
+    return stream_zip(stated_files, _tracker_zip_entries)
+
+
+def build_tracker_zip(tracker):
+    """
+    Write the tracker's download-files ZIP to the cache, unless it is there already.
+
+    Run by build_tracker_zip_task. Returns the cache path, or None when the
+    tracker has no downloaded files on disk.
+    """
+    stated_files = stat_downloaded_files(downloaded_tracker_files(tracker))
+    if not stated_files:
+        return None
+    cache_path = tracker_zip_cache_path(tracker, stated_files)
+    if not os.path.exists(cache_path):
+        chunks = stream_downloaded_files_zip(stated_files)
+        for _ in cache_zip(chunks, cache_path, settings.TRACKER_ZIP_CACHE_MAX_BYTES):
+            pass
+    return cache_path
@@ -11,6 +11,7 @@ from inventory.services.stl_thumbnail_service import (
     generate_auto_thumbnail,
     regenerate_tracker_thumbnails,
 )
+from inventory.services.zip_archives import build_tracker_zip
 
 logger = logging.getLogger(__name__)
 
@@ -41,3 +42,17 @@ def regenerate_tracker_thumbnails_task(tracker_id, include_linked=False):
         return None
 
     return regenerate_tracker_thumbnails(tracker, include_linked=include_linked)
+
+
+def build_tracker_zip_task(tracker_id):
+    from inventory.models import Tracker
+
+    try:
+        tracker = Tracker.objects.get(pk=tracker_id)
+    except Tracker.DoesNotExist:
+        logger.info(
+            f"Tracker {tracker_id} no longer exists; skipping ZIP build"
+        )
+        return None
+
+    return build_tracker_zip(tracker)
@@ -0,0 +1,64 @@
+from functools import partial
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from inventory.services.storage_manager import StorageManager
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(settings, tmp_path_factory):
+    """Give each test an empty cache outside the checkout and its tmp_path.
+
+    Keeps cached responses (e.g. the dashboard) from leaking between tests.
+    Changing CACHES makes Django rebuild its cache handlers.
+    """
+    settings.CACHES = {
+        'default': {**settings.CACHES['default'], 'LOCATION': str(tmp_path_factory.mktemp('django_cache'))},
+    }
+
+
+@pytest.fixture(autouse=True)
+def zip_cache_dirs(settings, tmp_path_factory):
+    """Keep download ZIPs written, pruned or cleared by tests out of the checkout."""
+    settings.MOD_ZIP_CACHE_DIR = str(tmp_path_factory.mktemp('mod_zips'))
+    settings.TRACKER_ZIP_CACHE_DIR = str(tmp_path_factory.mktemp('tracker_zips'))
+
+
+@pytest.fixture
+def assert_constant_queries(db):
+    """Check that a GET of ``url`` costs as many queries for five rows as for one.
+
+    ``add_row`` adds one row along with the relations the response reads.
+    """
+    def check(client, url, add_row):
+        def get_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            return len(ctx.captured_queries)
+
+        add_row()
+        baseline = get_queries()
+        for _ in range(4):
+            add_row()
+        assert get_queries() == baseline
+
+    return check
+
+
+@pytest.fixture
+def mock_storage_for():
+    """Set up a patched StorageManager class's instance for the download paths.
+
+    prepare_category_paths runs the real method against the mock, so tests
+    keep configuring and asserting on get_category_path and sanitize_filename.
+    """
+    def configure(mock_storage_manager_class):
+        mock_storage = mock_storage_manager_class.return_value
+        mock_storage.prepare_category_paths.side_effect = partial(StorageManager.prepare_category_paths, mock_storage)
+        return mock_storage
+
+    return configure
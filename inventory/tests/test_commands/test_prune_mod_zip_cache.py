@@ -0,0 +1,45 @@
+"""
+Tests for the prune_mod_zip_cache and prune_tracker_zip_cache management commands.
+"""
+import os
+from io import StringIO
+
+from django.core.management import call_command
+
+
+def _write(path, size, age):
+    with open(path, 'wb') as f:
+        f.write(b'\0' * size)
+    os.utime(path, (age, age))
+
+
+class TestPruneModZipCacheCommand:
+    def test_removes_least_recently_used_until_under_limit(self, settings, tmp_path):
+        settings.MOD_ZIP_CACHE_DIR = str(tmp_path)
+        _write(tmp_path / 'old.zip', 100, age=1_000)
+        _write(tmp_path / 'mid.zip', 100, age=2_000)
+        _write(tmp_path / 'new.zip', 100, age=3_000)
+
+        call_command('prune_mod_zip_cache', '--max-bytes', '150', stdout=StringIO())
+
+        assert sorted(os.listdir(tmp_path)) == ['new.zip']
+
+    def test_missing_cache_dir_is_not_an_error(self, settings, tmp_path):
+        settings.MOD_ZIP_CACHE_DIR = str(tmp_path / 'absent')
+
+        out = StringIO()
+        call_command('prune_mod_zip_cache', stdout=out)
+
+        assert 'Removed 0' in out.getvalue()
+
+
+class TestPruneTrackerZipCacheCommand:
+    def test_trims_the_tracker_cache(self, settings, tmp_path):
+        settings.TRACKER_ZIP_CACHE_DIR = str(tmp_path)
+        settings.MOD_ZIP_CACHE_DIR = str(tmp_path / 'mods')
+        _write(tmp_path / '1-old.zip', 100, age=1_000)
+        _write(tmp_path / '2-new.zip', 100, age=2_000)
+
+        call_command('prune_tracker_zip_cache', '--max-bytes', '150', stdout=StringIO())
+
+        assert sorted(os.listdir(tmp_path)) == ['2-new.zip']
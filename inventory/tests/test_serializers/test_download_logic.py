@@ -7,6 +7,8 @@ and FileDownloadService integration.
 
 import pytest
 from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from inventory.tests.factories import TrackerFactory, TrackerFileFactory
 
@@ -17,7 +19,7 @@ class TestTrackerCreateDownloadLogic:
     
     @patch('inventory.serializers.StorageManager')
     @patch('inventory.serializers.FileDownloadService')
-    def test_successful_download_all_files(self, mock_download_service_class, mock_storage_manager_class):
+    def test_successful_download_all_files(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
         """Test successful download of all files."""
         from inventory.serializers import TrackerCreateSerializer
         
@@ -40,7 +42,7 @@ class TestTrackerCreateDownloadLogic:
         tracker_files = [file1, file2]
         
         # Mock StorageManager
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {'sufficient': True}
         mock_storage.get_tracker_storage_path.return_value = '/media/trackers/1'
         mock_storage.get_category_path.return_value = '/media/trackers/1/files/test'
@@ -99,7 +101,7 @@ class TestTrackerCreateDownloadLogic:
     
     @patch('inventory.serializers.StorageManager')
     @patch('inventory.serializers.FileDownloadService')
-    def test_partial_download_failure(self, mock_download_service_class, mock_storage_manager_class):
+    def test_partial_download_failure(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
         """Test partial failure - some files succeed, some fail."""
         from inventory.serializers import TrackerCreateSerializer
         
@@ -115,7 +117,7 @@ class TestTrackerCreateDownloadLogic:
         tracker_files = [file1, file2]
         
         # Mock successful space check and path creation
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {'sufficient': True}
         mock_storage.get_tracker_storage_path.return_value = '/media/trackers/2'
         mock_storage.get_category_path.return_value = '/media/trackers/2/files/uncategorized'
@@ -164,7 +166,7 @@ class TestTrackerCreateDownloadLogic:
         assert tracker.files_downloaded is False  # Not all succeeded
     
     @patch('inventory.serializers.StorageManager')
-    def test_insufficient_disk_space_before_download(self, mock_storage_manager_class):
+    def test_insufficient_disk_space_before_download(self, mock_storage_manager_class, mock_storage_for):
         """Test insufficient disk space caught before download starts."""
         from inventory.serializers import TrackerCreateSerializer
         
@@ -173,7 +175,7 @@ class TestTrackerCreateDownloadLogic:
         tracker_files = [file1]
         
         # Mock insufficient space
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {
             'sufficient': False,
             'available_formatted': '1.5 GB'
@@ -195,7 +197,7 @@ class TestTrackerCreateDownloadLogic:
         assert 'Insufficient disk space' in file1.download_error
     
     @patch('inventory.serializers.StorageManager')
-    def test_insufficient_storage_error_exception(self, mock_storage_manager_class):
+    def test_insufficient_storage_error_exception(self, mock_storage_manager_class, mock_storage_for):
         """Test InsufficientStorageError exception handling."""
         from inventory.serializers import TrackerCreateSerializer
         from inventory.services.storage_manager import InsufficientStorageError
@@ -205,7 +207,7 @@ class TestTrackerCreateDownloadLogic:
         tracker_files = [file1]
         
         # Mock exception
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.side_effect = InsufficientStorageError('Not enough space')
         
         serializer = TrackerCreateSerializer()
@@ -219,7 +221,7 @@ class TestTrackerCreateDownloadLogic:
         assert file1.download_status == 'failed'
     
     @patch('inventory.serializers.StorageManager')
-    def test_storage_permission_error_exception(self, mock_storage_manager_class):
+    def test_storage_permission_error_exception(self, mock_storage_manager_class, mock_storage_for):
         """Test StoragePermissionError exception handling."""
         from inventory.serializers import TrackerCreateSerializer
         from inventory.services.storage_manager import StoragePermissionError
@@ -229,7 +231,7 @@ class TestTrackerCreateDownloadLogic:
         tracker_files = [file1]
         
         # Mock permission error
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.side_effect = StoragePermissionError('Permission denied')
         
         serializer = TrackerCreateSerializer()
@@ -243,7 +245,7 @@ class TestTrackerCreateDownloadLogic:
         assert file1.download_status == 'failed'
     
     @patch('inventory.serializers.StorageManager')
-    def test_storage_path_creation_failure(self, mock_storage_manager_class):
+    def test_storage_path_creation_failure(self, mock_storage_manager_class, mock_storage_for):
         """Test failure when creating tracker storage path."""
         from inventory.serializers import TrackerCreateSerializer
         
@@ -252,7 +254,7 @@ class TestTrackerCreateDownloadLogic:
         tracker_files = [file1]
         
         # Mock space check success but path creation failure
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {'sufficient': True}
         mock_storage.get_tracker_storage_path.side_effect = Exception('Cannot create directory')
         
@@ -268,10 +270,11 @@ class TestTrackerCreateDownloadLogic:
     
     @patch('inventory.serializers.StorageManager')
     @patch('inventory.serializers.FileDownloadService')
-    def test_empty_file_list(self, mock_download_service_class, mock_storage_manager_class):
+    def test_empty_file_list(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
         """Test download with empty file list."""
         from inventory.serializers import TrackerCreateSerializer
         
+        mock_storage_for(mock_storage_manager_class)
         tracker = TrackerFactory(id=7)
         tracker_files = []
         
@@ -285,7 +288,7 @@ class TestTrackerCreateDownloadLogic:
     
     @patch('inventory.serializers.StorageManager')
     @patch('inventory.serializers.FileDownloadService')
-    def test_file_path_sanitization(self, mock_download_service_class, mock_storage_manager_class):
+    def test_file_path_sanitization(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
         """Test that filenames are properly sanitized."""
         from inventory.serializers import TrackerCreateSerializer
         
@@ -299,7 +302,7 @@ class TestTrackerCreateDownloadLogic:
         tracker_files = [file1]
         
         # Mock sanitization
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {'sufficient': True}
         mock_storage.get_tracker_storage_path.return_value = '/media/trackers/8'
         mock_storage.get_category_path.return_value = '/media/trackers/8/files/safe'
@@ -324,3 +327,65 @@ class TestTrackerCreateDownloadLogic:
         # Verify sanitization was called
         assert mock_storage.sanitize_filename.call_count >= 2  # Called for filename and category
         assert len(results['successful']) == 1
+
+    @patch('inventory.serializers.StorageManager')
+    @patch('inventory.serializers.FileDownloadService')
+    def test_query_count_does_not_grow_with_files(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
+        """Download state is written per stage, not per file."""
+        from inventory.serializers import TrackerCreateSerializer
+        
+        mock_storage = mock_storage_for(mock_storage_manager_class)
+        mock_storage.check_available_space.return_value = {'sufficient': True}
+        mock_storage.get_tracker_storage_path.return_value = '/media/trackers/9'
+        mock_storage.get_category_path.return_value = '/media/trackers/9/files/test'
+        mock_storage.sanitize_filename.side_effect = lambda x: x
+        
+        def download_queries(count):
+            tracker = TrackerFactory()
+            # .gcode files skip the per-file auto-thumbnail check
+            tracker_files = [
+                TrackerFileFactory(tracker=tracker, filename=f'part_{n}.gcode', directory_path='test')
+                for n in range(count)
+            ]
+            mock_download_service_class.return_value.download_files_batch.return_value = {
+                'successful': [{'tracker_file_id': tf.id, 'checksum': 'abc', 'bytes_downloaded': 10} for tf in tracker_files[1:]],
+                'failed': [{'tracker_file_id': tracker_files[0].id, 'error': 'Timed out'}],
+                'duration': 1.0
+            }
+            with CaptureQueriesContext(connection) as ctx:
+                TrackerCreateSerializer()._download_tracker_files(tracker, tracker_files)
+            return len(ctx.captured_queries)
+        
+        assert download_queries(5) == download_queries(2)
+
+    @patch('inventory.serializers.StorageManager')
+    @patch('inventory.serializers.FileDownloadService')
+    def test_category_directories_are_prepared_once(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
+        """Each category is created and sanitized once, however many files it holds."""
+        from inventory.serializers import TrackerCreateSerializer
+        
+        mock_storage = mock_storage_for(mock_storage_manager_class)
+        mock_storage.check_available_space.return_value = {'sufficient': True}
+        mock_storage.get_tracker_storage_path.return_value = '/media/trackers/9'
+        mock_storage.get_category_path.side_effect = lambda tracker_id, category, create: f'/media/trackers/9/files/{category}'
+        mock_storage.sanitize_filename.side_effect = lambda x: x
+        
+        tracker = TrackerFactory()
+        tracker_files = [
+            TrackerFileFactory(tracker=tracker, filename=f'part_{n}.gcode', directory_path=category)
+            for n, category in enumerate(['Body', 'Body', 'Mount', '', 'Body'])
+        ]
+        mock_download_service_class.return_value.download_files_batch.return_value = {
+            'successful': [], 'failed': [], 'duration': 1.0
+        }
+        
+        TrackerCreateSerializer()._download_tracker_files(tracker, tracker_files)
+        
+        categories = [c.args[1] for c in mock_storage.get_category_path.call_args_list]
+        assert sorted(categories) == ['Body', 'Mount', 'uncategorized']
+        # One call per filename plus one per category
+        assert mock_storage.sanitize_filename.call_count == 5 + 3
+        file_list = mock_download_service_class.return_value.download_files_batch.call_args.args[0]
+        assert [f['destination'] for f in file_list][2:4] == [
+            '/media/trackers/9/files/Mount/part_2.gcode', '/media/trackers/9/files/uncategorized/part_3.gcode'
+        ]
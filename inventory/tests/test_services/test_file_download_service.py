@@ -1,22 +1,29 @@
 """
 Tests for inventory/services/file_download_service.py
 
-Covers the two most testable units without actual network calls:
+Covers the most testable units without actual network calls:
 
-- FileDownloadService._format_bytes() – pure static method
-- FileDownloadService.validate_url()  – SSRF-protection logic
+- FileDownloadService._format_bytes()        – pure static method
+- FileDownloadService.validate_url()          – SSRF-protection logic
+- FileDownloadService.download_files_batch()  – result aggregation, with
+  download_with_retry mocked
+- FileDownloadService.download_file()         – pre-allocation, with the
+  HTTP session mocked
 
 validate_url() calls socket.getaddrinfo() to resolve hostnames, so all
 tests that exercise IP-checking logic mock that call to keep the suite
 fast, deterministic, and hermetic.
 """
 
+import errno
+import os
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
 
-from inventory.services.file_download_service import FileDownloadService
+from inventory.services.file_download_service import DownloadError, FileDownloadService
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -285,3 +292,101 @@ class TestValidateUrlValidPublic:
             "https://cdn.example.com/files/model.stl?token=abc123"
         )
         assert result is True
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# download_files_batch()
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestDownloadFilesBatch:
+    """
+    Files download concurrently, but results are reported in file_list order
+    and one failure never stops the rest of the batch.
+    """
+
+    def setup_method(self):
+        self.service = FileDownloadService()
+
+    @staticmethod
+    def _fake_download(url, destination, progress_callback=None):
+        if url.endswith('bad.stl'):
+            raise ValueError("Blocked address")
+        return {'bytes_downloaded': len(url), 'duration': 0.1}
+
+    def test_results_keep_file_list_order(self):
+        file_list = [
+            {'url': f'https://example.com/{n}.stl', 'destination': f'/tmp/{n}.stl', 'tracker_file_id': n}
+            for n in range(20)
+        ]
+        with mock.patch.object(self.service, 'download_with_retry', side_effect=self._fake_download), \
+                mock.patch.object(self.service, 'compute_checksum', return_value='abc'):
+            results = self.service.download_files_batch(file_list)
+
+        assert [r['tracker_file_id'] for r in results['successful']] == list(range(20))
+        assert results['total_bytes'] == sum(len(f['url']) for f in file_list)
+        assert results['failed'] == []
+
+    def test_failures_are_collected_not_raised(self):
+        file_list = [
+            {'url': 'https://example.com/good.stl', 'destination': '/tmp/good.stl', 'tracker_file_id': 1},
+            {'url': 'https://example.com/bad.stl', 'destination': '/tmp/bad.stl', 'tracker_file_id': 2},
+        ]
+        with mock.patch.object(self.service, 'download_with_retry', side_effect=self._fake_download), \
+                mock.patch.object(self.service, 'compute_checksum', return_value='abc'):
+            results = self.service.download_files_batch(file_list)
+
+        assert [r['tracker_file_id'] for r in results['successful']] == [1]
+        assert results['failed'][0]['tracker_file_id'] == 2
+        assert results['failed'][0]['error_type'] == 'ValueError'
+
+    def test_empty_batch(self):
+        results = self.service.download_files_batch([])
+
+        assert results['successful'] == [] and results['failed'] == []
+
+    def test_session_is_reused_within_a_thread_only(self):
+        first = self.service._session()
+
+        assert self.service._session() is first
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(self.service._session).result() is not first
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# download_file()
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestDownloadFilePreallocation:
+    """The advertised size is reserved up front and trimmed to what arrived."""
+
+    def setup_method(self):
+        self.service = FileDownloadService()
+
+    def _download(self, tmp_path, body, content_length):
+        response = mock.Mock(headers={'content-length': str(content_length)})
+        response.iter_content.return_value = [body]
+        destination = str(tmp_path / 'part.stl')
+        with mock.patch.object(self.service, 'validate_url'), \
+                mock.patch.object(self.service, '_session') as session:
+            session.return_value.get.return_value = response
+            return destination, self.service.download_file('https://example.com/part.stl', destination)
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fallocate'), reason='posix_fallocate unavailable')
+    def test_reserves_content_length(self, tmp_path):
+        with mock.patch('os.posix_fallocate') as fallocate:
+            self._download(tmp_path, b'x' * 2000, 2000)
+
+        assert fallocate.call_args.args[1:] == (0, 2000)
+
+    def test_short_body_is_not_padded(self, tmp_path):
+        destination, result = self._download(tmp_path, b'x' * 1990, 2000)
+
+        assert result['bytes_downloaded'] == os.path.getsize(destination) == 1990
+
+    @pytest.mark.skipif(not hasattr(os, 'posix_fallocate'), reason='posix_fallocate unavailable')
+    def test_full_disk_fails_before_writing(self, tmp_path):
+        with mock.patch('os.posix_fallocate', side_effect=OSError(errno.ENOSPC, 'No space left on device')), \
+                pytest.raises(DownloadError, match='File write error'):
+            self._download(tmp_path, b'x' * 2000, 2000)
+
+        assert not (tmp_path / 'part.stl').exists()
@@ -6,9 +6,17 @@ and no Django settings:
 
 - StorageManager.sanitize_filename(): Filename safety sanitization
 - StorageManager._format_bytes(): Human-readable byte formatting
+
+plus the short-lived disk usage cache behind check_available_space(),
+with shutil.disk_usage() mocked, and cleanup_tracker_files() against a
+temporary directory.
 """
 
+from collections import namedtuple
+from unittest import mock
+
 import pytest
+from inventory.services import storage_manager
 from inventory.services.storage_manager import StorageManager
 
 
@@ -144,3 +152,74 @@ class TestFormatBytes:
         result = StorageManager._format_bytes(int(2.5 * 1024 * 1024))
         assert "MB" in result
         assert result.startswith("2.50")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# StorageManager.check_available_space() disk usage cache
+# ──────────────────────────────────────────────────────────────────────────────
+
+DiskUsage = namedtuple('DiskUsage', 'total used free')
+
+
+class TestDiskUsageCache:
+    """A burst of space checks shares one disk_usage() call."""
+
+    @pytest.fixture
+    def manager(self, settings, tmp_path):
+        settings.TRACKER_STORAGE = {'BASE_PATH': str(tmp_path), 'MIN_FREE_SPACE': 0}
+        storage_manager._disk_usage_cache.clear()
+        yield StorageManager()
+        storage_manager._disk_usage_cache.clear()
+
+    def test_repeat_checks_reuse_one_reading(self, manager):
+        with mock.patch('shutil.disk_usage', return_value=DiskUsage(100, 0, 100)) as mock_usage:
+            manager.check_available_space(10)
+            manager.check_available_space(20)
+
+        mock_usage.assert_called_once()
+
+    def test_forget_disk_usage_forces_a_new_reading(self, manager):
+        with mock.patch('shutil.disk_usage', return_value=DiskUsage(100, 0, 100)) as mock_usage:
+            manager.check_available_space(10)
+            manager.forget_disk_usage()
+            manager.check_available_space(10)
+
+        assert mock_usage.call_count == 2
+
+    def test_reading_expires(self, manager, monkeypatch):
+        with mock.patch('shutil.disk_usage', return_value=DiskUsage(100, 0, 100)) as mock_usage:
+            manager.check_available_space(10)
+            monkeypatch.setattr(storage_manager, 'DISK_USAGE_TTL', 0)
+            manager.forget_disk_usage()
+            manager.check_available_space(10)
+            manager.check_available_space(10)
+
+        assert mock_usage.call_count == 3
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# StorageManager.cleanup_tracker_files()
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestCleanupTrackerFiles:
+    """A tracker's whole directory tree is removed and its size reported."""
+
+    @pytest.fixture
+    def manager(self, settings, tmp_path):
+        settings.TRACKER_STORAGE = {'BASE_PATH': str(tmp_path)}
+        return StorageManager()
+
+    def test_removes_nested_files_and_directories(self, manager, tmp_path):
+        (tmp_path / '5' / 'files' / 'Body' / 'sub').mkdir(parents=True)
+        (tmp_path / '5' / 'files' / 'empty').mkdir()
+        (tmp_path / '5' / 'files' / 'Body' / 'a.stl').write_bytes(b'x' * 10)
+        (tmp_path / '5' / 'files' / 'Body' / 'sub' / 'b.stl').write_bytes(b'x' * 5)
+        (tmp_path / '6').mkdir()
+
+        result = manager.cleanup_tracker_files(5)
+
+        assert (result['success'], result['deleted_files'], result['deleted_bytes']) == (True, 2, 15)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['6']
+
+    def test_missing_directory_is_a_noop(self, manager):
+        assert manager.cleanup_tracker_files(404)['deleted_files'] == 0
@@ -39,3 +39,17 @@ class TestRegenerateTrackerThumbnailsTask:
 
     def test_noop_when_tracker_deleted_before_task_runs(self):
         tasks.regenerate_tracker_thumbnails_task(999999)
+
+
+@pytest.mark.django_db
+class TestBuildTrackerZipTask:
+    def test_delegates_for_existing_tracker(self):
+        tracker = TrackerFactory()
+
+        with mock.patch('inventory.tasks.build_tracker_zip') as mock_build:
+            tasks.build_tracker_zip_task(tracker.id)
+
+        mock_build.assert_called_once_with(tracker)
+
+    def test_noop_when_tracker_deleted_before_task_runs(self):
+        tasks.build_tracker_zip_task(999999)
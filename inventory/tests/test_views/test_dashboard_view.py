@@ -10,12 +10,19 @@ Covers:
     - blocked (ALL printers unavailable)
     - partially-blocked (SOME but not all printers unavailable)
     - priority ordering (overdue > blocked > partially-blocked > at-risk > healthy)
+    - the ten projects listed are picked most critical first
+- _generate_alerts() printer/project alert buckets
+- _get_featured_trackers() payload
+- response caching and signal-driven invalidation
 """
 import pytest
 from datetime import date, timedelta
+from django.core.cache import caches
 from rest_framework import status
 from rest_framework.test import APIClient
-from inventory.tests.factories import ProjectFactory, PrinterFactory
+from inventory.tests.factories import (
+    InventoryItemFactory, ProjectFactory, PrinterFactory, TrackerFactory, TrackerFileFactory,
+)
 
 
 @pytest.fixture
@@ -55,6 +62,16 @@ class TestDashboardResponseStructure:
         assert 'printer_count' in stats
         assert 'project_count' in stats
 
+    def test_stats_counts_match_rows(self, db, api_client):
+        """Stats report the real row counts for each model."""
+        PrinterFactory.create_batch(2)
+        ProjectFactory.create_batch(3)
+        stats = api_client.get('/api/dashboard/').data['stats']
+        assert stats['printer_count'] == 2
+        assert stats['project_count'] == 3
+        assert stats['inventory_count'] == 0
+        assert stats['tracker_count'] == 0
+
     def test_active_projects_is_list(self, db, api_client):
         """active_projects is returned as a list."""
         response = api_client.get('/api/dashboard/')
@@ -151,6 +168,8 @@ class TestHealthStatusOverdue:
         response = api_client.get('/api/dashboard/')
         projects = [p for p in response.data['active_projects'] if p['id'] == project.id]
         assert projects[0]['health'] == 'overdue'
+        assert projects[0]['days_until_due'] == -1
+        assert projects[0]['health_reason'] == 'Past due by 1 days'
 
     def test_project_with_no_due_date_is_not_overdue(self, db, api_client):
         """Project with no due_date is not overdue."""
@@ -158,6 +177,7 @@ class TestHealthStatusOverdue:
         response = api_client.get('/api/dashboard/')
         projects = [p for p in response.data['active_projects'] if p['id'] == project.id]
         assert projects[0]['health'] != 'overdue'
+        assert projects[0]['days_until_due'] is None
 
 
 # ============================================================================
@@ -306,3 +326,202 @@ class TestHealthPriorityOrdering:
         response = api_client.get('/api/dashboard/')
         projects = [p for p in response.data['active_projects'] if p['id'] == project.id]
         assert projects[0]['health'] == 'overdue'
+
+
+class TestActiveProjectSelection:
+
+    def test_unhealthy_projects_are_listed_first(self, db, api_client, today):
+        """An old blocked project is not pushed out by ten newer healthy ones."""
+        for offset in range(10):
+            ProjectFactory(status='In Progress', start_date=today - timedelta(days=offset), due_date=None)
+        blocked = ProjectFactory(status='In Progress', start_date=today - timedelta(days=365), due_date=None)
+        blocked.associated_printers.add(PrinterFactory(status='Sold'))
+        at_risk = ProjectFactory(
+            status='In Progress', start_date=today - timedelta(days=300), due_date=today + timedelta(days=3),
+        )
+
+        response = api_client.get('/api/dashboard/')
+
+        active = response.data['active_projects']
+        assert len(active) == 10
+        assert [p['id'] for p in active[:2]] == [blocked.id, at_risk.id]
+        assert [p['health'] for p in active[:3]] == ['blocked', 'at-risk', 'healthy']
+
+    def test_query_count_does_not_grow_with_projects(self, db, api_client, assert_constant_queries):
+        def add_blocked_project():
+            project = ProjectFactory(status='In Progress')
+            project.associated_printers.add(PrinterFactory(status='Active'), PrinterFactory(status='Sold'))
+
+        assert_constant_queries(api_client, '/api/dashboard/', add_blocked_project)
+
+
+# ============================================================================
+# ALERTS
+# ============================================================================
+
+def _alert_ids(response, severity):
+    return [a['alert_id'] for a in response.data['alerts'][severity]]
+
+
+class TestPrinterAlerts:
+
+    def test_printer_with_several_conditions_raises_each_alert(self, db, api_client, today):
+        """A single printer row can feed maintenance, repair, and carbon alerts."""
+        printer = PrinterFactory(
+            status='Under Repair',
+            maintenance_reminder_date=today - timedelta(days=3),
+            carbon_reminder_date=today - timedelta(days=1),
+        )
+        response = api_client.get('/api/dashboard/')
+        critical = _alert_ids(response, 'critical')
+        assert f'maintenance_overdue_{printer.id}' in critical
+        assert f'printer_repair_{printer.id}' in critical
+        assert f'carbon_overdue_{printer.id}' in critical
+        assert f'carbon_soon_{printer.id}' not in _alert_ids(response, 'warning')
+
+    def test_carbon_due_soon_is_warning(self, db, api_client, today):
+        printer = PrinterFactory(status='Active', carbon_reminder_date=today + timedelta(days=3))
+        response = api_client.get('/api/dashboard/')
+        assert f'carbon_soon_{printer.id}' in _alert_ids(response, 'warning')
+        assert f'carbon_overdue_{printer.id}' not in _alert_ids(response, 'critical')
+
+    def test_printer_alerts_precede_project_alerts(self, db, api_client, today):
+        printer = PrinterFactory(status='Under Repair')
+        project = ProjectFactory(status='In Progress', due_date=today - timedelta(days=1))
+        critical = _alert_ids(api_client.get('/api/dashboard/'), 'critical')
+        assert critical.index(f'printer_repair_{printer.id}') < critical.index(f'project_overdue_{project.id}')
+
+
+class TestProjectAlerts:
+
+    def test_blocked_project_raises_alert(self, db, api_client):
+        printer = PrinterFactory(status='Sold')
+        project = ProjectFactory(status='In Progress', due_date=None)
+        project.associated_printers.add(printer)
+        response = api_client.get('/api/dashboard/')
+        assert f'project_blocked_{project.id}' in _alert_ids(response, 'critical')
+
+    def test_project_with_only_active_printers_is_not_blocked(self, db, api_client):
+        printer = PrinterFactory(status='Active')
+        project = ProjectFactory(status='In Progress', due_date=None)
+        project.associated_printers.add(printer)
+        response = api_client.get('/api/dashboard/')
+        assert f'project_blocked_{project.id}' not in _alert_ids(response, 'critical')
+
+    def test_completed_project_raises_no_due_alerts(self, db, api_client, today):
+        overdue = ProjectFactory(status='Completed', due_date=today - timedelta(days=2))
+        soon = ProjectFactory(status='Completed', due_date=today + timedelta(days=2))
+        response = api_client.get('/api/dashboard/')
+        assert f'project_overdue_{overdue.id}' not in _alert_ids(response, 'critical')
+        assert f'project_due_soon_{soon.id}' not in _alert_ids(response, 'warning')
+
+    def test_project_due_soon_is_warning(self, db, api_client, today):
+        project = ProjectFactory(status='Planning', due_date=today + timedelta(days=2))
+        response = api_client.get('/api/dashboard/')
+        assert f'project_due_soon_{project.id}' in _alert_ids(response, 'warning')
+
+    def test_project_due_soon_message_counts_days(self, db, api_client, today):
+        project = ProjectFactory(status='Planning', due_date=today + timedelta(days=3))
+        response = api_client.get('/api/dashboard/')
+        alerts = [a for a in response.data['alerts']['warning']
+                  if a['alert_id'] == f'project_due_soon_{project.id}']
+        assert alerts[0]['message'] == 'Due in 3 days'
+
+
+class TestTrackerAlerts:
+
+    def test_unconfigured_files_are_counted(self, db, api_client):
+        tracker = TrackerFactory()
+        TrackerFileFactory(tracker=tracker, color='', material='PLA')
+        TrackerFileFactory(tracker=tracker, color='Primary', material='')
+        TrackerFileFactory(tracker=tracker, color='Primary', material='PLA')
+        response = api_client.get('/api/dashboard/')
+        alerts = [a for a in response.data['alerts']['warning']
+                  if a['alert_id'] == f'tracker_unconfigured_{tracker.id}']
+        assert alerts[0]['message'] == '2 file(s) need configuration'
+
+    def test_fully_configured_tracker_has_no_alert(self, db, api_client):
+        tracker = TrackerFactory()
+        TrackerFileFactory(tracker=tracker, color='Primary', material='PLA')
+        response = api_client.get('/api/dashboard/')
+        assert f'tracker_unconfigured_{tracker.id}' not in _alert_ids(response, 'warning')
+
+
+# ============================================================================
+# FEATURED TRACKERS
+# ============================================================================
+
+class TestFeaturedTrackers:
+
+    def test_featured_tracker_payload(self, db, api_client):
+        tracker = TrackerFactory(
+            show_on_dashboard=True, total_quantity=4,
+            printed_quantity_total=4, progress_percentage=100,
+        )
+        TrackerFactory(show_on_dashboard=False)
+        response = api_client.get('/api/dashboard/')
+        assert response.data['featured_trackers'] == [{
+            'id': tracker.id,
+            'name': tracker.name,
+            'project_name': tracker.project.project_name,
+            'progress_percentage': 100,
+            'completed_count': 4,
+            'total_count': 4,
+            'status': 'completed',
+        }]
+
+    def test_featured_tracker_without_project(self, db, api_client):
+        TrackerFactory(show_on_dashboard=True, project=None)
+        response = api_client.get('/api/dashboard/')
+        assert response.data['featured_trackers'][0]['project_name'] is None
+        assert response.data['featured_trackers'][0]['status'] == 'in-progress'
+
+
+# ============================================================================
+# RESPONSE CACHING
+# ============================================================================
+
+class TestDashboardCaching:
+
+    def test_repeat_request_is_served_from_cache(self, db, api_client, django_assert_num_queries):
+        api_client.get('/api/dashboard/')
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/dashboard/')
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_model_write_invalidates_cache(self, db, api_client):
+        api_client.get('/api/dashboard/')
+        ProjectFactory(status='In Progress', project_name="Fresh Project")
+        response = api_client.get('/api/dashboard/')
+        assert "Fresh Project" in [p['name'] for p in response.data['active_projects']]
+
+    def test_printer_link_invalidates_cache(self, db, api_client):
+        project = ProjectFactory(status='In Progress', due_date=None)
+        api_client.get('/api/dashboard/')
+        project.associated_printers.add(PrinterFactory(status='Sold'))
+        response = api_client.get('/api/dashboard/')
+        assert f'project_blocked_{project.id}' in _alert_ids(response, 'critical')
+
+    def test_bom_reservation_invalidates_cache(self, db, api_client):
+        """Reserving stock goes through update(), which sends no post_save."""
+        project = ProjectFactory(status='Planning')
+        item = InventoryItemFactory(quantity=10, low_stock_threshold=5, is_consumable=True)
+        api_client.get('/api/dashboard/')
+        api_client.post('/api/projectbomitems/', {
+            'project': project.pk,
+            'description': 'Reserved part',
+            'quantity_needed': 6,
+            'inventory_item': item.pk,
+            'status': 'linked',
+        }, format='json')
+        response = api_client.get('/api/dashboard/')
+        assert f'low_stock_{item.id}' in _alert_ids(response, 'info')
+
+    def test_write_from_another_process_invalidates_cache(self, db, api_client, monkeypatch):
+        """A qcluster task or shell session bumps the version through its own cache handler."""
+        api_client.get('/api/dashboard/')
+        monkeypatch.setattr('inventory.models.cache', caches.create_connection('default'))
+        ProjectFactory(status='In Progress', project_name="Worker Project")
+        monkeypatch.undo()
+        response = api_client.get('/api/dashboard/')
+        assert "Worker Project" in [p['name'] for p in response.data['active_projects']]
@@ -0,0 +1,77 @@
+"""
+Tests for DeleteAllData — POST /api/delete-all-data/
+
+Tables are emptied with one DELETE each; rows elsewhere that reference them
+must still follow their on_delete rules (CASCADE deletes, SET_NULL clears).
+"""
+import os
+
+import pytest
+from rest_framework.test import APIClient
+
+from inventory.models import (
+    FilamentSpool, Material, Printer, Project, ProjectBOMItem, Tracker, TrackerFile, Vendor,
+)
+from inventory.tests.factories import (
+    FilamentSpoolFactory,
+    GenericMaterialFactory,
+    PrinterFactory,
+    ProjectFactory,
+    TrackerFactory,
+    TrackerFileFactory,
+)
+
+
+URL = '/api/delete-all-data/'
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.mark.django_db
+class TestDeleteAllData:
+    def test_removes_core_records(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        project = ProjectFactory()
+        project.associated_printers.add(PrinterFactory())
+        TrackerFileFactory(tracker=TrackerFactory(project=project))
+        ProjectBOMItem.objects.create(project=project, description='M3x8 SHCS')
+
+        response = client.post(URL)
+
+        assert response.status_code == 200
+        for model in (Printer, Project, Tracker, TrackerFile, ProjectBOMItem, Vendor):
+            assert not model.objects.exists()
+
+    def test_cached_download_zips_are_removed(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        for cache_dir in (settings.MOD_ZIP_CACHE_DIR, settings.TRACKER_ZIP_CACHE_DIR):
+            open(os.path.join(cache_dir, '1-abc.zip'), 'wb').close()
+
+        client.post(URL)
+
+        assert os.listdir(settings.MOD_ZIP_CACHE_DIR) == os.listdir(settings.TRACKER_ZIP_CACHE_DIR) == []
+
+    def test_unrelated_spools_keep_their_row(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        spool = FilamentSpoolFactory(
+            filament_type=GenericMaterialFactory(name='PLA'),
+            assigned_printer=PrinterFactory(),
+            project=ProjectFactory(),
+        )
+
+        client.post(URL)
+
+        spool.refresh_from_db()
+        assert (spool.location, spool.assigned_printer, spool.project) == (None, None, None)
+
+    def test_branded_materials_cascade(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        spool = FilamentSpoolFactory()
+
+        client.post(URL)
+
+        assert not Material.objects.filter(pk=spool.filament_type_id).exists()
+        assert not FilamentSpool.objects.filter(pk=spool.pk).exists()
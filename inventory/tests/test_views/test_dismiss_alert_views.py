@@ -6,12 +6,19 @@ Covers:
 - DismissAlertView POST: valid dismissal, missing fields, state hash stored
 - DismissAllAlertsView POST: batch dismissal, invalid input, count returned
 - parse_date: multiple date formats, empty/None handling
+- _generate_state_hash: hashes stay compatible with stored dismissals
+- Dashboard honours dismissals stored with state JSON or hash only
 """
+import hashlib
+import json
+from datetime import date, timedelta
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 from inventory.models import AlertDismissal
-from inventory.views import parse_date
+from inventory.tests.factories import PrinterFactory, ProjectFactory
+from inventory.views import DashboardDataView, parse_date
 
 
 @pytest.fixture
@@ -255,3 +262,187 @@ class TestDismissAllAlertsView:
             format="json",
         )
         assert resp.data["dismissed_count"] == 1
+
+    def test_redismissing_updates_existing_record(self, api_client):
+        AlertDismissal.objects.create(alert_type="printer_repair", alert_id="printer_repair_1", state_hash="old")
+        api_client.post(
+            self.URL,
+            {
+                "alerts": [
+                    {"alert_type": "printer_repair", "alert_id": "printer_repair_1",
+                     "state_data": {"id": 1, "status": "Sold"}},
+                    {"alert_type": "printer_repair", "alert_id": "printer_repair_1",
+                     "state_data": {"id": 1, "status": "Under Repair"}},
+                ]
+            },
+            format="json",
+        )
+        dismissal = AlertDismissal.objects.get(alert_id="printer_repair_1")
+        assert dismissal.state_json == '{"id": 1, "status": "Under Repair"}'
+        assert AlertDismissal.objects.count() == 1
+
+    def test_dismissed_alerts_drop_off_cached_dashboard(self, api_client):
+        printer = PrinterFactory(status="Under Repair")
+        alert_id = f"printer_repair_{printer.id}"
+        api_client.get("/api/dashboard/")
+        api_client.post(
+            self.URL,
+            {"alerts": [{"alert_type": "printer_repair", "alert_id": alert_id,
+                         "state_data": {"id": printer.id, "status": "Under Repair"}}]},
+            format="json",
+        )
+        resp = api_client.get("/api/dashboard/")
+        assert alert_id not in [a["alert_id"] for a in resp.data["alerts"]["critical"]]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# DashboardDataView._generate_state_hash()
+# ──────────────────────────────────────────────────────────────────────────────
+
+class TestGenerateStateHash:
+    """
+    The specialized encoders must reproduce the original sorted-JSON hash so
+    dismissals stored before the change keep matching.
+    """
+
+    @staticmethod
+    def _legacy_hash(fields, state_data):
+        filtered = {}
+        for field in fields:
+            value = state_data.get(field)
+            if isinstance(value, date):
+                value = value.isoformat()
+            filtered[field] = value
+        return hashlib.sha256(json.dumps(filtered, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def test_matches_legacy_hash_for_dates(self):
+        state = {'id': 4, 'last_maintained_date': None, 'maintenance_reminder_date': date(2025, 1, 2)}
+        expected = self._legacy_hash(['last_maintained_date', 'maintenance_reminder_date', 'id'], state)
+        assert DashboardDataView()._generate_state_hash('maintenance_overdue', state) == expected
+
+    def test_matches_legacy_hash_for_strings(self):
+        state = {'id': 1, 'status': 'Under "Repair" é'}
+        expected = self._legacy_hash(['status', 'id'], state)
+        assert DashboardDataView()._generate_state_hash('printer_repair', state) == expected
+
+    def test_printer_states_tuples_and_lists_hash_equally(self):
+        """Client round-trips turn tuples into lists; the hash must not change."""
+        view = DashboardDataView()
+        from_server = view._generate_state_hash('project_blocked', {'id': 2, 'printer_states': [(7, 'Sold')]})
+        from_client = view._generate_state_hash('project_blocked', {'id': 2, 'printer_states': [[7, 'Sold']]})
+        assert from_server == from_client
+
+    def test_matches_legacy_hash_for_printer_states(self):
+        state = {'id': 2, 'printer_states': [[7, 'Sold'], [8, 'Under "Repair" é']]}
+        expected = self._legacy_hash(['printer_states', 'id'], state)
+        assert DashboardDataView()._generate_state_hash('project_blocked', state) == expected
+
+    def test_unknown_alert_type_hashes_id_only(self):
+        state = {'id': 9, 'ignored': 'value'}
+        expected = self._legacy_hash(['id'], state)
+        assert DashboardDataView()._generate_state_hash('something_new', state) == expected
+
+    def test_repeated_state_is_hashed_once(self):
+        state = {'id': 3, 'printer_states': [[1, 'Sold']]}
+        view = DashboardDataView()
+        first = view._generate_state_hash('project_blocked', state)
+        hits = DashboardDataView._hash_state_json.cache_info().hits
+        assert view._generate_state_hash('project_blocked', dict(state)) == first
+        assert DashboardDataView._hash_state_json.cache_info().hits == hits + 1
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Dismissal matching on the dashboard
+# ──────────────────────────────────────────────────────────────────────────────
+
+@pytest.mark.django_db
+class TestDismissalStateMatching:
+    """Dismissals store the encoded state; legacy rows only have the hash."""
+
+    def _repair_alert_ids(self, api_client):
+        resp = api_client.get("/api/dashboard/")
+        return [a["alert_id"] for a in resp.data["alerts"]["critical"]]
+
+    def test_dismissal_stores_state_json(self, api_client):
+        api_client.post(
+            "/api/alerts/dismiss/",
+            {
+                "alert_type": "printer_repair",
+                "alert_id": "printer_repair_1",
+                "state_data": {"id": 1, "status": "Under Repair"},
+            },
+            format="json",
+        )
+        dismissal = AlertDismissal.objects.get(alert_id="printer_repair_1")
+        assert dismissal.state_json == '{"id": 1, "status": "Under Repair"}'
+
+    def test_dismissed_alert_stays_hidden(self, api_client):
+        printer = PrinterFactory(status="Under Repair")
+        alert_id = f"printer_repair_{printer.id}"
+        api_client.post(
+            "/api/alerts/dismiss/",
+            {
+                "alert_type": "printer_repair",
+                "alert_id": alert_id,
+                "state_data": {"id": printer.id, "status": "Under Repair"},
+            },
+            format="json",
+        )
+        assert alert_id not in self._repair_alert_ids(api_client)
+
+    def test_legacy_hash_only_dismissal_still_matches(self, api_client):
+        printer = PrinterFactory(status="Under Repair")
+        alert_id = f"printer_repair_{printer.id}"
+        AlertDismissal.objects.create(
+            alert_type="printer_repair",
+            alert_id=alert_id,
+            state_hash=DashboardDataView()._generate_state_hash(
+                "printer_repair", {"id": printer.id, "status": "Under Repair"}
+            ),
+        )
+        assert alert_id not in self._repair_alert_ids(api_client)
+        assert AlertDismissal.objects.get(alert_id=alert_id).state_json == (
+            f'{{"id": {printer.id}, "status": "Under Repair"}}'
+        )
+
+    def test_stale_dismissals_are_cleaned_up(self, api_client):
+        active = PrinterFactory(status="Active")
+        repair = PrinterFactory(status="Under Repair")
+        AlertDismissal.objects.create(alert_type="printer_repair", alert_id=f"printer_repair_{active.id}", state_hash="x")
+        AlertDismissal.objects.create(
+            alert_type="printer_repair",
+            alert_id=f"printer_repair_{repair.id}",
+            state_hash=DashboardDataView()._generate_state_hash(
+                "printer_repair", {"id": repair.id, "status": "Under Repair"}
+            ),
+        )
+        AlertDismissal.objects.create(alert_type="low_stock", alert_id="low_stock_not-a-number", state_hash="x")
+        AlertDismissal.objects.create(alert_type="custom", alert_id="custom_1", state_hash="x")
+
+        api_client.get("/api/dashboard/")
+
+        remaining = set(AlertDismissal.objects.values_list("alert_id", flat=True))
+        assert remaining == {f"printer_repair_{repair.id}", "custom_1"}
+
+    def test_due_soon_dismissal_lapses_when_due_date_moves(self, api_client):
+        due = date.today() + timedelta(days=3)
+        project = ProjectFactory(status="Planning", due_date=due)
+        alert_id = f"project_due_soon_{project.id}"
+        api_client.post(
+            "/api/alerts/dismiss/",
+            {
+                "alert_type": "project_due_soon",
+                "alert_id": alert_id,
+                "state_data": {"id": project.id, "due_date": due.isoformat()},
+            },
+            format="json",
+        )
+        resp = api_client.get("/api/dashboard/")
+        assert alert_id not in [a["alert_id"] for a in resp.data["alerts"]["warning"]]
+
+        project.due_date = due + timedelta(days=1)
+        project.save()
+
+        resp = api_client.get("/api/dashboard/")
+        assert alert_id in [a["alert_id"] for a in resp.data["alerts"]["warning"]]
+        assert not AlertDismissal.objects.filter(alert_id=alert_id).exists()
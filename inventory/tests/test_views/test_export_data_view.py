@@ -7,7 +7,10 @@ Uses defensive error handling so partial failures don't break the export.
 """
 import csv
 import io
+import os
 import zipfile
+from unittest import mock
+
 import pytest
 from rest_framework.test import APIClient
 
@@ -17,7 +20,7 @@ from inventory.tests.factories import (
     ModFactory,
     TrackerFactory,
 )
-from inventory.models import InventoryItem, Brand, PartType, Location, Tracker
+from inventory.models import InventoryItem, Brand, PartType, Location, Mod, Printer, Project, Tracker, Vendor
 
 
 URL = "/api/export/data/"
@@ -110,6 +113,36 @@ class TestExportDataViewZipContents:
         assert 'EXPORT_ERRORS.txt' not in zf.namelist()
 
 
+# ---------------------------------------------------------------------------
+# TestExportDataViewMedia
+# ---------------------------------------------------------------------------
+
+@pytest.mark.django_db
+class TestExportDataViewMedia:
+    def _get_zip(self, client):
+        response = client.get(URL)
+        return zipfile.ZipFile(io.BytesIO(response.content), 'r')
+
+    def test_media_files_are_included(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        (tmp_path / 'printer_photos').mkdir()
+        (tmp_path / 'printer_photos' / 'photo.jpg').write_bytes(b'\xff\xd8jpeg-bytes')
+        zf = self._get_zip(client)
+        assert zf.read('printer_photos/photo.jpg') == b'\xff\xd8jpeg-bytes'
+
+    def test_precompressed_media_is_stored(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        (tmp_path / 'photo.JPG').write_bytes(b'jpeg' * 100)
+        zf = self._get_zip(client)
+        assert zf.getinfo('photo.JPG').compress_type == zipfile.ZIP_STORED
+
+    def test_other_media_is_deflated(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        (tmp_path / 'model.stl').write_text('solid cube\n' * 100)
+        zf = self._get_zip(client)
+        assert zf.getinfo('model.stl').compress_type == zipfile.ZIP_DEFLATED
+
+
 # ---------------------------------------------------------------------------
 # TestExportDataViewCSVContent
 # ---------------------------------------------------------------------------
@@ -136,6 +169,11 @@ class TestExportDataViewCSVContent:
         csv_content = self._get_csv(client, 'printers.csv')
         assert 'Test Export Printer' in csv_content
 
+    def test_printers_csv_exports_photo_as_bare_filename(self, client):
+        PrinterFactory(title="Photo Printer", photo="printer_photos/front.jpg")
+        rows = list(csv.DictReader(io.StringIO(self._get_csv(client, 'printers.csv'))))
+        assert [row['photo'] for row in rows] == ['front.jpg']
+
     def test_projects_csv_has_header_row(self, client):
         csv_content = self._get_csv(client, 'projects.csv')
         assert 'id' in csv_content
@@ -239,3 +277,195 @@ class TestTrackerSettingsExportImport:
         tracker = Tracker.objects.get(name='Legacy Tracker')
         assert tracker.generate_thumbnails_for_linked_files is False
         assert tracker.viewer_background == 'dark'
+
+
+# ---------------------------------------------------------------------------
+# TestImportDataView
+#
+# Rows are inserted with bulk_create; a batch the database rejects falls back
+# to row-by-row inserts so errors are still reported per row.
+# ---------------------------------------------------------------------------
+
+IMPORT_URL = '/api/import-data/'
+
+
+def _backup(files):
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    zip_buffer.seek(0)
+    zip_buffer.name = 'backup.zip'
+    return zip_buffer
+
+
+@pytest.mark.django_db
+class TestImportDataView:
+    def test_round_trip_restores_rows(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        project = ProjectFactory(project_name="Restored Project")
+        printer = PrinterFactory(title="Restored Printer")
+        project.associated_printers.add(printer)
+
+        backup = io.BytesIO(client.get(URL).content)
+        backup.name = 'backup.zip'
+        response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 200
+        assert 'errors' not in response.data
+        restored = Project.objects.get(project_name="Restored Project")
+        assert list(restored.associated_printers.values_list('title', flat=True)) == ["Restored Printer"]
+        assert Printer.objects.get(title="Restored Printer").manufacturer.name == printer.manufacturer.name
+
+    def test_rejected_row_is_reported_on_its_own(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        backup = _backup({'printers.csv': 'id,title\n1,First\n1,Duplicate\n2,Second\n'})
+
+        response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 200
+        assert response.data['errors'] == ['printer_1']
+        assert sorted(Printer.objects.values_list('title', flat=True)) == ['First', 'Second']
+
+    def test_lookup_names_resolve_to_shared_rows(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        vendor = Vendor.objects.create(name="Parts Co")
+        backup = _backup({
+            'inventory.csv': (
+                'id,title,brand,part_type,location,vendor,quantity,cost\n'
+                '1,Nozzle,Acme,Hotend,Drawer,Parts Co,2,\n'
+                '2,Belt,Acme,Motion,,,1,\n'
+            ),
+            'printers.csv': 'id,title,manufacturer\n1,Printer,Acme\n',
+        })
+
+        response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 200
+        assert Brand.objects.filter(name="Acme").count() == 1
+        nozzle = InventoryItem.objects.get(pk=1)
+        assert (nozzle.brand.name, nozzle.part_type.name, nozzle.location.name) == ("Acme", "Hotend", "Drawer")
+        assert nozzle.vendor == vendor
+        assert InventoryItem.objects.get(pk=2).location is None
+        assert Printer.objects.get(pk=1).manufacturer == nozzle.brand
+
+    def test_media_files_are_extracted(self, client, settings, tmp_path, django_capture_on_commit_callbacks):
+        settings.MEDIA_ROOT = str(tmp_path)
+        payload = b'solid part\n' * 50000
+        backup = _backup({'trackers/1/files/part.stl': payload, 'stray/file.txt': b'ignored'})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 200
+        assert (tmp_path / 'trackers' / '1' / 'files' / 'part.stl').read_bytes() == payload
+        assert not (tmp_path / 'stray').exists()
+
+    def test_failed_restore_keeps_existing_data(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        PrinterFactory(title="Existing Printer")
+        (tmp_path / 'printer_photos').mkdir()
+        (tmp_path / 'printer_photos' / 'existing.jpg').write_bytes(b'photo')
+        backup = io.BytesIO(b'not a zip archive')
+        backup.name = 'backup.zip'
+
+        response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 500
+        assert Printer.objects.filter(title="Existing Printer").exists()
+        assert (tmp_path / 'printer_photos' / 'existing.jpg').read_bytes() == b'photo'
+
+    def test_rolled_back_restore_keeps_existing_media(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        PrinterFactory(title="Existing Printer")
+        (tmp_path / 'printer_photos').mkdir()
+        (tmp_path / 'printer_photos' / 'existing.jpg').write_bytes(b'photo')
+        backup = _backup({'printers.csv': 'id,title\n1,Restored\n', 'printer_photos/new.jpg': b'new'})
+
+        with mock.patch('inventory.views._extract_backup_media', side_effect=OSError('No space left on device')):
+            response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 500
+        assert list(Printer.objects.values_list('title', flat=True)) == ["Existing Printer"]
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['printer_photos']
+        assert (tmp_path / 'printer_photos' / 'existing.jpg').read_bytes() == b'photo'
+
+    def test_multiline_and_non_ascii_fields_survive(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        backup = _backup({
+            'projects.csv': 'id,project_name,notes\r\n1,Café,"first line\r\nsecond line"\r\n',
+            'mods.csv': '',
+        })
+
+        response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 200
+        assert 'errors' not in response.data
+        project = Project.objects.get(pk=1)
+        assert project.project_name == 'Café'
+        assert project.notes == 'first line\r\nsecond line'
+
+    def test_existing_media_folders_are_cleared(self, client, settings, tmp_path, django_capture_on_commit_callbacks):
+        settings.MEDIA_ROOT = str(tmp_path)
+        (tmp_path / 'printer_photos' / 'nested').mkdir(parents=True)
+        (tmp_path / 'printer_photos' / 'nested' / 'old.jpg').write_bytes(b'old')
+        (tmp_path / 'trackers').mkdir()
+        (tmp_path / 'keep.txt').write_text('top-level files are left alone')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(IMPORT_URL, {'backup_file': _backup({})}, format='multipart')
+
+        assert response.status_code == 200
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['keep.txt']
+
+    def test_committed_restore_clears_cached_download_zips(
+        self, client, settings, tmp_path, django_capture_on_commit_callbacks
+    ):
+        settings.MEDIA_ROOT = str(tmp_path)
+        for cache_dir in (settings.MOD_ZIP_CACHE_DIR, settings.TRACKER_ZIP_CACHE_DIR):
+            open(os.path.join(cache_dir, '1-abc.zip'), 'wb').close()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(IMPORT_URL, {'backup_file': _backup({})}, format='multipart')
+
+        assert response.status_code == 200
+        assert os.listdir(settings.MOD_ZIP_CACHE_DIR) == os.listdir(settings.TRACKER_ZIP_CACHE_DIR) == []
+
+    def test_tracker_files_refresh_tracker_totals(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        backup = _backup({
+            'trackers.csv': 'id,name,total_quantity,printed_quantity_total,progress_percentage\n1,Imported,0,0,0\n',
+            'tracker_files.csv': (
+                'id,tracker_id,filename,storage_type,quantity,printed_quantity\n'
+                '1,1,part.stl,local,3,3\n'
+                '2,1,notes.txt,local,1,0\n'
+            ),
+        })
+
+        with mock.patch('django_q.tasks.async_task') as mock_async_task:
+            response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 200
+        tracker = Tracker.objects.get(pk=1)
+        assert (tracker.total_quantity, tracker.printed_quantity_total, tracker.progress_percentage) == (4, 3, 75)
+        mock_async_task.assert_called_once_with('inventory.tasks.generate_auto_thumbnail_task', 1)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestImportDataViewForeignKeys:
+    """Foreign keys are only checked at COMMIT, so these run against real commits."""
+
+    def test_orphan_row_is_reported_without_failing_the_restore(self, client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        backup = _backup({
+            'printers.csv': 'id,title\n1,Printer\n',
+            'mods.csv': 'id,printer_id,name,link,status\n1,1,Kept,,Planned\n2,99,Orphan,,Planned\n',
+            'modfiles.csv': 'id,mod_id,file\n1,2,\n',
+        })
+
+        response = client.post(IMPORT_URL, {'backup_file': backup}, format='multipart')
+
+        assert response.status_code == 200
+        assert response.data['errors'] == ['mod_2', 'modfile_1']
+        assert list(Mod.objects.values_list('name', flat=True)) == ['Kept']
+        assert Printer.objects.get(pk=1).title == 'Printer'
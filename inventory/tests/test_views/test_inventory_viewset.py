@@ -8,12 +8,14 @@ import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 from inventory.models import InventoryItem
+from inventory.views import InventoryItemViewSet
 from inventory.tests.factories import (
     InventoryItemFactory, 
     BrandFactory, 
     PartTypeFactory, 
     LocationFactory,
-    ProjectFactory
+    ProjectFactory,
+    VendorFactory
 )
 
 
@@ -185,6 +187,17 @@ class TestInventoryItemFiltering:
         assert response.status_code == status.HTTP_200_OK
         assert all(item['location']['name'] == location.name for item in response.data)
 
+    def test_unfiltered_list_skips_filterset(self, api_client, sample_inventory_items, monkeypatch):
+        """Test a list without filter params never builds the FilterSet."""
+        def fail(*args, **kwargs):
+            raise AssertionError('FilterSet built for an unfiltered list')
+        monkeypatch.setattr('inventory.filters.InventoryItemFilter.__init__', fail)
+
+        response = api_client.get('/api/inventoryitems/', {'search': 'Brass'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) >= 1
+
 
 # ============================================================================
 # SEARCH TESTS
@@ -211,6 +224,38 @@ class TestInventoryItemSearch:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
 
+    def test_search_terms_combine_across_fields(self, api_client, sample_inventory_items):
+        """Test every term must match, each in any of the search fields."""
+        url = '/api/inventoryitems/'
+        response = api_client.get(url, {'search': 'Prusa Steel'})
+
+        assert [item['title'] for item in response.data] == ['Steel Nozzle 0.6mm']
+
+    def test_search_with_no_related_match(self, api_client, sample_inventory_items):
+        """Test a term matching no brand, part type or location still searches titles."""
+        url = '/api/inventoryitems/'
+        response = api_client.get(url, {'search': '0.4mm'})
+
+        assert [item['title'] for item in response.data] == ['Brass Nozzle 0.4mm']
+        assert api_client.get(url, {'search': 'NoSuchThing'}).data == []
+
+    def test_search_field_with_lookup_prefix(self, api_client, sample_inventory_items, monkeypatch):
+        """Test a prefixed related field is left to the stock SearchFilter."""
+        monkeypatch.setattr(InventoryItemViewSet, 'search_fields', ['title', '^brand__name'])
+        response = api_client.get('/api/inventoryitems/', {'search': 'Crea'})
+
+        assert [item['title'] for item in response.data] == ['V6 Hot End']
+
+    def test_search_many_to_many_field_is_distinct(self, api_client, sample_inventory_items, monkeypatch):
+        """Test an item matched through two projects is listed once."""
+        item = sample_inventory_items['items'][0]
+        for name in ('Build A', 'Build B'):
+            ProjectFactory(project_name=name).associated_inventory_items.add(item)
+        monkeypatch.setattr(InventoryItemViewSet, 'search_fields', ['title', 'associated_projects__project_name'])
+        response = api_client.get('/api/inventoryitems/', {'search': 'Build'})
+
+        assert [row['id'] for row in response.data] == [item.id]
+
 
 # ============================================================================
 # ORDERING TESTS
@@ -267,6 +312,28 @@ class TestLowStockItems:
         for item in response.data:
             assert item['is_consumable'] is True
 
+    def test_low_stock_follows_quantity_changes(self, api_client, db):
+        """is_low_stock is computed by the database on every write."""
+        item = InventoryItemFactory(is_consumable=True, quantity=20, low_stock_threshold=5)
+        InventoryItemFactory(is_consumable=True, quantity=0, low_stock_threshold=None)
+
+        assert api_client.get('/api/low-stock/').data == []
+
+        InventoryItem.objects.filter(pk=item.pk).update(quantity=5)
+        response = api_client.get('/api/low-stock/')
+
+        assert [row['id'] for row in response.data] == [item.id]
+
+    def test_low_stock_query_count_does_not_grow_with_items(self, api_client, db, assert_constant_queries):
+        """Serializer relations are joined or prefetched, not fetched per item."""
+        def add_item():
+            item = InventoryItemFactory(
+                is_consumable=True, quantity=1, low_stock_threshold=5, vendor=VendorFactory(),
+            )
+            item.associated_projects.add(ProjectFactory())
+
+        assert_constant_queries(api_client, '/api/low-stock/', add_item)
+
 
 # ============================================================================
 # PROJECT ASSOCIATION TESTS
@@ -303,3 +370,57 @@ class TestInventoryItemProjectAssociation:
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['associated_projects']) == 2
+
+
+# ============================================================================
+# LIST QUERY TESTS
+# ============================================================================
+
+@pytest.mark.django_db
+class TestInventoryItemListQueries:
+    """The list endpoint's query count must not grow with the number of items."""
+
+    def test_query_count_does_not_grow_with_items(self, api_client, assert_constant_queries):
+        def add_item():
+            item = InventoryItemFactory(vendor=VendorFactory())
+            item.associated_projects.add(ProjectFactory())
+
+        assert_constant_queries(api_client, '/api/inventoryitems/', add_item)
+
+    def test_list_includes_vendor_and_project_names(self, api_client):
+        vendor = VendorFactory(name="Amazon")
+        project = ProjectFactory(project_name="Voron 2.4")
+        item = InventoryItemFactory(vendor=vendor)
+        item.associated_projects.add(project)
+
+        response = api_client.get('/api/inventoryitems/')
+
+        row = next(r for r in response.data if r['id'] == item.id)
+        assert row['vendor'] == {'id': vendor.id, 'name': 'Amazon'}
+        assert row['associated_projects'] == [{'id': project.id, 'project_name': 'Voron 2.4'}]
+
+
+# ============================================================================
+# PAGINATION TESTS
+# ============================================================================
+
+@pytest.mark.django_db
+class TestInventoryItemPagination:
+    """Paging is opt-in through ?limit=; plain requests still get a list."""
+
+    def test_limit_pages_the_list(self, api_client):
+        for title in ("Bolt", "Nut", "Washer"):
+            InventoryItemFactory(title=title)
+
+        response = api_client.get('/api/inventoryitems/', {'limit': 2, 'offset': 1})
+
+        assert response.data['count'] == 3
+        assert [row['title'] for row in response.data['results']] == ["Nut", "Washer"]
+
+    def test_list_without_limit_is_unpaged(self, api_client):
+        InventoryItemFactory.create_batch(3)
+
+        response = api_client.get('/api/inventoryitems/')
+
+        assert isinstance(response.data, list)
+        assert len(response.data) == 3
@@ -4,9 +4,18 @@ Tests for ModViewSet — /api/mods/
 ModViewSet is a full ModelViewSet for Mod objects (printer modifications).
 Each Mod belongs to a Printer and has: name, link (optional), status.
 """
+import io
+import os
+import zipfile
+import zlib
+from unittest import mock
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APIClient
 
+from inventory.models import ModFile
+from inventory.services.zip_archives import ZIP_WHOLE_FILE_LIMIT, _zip_compression
 from inventory.tests.factories import ModFactory, PrinterFactory
 
 
@@ -187,6 +196,209 @@ class TestModViewSetDelete:
         assert response.status_code == 404
 
 
+# ---------------------------------------------------------------------------
+# TestModDownloadFiles
+# ---------------------------------------------------------------------------
+
+def _add_file(mod, name, content):
+    return ModFile.objects.create(mod=mod, file=SimpleUploadedFile(name, content))
+
+
+def _download(client, mod):
+    response = client.get(f"{URL}{mod.id}/download-files/")
+    return response, b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+class TestModDownloadFiles:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path / "media")
+        settings.MOD_ZIP_CACHE_DIR = str(tmp_path / "zip_cache")
+
+    def test_mod_without_files_returns_404(self, client, printer):
+        mod = ModFactory(printer=printer)
+        response = client.get(f"{URL}{mod.id}/download-files/")
+        assert response.status_code == 404
+
+    def test_streams_zip_of_all_files(self, client, printer):
+        mod = ModFactory(printer=printer, name="Fan Duct")
+        _add_file(mod, "duct.stl", b"solid duct\n" * 1000)
+        _add_file(mod, "notes.txt", b"print at 0.2mm")
+
+        response, body = _download(client, mod)
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Disposition"] == "attachment; filename=Fan Duct_files.zip"
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert sorted(zf.namelist()) == ["duct.stl", "notes.txt"]
+            assert zf.read("duct.stl") == b"solid duct\n" * 1000
+
+    def test_parallel_deflated_entries_keep_file_order(self, client, printer):
+        mod = ModFactory(printer=printer)
+        names = [f"part_{i}.stl" for i in range(8)]
+        for name in names:
+            _add_file(mod, name, f"solid {name}\n".encode() * 500)
+
+        _, body = _download(client, mod)
+
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert zf.namelist() == names
+            assert zf.testzip() is None
+
+    def test_files_over_whole_file_limit_are_streamed(self, client, printer, monkeypatch):
+        monkeypatch.setattr("inventory.services.zip_archives.ZIP_WHOLE_FILE_LIMIT", 1024)
+        mod = ModFactory(printer=printer)
+        content = b"G1 X10 Y10\n" * 20000
+        _add_file(mod, "part.gcode", content)
+
+        _, body = _download(client, mod)
+
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert zf.read("part.gcode") == content
+
+    def test_single_compressed_file_is_served_directly(self, client, printer):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "bracket.3mf", b"PK\x03\x04 3mf payload")
+
+        response, body = _download(client, mod)
+
+        assert response.status_code == 200
+        assert "bracket.3mf" in response["Content-Disposition"]
+        assert body == b"PK\x03\x04 3mf payload"
+
+    def test_compressed_files_are_stored_in_bundle(self, client, printer):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "bracket.3mf", b"3mf payload")
+        _add_file(mod, "bracket.stl", b"solid bracket")
+
+        _, body = _download(client, mod)
+
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert zf.getinfo("bracket.3mf").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("bracket.stl").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_saving_a_file_caches_its_deflated_copy(self, printer):
+        mod = ModFactory(printer=printer)
+        content = b"solid cached\n" * 100
+        mod_file = _add_file(mod, "cached.stl", content)
+
+        mod_file.refresh_from_db()
+        assert mod_file.deflate_crc32 == zlib.crc32(content)
+        assert mod_file.deflate_source_size == len(content)
+        with open(mod_file.file.path + ".deflate", "rb") as f:
+            assert zlib.decompress(f.read(), -15) == content
+
+    def test_download_reuses_cached_deflate(self, client, printer):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "a.stl", b"solid a\n" * 100)
+        _add_file(mod, "b.stl", b"solid b\n" * 100)
+
+        with mock.patch("inventory.services.zip_archives.deflate_file") as mock_deflate:
+            _, body = _download(client, mod)
+
+        mock_deflate.assert_not_called()
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert zf.read("b.stl") == b"solid b\n" * 100
+
+    def test_stale_cache_is_ignored(self, client, printer):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "a.stl", b"solid a")
+        mod_file = _add_file(mod, "b.stl", b"solid b")
+        with open(mod_file.file.path, "wb") as f:
+            f.write(b"solid b, edited on disk")
+
+        _, body = _download(client, mod)
+
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert zf.read("b.stl") == b"solid b, edited on disk"
+
+    def test_deleting_a_file_removes_its_cache(self, printer):
+        mod_file = _add_file(ModFactory(printer=printer), "gone.stl", b"solid gone")
+        cache_path = mod_file.file.path + ".deflate"
+
+        mod_file.delete()
+
+        assert not os.path.exists(cache_path)
+
+    def test_unchanged_download_returns_304(self, client, printer):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "a.stl", b"solid a")
+        response, _ = _download(client, mod)
+
+        repeat = client.get(f"{URL}{mod.id}/download-files/", HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert repeat.status_code == 304
+
+    def test_etag_changes_when_files_change(self, client, printer):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "a.stl", b"solid a")
+        first, _ = _download(client, mod)
+
+        _add_file(mod, "b.stl", b"solid b")
+        repeat = client.get(f"{URL}{mod.id}/download-files/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert repeat.status_code == 200
+        assert repeat["ETag"] != first["ETag"]
+        assert "Last-Modified" in repeat
+
+    def test_repeat_download_is_served_from_zip_cache(self, client, printer, settings):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "a.stl", b"solid a")
+        _add_file(mod, "b.stl", b"solid b")
+        _, first = _download(client, mod)
+        assert len(os.listdir(settings.MOD_ZIP_CACHE_DIR)) == 1
+
+        with mock.patch("inventory.views.stream_zip") as mock_stream:
+            _, repeat = _download(client, mod)
+
+        mock_stream.assert_not_called()
+        assert repeat == first
+
+    def test_changed_files_replace_the_cached_zip(self, client, printer, settings):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "a.stl", b"solid a")
+        _add_file(mod, "b.stl", b"solid b")
+        _download(client, mod)
+
+        _add_file(mod, "c.stl", b"solid c")
+        response, _ = _download(client, mod)
+
+        digest = response["ETag"].strip('"')
+        assert os.listdir(settings.MOD_ZIP_CACHE_DIR) == [f"{mod.pk}-{digest}.zip"]
+
+    def test_zip_cache_is_trimmed_after_each_write(self, client, printer, settings):
+        settings.MOD_ZIP_CACHE_MAX_BYTES = 1
+        first, second = ModFactory(printer=printer), ModFactory(printer=printer)
+        for mod in (first, second):
+            _add_file(mod, "a.stl", b"solid a")
+            _add_file(mod, "b.stl", b"solid b")
+            _download(client, mod)
+
+        assert [name.split("-", 1)[0] for name in os.listdir(settings.MOD_ZIP_CACHE_DIR)] == [str(second.pk)]
+
+    def test_files_missing_on_disk_are_skipped(self, client, printer):
+        mod = ModFactory(printer=printer)
+        _add_file(mod, "kept.stl", b"solid kept")
+        gone = _add_file(mod, "gone.stl", b"solid gone")
+        os.remove(gone.file.path)
+
+        _, body = _download(client, mod)
+
+        with zipfile.ZipFile(io.BytesIO(body)) as zf:
+            assert zf.namelist() == ["kept.stl"]
+
+
+@pytest.mark.parametrize("path, size, expected", [
+    ("part.3mf", 100, (zipfile.ZIP_STORED, None)),
+    ("part.STL", 100, (zipfile.ZIP_DEFLATED, 6)),
+    ("part.gcode", ZIP_WHOLE_FILE_LIMIT + 1, (zipfile.ZIP_DEFLATED, 1)),
+])
+def test_zip_compression_profile(path, size, expected):
+    assert _zip_compression(path, size) == expected
+
+
 # ---------------------------------------------------------------------------
 # TestModStatusChoices
 # ---------------------------------------------------------------------------
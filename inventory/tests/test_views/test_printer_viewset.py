@@ -14,8 +14,8 @@ Covers:
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
-from inventory.models import Printer
-from inventory.tests.factories import PrinterFactory, BrandFactory
+from inventory.models import ModFile, Printer
+from inventory.tests.factories import ModFactory, PrinterFactory, BrandFactory, ProjectFactory
 
 
 URL = "/api/printers/"
@@ -61,6 +61,27 @@ class TestPrinterViewSetList:
         titles = [p["title"] for p in resp.data]
         assert titles == sorted(titles)
 
+    def test_list_includes_associated_project_ids(self, api_client, db):
+        printer = PrinterFactory()
+        projects = [ProjectFactory(), ProjectFactory()]
+        printer.associated_projects.add(*projects)
+
+        resp = api_client.get(URL)
+
+        row = next(p for p in resp.data if p["id"] == printer.id)
+        assert row["associated_projects"] == sorted(p.id for p in projects)
+
+    def test_query_count_does_not_grow_with_printers(self, api_client, settings, tmp_path, assert_constant_queries):
+        settings.MEDIA_ROOT = str(tmp_path)
+
+        def add_printer():
+            printer = PrinterFactory()
+            mod = ModFactory(printer=printer)
+            ModFile.objects.create(mod=mod, file=f"mod_files/{mod.id}/part.stl")
+            printer.associated_projects.add(ProjectFactory())
+
+        assert_constant_queries(api_client, URL, add_printer)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CREATE
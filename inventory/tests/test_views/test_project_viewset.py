@@ -58,6 +58,16 @@ class TestProjectList:
         response = api_client.get('/api/projects/')
         assert response.data == []
 
+    def test_list_query_count_does_not_grow_with_projects(self, db, api_client, assert_constant_queries):
+        """Nested items, printers and BOM rows are prefetched, not fetched per project."""
+        def add_project():
+            project = ProjectFactory()
+            project.associated_inventory_items.add(InventoryItemFactory())
+            project.associated_printers.add(PrinterFactory())
+            ProjectBOMItemFactory(project=project)
+
+        assert_constant_queries(api_client, '/api/projects/', add_project)
+
 
 # ============================================================================
 # CREATE
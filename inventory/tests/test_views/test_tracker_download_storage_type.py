@@ -18,10 +18,11 @@ Mirrors the mocking convention in
 test_serializers/test_download_logic.py (mock StorageManager +
 FileDownloadService, call the private download method directly).
 """
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 
+from inventory.models import Tracker, TrackerFile
 from inventory.tests.factories import TrackerFactory, TrackerFileFactory
 from inventory.views import TrackerViewSet
 
@@ -30,13 +31,13 @@ from inventory.views import TrackerViewSet
 class TestDownloadTrackerFilesForManualStorageType:
     @patch('inventory.views.StorageManager')
     @patch('inventory.views.FileDownloadService')
-    def test_successful_download_sets_storage_type_local(self, mock_download_service_class, mock_storage_manager_class):
+    def test_successful_download_sets_storage_type_local(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
         tracker = TrackerFactory(storage_type='local')
         tracker_file = TrackerFileFactory(
             tracker=tracker, filename='part.stl', file_size=1000, directory_path='test'
         )
 
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {'sufficient': True}
         mock_storage.get_tracker_storage_path.return_value = '/media/trackers/1'
         mock_storage.get_category_path.return_value = '/media/trackers/1/files/test'
@@ -63,7 +64,7 @@ class TestDownloadTrackerFilesForManualStorageType:
 
     @patch('inventory.views.StorageManager')
     @patch('inventory.views.FileDownloadService')
-    def test_failed_download_leaves_storage_type_as_link(self, mock_download_service_class, mock_storage_manager_class):
+    def test_failed_download_leaves_storage_type_as_link(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
         tracker = TrackerFactory(storage_type='local')
         # Pin storage_type='link': these files represent the pre-download
         # state (matching TrackerFile's model default). TrackerFileFactory
@@ -75,7 +76,7 @@ class TestDownloadTrackerFilesForManualStorageType:
             storage_type='link'
         )
 
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {'sufficient': True}
         mock_storage.get_tracker_storage_path.return_value = '/media/trackers/1'
         mock_storage.get_category_path.return_value = '/media/trackers/1/files/test'
@@ -95,18 +96,61 @@ class TestDownloadTrackerFilesForManualStorageType:
         assert tracker_file.storage_type == 'link'
         assert tracker_file.download_status == 'failed'
 
+    @patch('django_q.tasks.async_task')
+    @patch('inventory.views.StorageManager')
+    @patch('inventory.views.FileDownloadService')
+    def test_successful_download_queues_auto_thumbnail(self, mock_download_service_class, mock_storage_manager_class, mock_async_task,
+                                                        mock_storage_for):
+        # Results are written with bulk_update, which sends no post_save, so
+        # the thumbnail the save signal used to queue is queued explicitly.
+        tracker = TrackerFactory(storage_type='local')
+        tracker_file = TrackerFileFactory(
+            tracker=tracker, filename='part.stl', file_size=1000, directory_path='test',
+            storage_type='link'
+        )
+        mock_async_task.reset_mock()
+
+        mock_storage = mock_storage_for(mock_storage_manager_class)
+        mock_storage.check_available_space.return_value = {'sufficient': True}
+        mock_storage.get_tracker_storage_path.return_value = '/media/trackers/1'
+        mock_storage.get_category_path.return_value = '/media/trackers/1/files/test'
+        mock_storage.sanitize_filename.side_effect = lambda x: x
+
+        mock_download = mock_download_service_class.return_value
+        mock_download.download_files_batch.return_value = {
+            'successful': [{
+                'tracker_file_id': tracker_file.id,
+                'checksum': 'abc123',
+                'bytes_downloaded': 1000,
+                'duration': 1.0,
+            }],
+            'failed': [],
+            'duration': 1.0,
+        }
+
+        viewset = TrackerViewSet()
+        viewset._download_tracker_files_for_manual(tracker, [tracker_file])
+
+        tracker_file.refresh_from_db()
+        assert tracker_file.local_file.name == f'trackers/{tracker.id}/files/test/part.stl'
+        # Every file is now local, so the download-files ZIP is queued too
+        assert mock_async_task.call_args_list == [
+            call('inventory.tasks.generate_auto_thumbnail_task', tracker_file.id),
+            call('inventory.tasks.build_tracker_zip_task', tracker.id),
+        ]
+
 
 @pytest.mark.django_db
 class TestDownloadNewFilesStorageType:
     @patch('inventory.views.StorageManager')
     @patch('inventory.views.FileDownloadService')
-    def test_successful_download_sets_storage_type_local(self, mock_download_service_class, mock_storage_manager_class):
+    def test_successful_download_sets_storage_type_local(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
         tracker = TrackerFactory(storage_type='local')
         tracker_file = TrackerFileFactory(
             tracker=tracker, filename='part.stl', file_size=1000, directory_path='test'
         )
 
-        mock_storage = mock_storage_manager_class.return_value
+        mock_storage = mock_storage_for(mock_storage_manager_class)
         mock_storage.check_available_space.return_value = {'sufficient': True}
         mock_storage.get_tracker_storage_path.return_value = '/media/trackers/1'
         mock_storage.get_category_path.return_value = '/media/trackers/1/files/test'
@@ -130,3 +174,81 @@ class TestDownloadNewFilesStorageType:
         tracker_file.refresh_from_db()
         assert tracker_file.storage_type == 'local'
         assert tracker_file.download_status == 'completed'
+
+    @patch('inventory.views.StorageManager')
+    @patch('inventory.views.FileDownloadService')
+    def test_failures_are_written_per_error(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
+        tracker = TrackerFactory(storage_type='local')
+        timeouts = TrackerFileFactory.create_batch(2, tracker=tracker, file_size=1000)
+        not_found = TrackerFileFactory(tracker=tracker, file_size=1000)
+
+        mock_storage = mock_storage_for(mock_storage_manager_class)
+        mock_storage.check_available_space.return_value = {'sufficient': True}
+        mock_storage.sanitize_filename.side_effect = lambda x: x
+
+        mock_download = mock_download_service_class.return_value
+        mock_download.download_files_batch.return_value = {
+            'successful': [],
+            'failed': [
+                *({'tracker_file_id': tf.id, 'error': 'Timed out'} for tf in timeouts),
+                {'tracker_file_id': not_found.id, 'error': 'HTTP error 404'},
+            ],
+            'duration': 1.0,
+        }
+
+        viewset = TrackerViewSet()
+        results = viewset._download_new_files(tracker, [*timeouts, not_found])
+
+        assert len(results['failed']) == 3
+        assert dict(TrackerFile.objects.filter(tracker=tracker).values_list('id', 'download_error')) == {
+            timeouts[0].id: 'Timed out', timeouts[1].id: 'Timed out', not_found.id: 'HTTP error 404',
+        }
+        assert set(TrackerFile.objects.filter(tracker=tracker).values_list('download_status', flat=True)) == {'failed'}
+
+    @pytest.mark.parametrize('older_status, expected', [('completed', True), ('failed', False)])
+    @patch('inventory.views.StorageManager')
+    @patch('inventory.views.FileDownloadService')
+    def test_files_downloaded_reflects_older_files(self, mock_download_service_class, mock_storage_manager_class,
+                                                   older_status, expected, mock_storage_for):
+        tracker = TrackerFactory(storage_type='local', files_downloaded=False)
+        TrackerFileFactory(tracker=tracker, download_status=older_status)
+        tracker_file = TrackerFileFactory(tracker=tracker, file_size=1000)
+
+        mock_storage = mock_storage_for(mock_storage_manager_class)
+        mock_storage.check_available_space.return_value = {'sufficient': True}
+        mock_storage.sanitize_filename.side_effect = lambda x: x
+
+        mock_download = mock_download_service_class.return_value
+        mock_download.download_files_batch.return_value = {
+            'successful': [{'tracker_file_id': tracker_file.id, 'checksum': 'abc123', 'bytes_downloaded': 1000}],
+            'failed': [],
+            'duration': 1.0,
+        }
+
+        TrackerViewSet()._download_new_files(tracker, [tracker_file])
+
+        tracker.refresh_from_db()
+        assert tracker.files_downloaded is expected
+
+    @patch('inventory.views.StorageManager')
+    @patch('inventory.views.FileDownloadService')
+    def test_results_are_written_in_one_transaction(self, mock_download_service_class, mock_storage_manager_class, mock_storage_for):
+        tracker = TrackerFactory(storage_type='local', storage_path='/media/trackers/1')
+        tracker_file = TrackerFileFactory(tracker=tracker, file_size=1000)
+
+        mock_storage = mock_storage_for(mock_storage_manager_class)
+        mock_storage.check_available_space.return_value = {'sufficient': True}
+        mock_storage.sanitize_filename.side_effect = lambda x: x
+
+        mock_download = mock_download_service_class.return_value
+        mock_download.download_files_batch.return_value = {
+            'successful': [{'tracker_file_id': tracker_file.id, 'checksum': 'abc123', 'bytes_downloaded': 1000}],
+            'failed': [],
+            'duration': 1.0,
+        }
+
+        with patch.object(Tracker, 'save', side_effect=RuntimeError), pytest.raises(RuntimeError):
+            TrackerViewSet()._download_new_files(tracker, [tracker_file])
+
+        tracker_file.refresh_from_db()
+        assert tracker_file.download_status == 'downloading'
@@ -3,12 +3,26 @@ Tests for Tracker ViewSet API endpoints.
 
 Tests CRUD operations, custom actions, GitHub crawl integration, filtering, and search.
 """
+import hashlib
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import FileResponse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 from inventory.models import Tracker, TrackerFile, TrackerFileImage
+from inventory.services.file_download_service import DownloadError, FileDownloadService
+from inventory.services.mod_file_cache import deflate_file
+from inventory.services.zip_archives import _prefetched_remote_files, build_tracker_zip
 from inventory.tests.factories import (
     TrackerFactory,
     TrackerFileFactory,
@@ -116,6 +130,72 @@ class TestTrackerCRUD:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not TrackerFile.objects.filter(id__in=file_ids).exists()
 
+    def test_delete_tracker_removes_its_cached_zips(self, api_client, sample_trackers, settings):
+        """Test that deleting a tracker removes its download ZIPs and no one else's."""
+        tracker = sample_trackers['trackers'][0]
+        for name in (f'{tracker.pk}-old.zip', f'{tracker.pk}-new.zip', f'{tracker.pk}0-other.zip'):
+            open(os.path.join(settings.TRACKER_ZIP_CACHE_DIR, name), 'wb').close()
+
+        response = api_client.delete(f'/api/trackers/{tracker.pk}/')
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert os.listdir(settings.TRACKER_ZIP_CACHE_DIR) == [f'{tracker.pk}0-other.zip']
+
+    def test_list_query_count_is_constant(self, api_client, db, assert_constant_queries):
+        """Project names and file counts don't cost queries per tracker."""
+        def add_tracker():
+            tracker = TrackerFactory(project=ProjectFactory())
+            TrackerFileFactory.create_batch(2, tracker=tracker, status='completed')
+            TrackerFileFactory(tracker=tracker, status='not_started')
+
+        assert_constant_queries(api_client, '/api/trackers/', add_tracker)
+
+    def test_list_counts_match_files(self, api_client, sample_trackers):
+        response = api_client.get('/api/trackers/')
+
+        by_name = {tracker['name']: tracker for tracker in response.data}
+        assert by_name['Voron 0.2']['total_count'] == 5
+        assert by_name['Voron 0.2']['completed_count'] == 3
+        assert by_name['Voron Trident']['total_count'] == 0
+
+    def test_detail_after_create_is_served_from_cache(self, api_client):
+        files = [{'name': 'part.gcode', 'url': 'https://example.com/part.gcode'}]
+        created = api_client.post('/api/trackers/create-manual/', {'name': 'Fresh', 'files': files}, format='json')
+        tracker_id = created.data['tracker']['id']
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(f'/api/trackers/{tracker_id}/')
+
+        assert response.data == created.data['tracker']
+        assert len(ctx.captured_queries) == 0
+
+    def test_cached_detail_is_dropped_when_a_file_changes(self, api_client, sample_trackers):
+        tracker = sample_trackers['trackers'][0]
+        api_client.get(f'/api/trackers/{tracker.pk}/')
+        tracker_file = tracker.files.first()
+        tracker_file.status = 'not_started'
+        tracker_file.save()
+
+        response = api_client.get(f'/api/trackers/{tracker.pk}/')
+
+        by_id = {f['id']: f for f in response.data['files']}
+        assert by_id[tracker_file.pk]['status'] == 'not_started'
+
+    def test_thumbnail_written_by_the_worker_reaches_a_cached_detail(self, api_client, settings, tmp_path, monkeypatch):
+        """qcluster saves auto-thumbnails and bumps the version through its own cache handler."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        files = [{'name': 'part.gcode', 'url': 'https://example.com/part.gcode'}]
+        created = api_client.post('/api/trackers/create-manual/', {'name': 'Fresh', 'files': files}, format='json')
+        tracker_id = created.data['tracker']['id']
+        assert created.data['tracker']['files'][0]['thumbnail'] is None
+
+        monkeypatch.setattr('inventory.models.cache', caches.create_connection('default'))
+        TrackerFileImageFactory(tracker_file=TrackerFile.objects.get(tracker_id=tracker_id), is_auto_generated=True)
+        monkeypatch.undo()
+        response = api_client.get(f'/api/trackers/{tracker_id}/')
+
+        assert response.data['files'][0]['thumbnail'] is not None
+
 
 # ============================================================================
 # FILTERING TESTS
@@ -435,6 +515,65 @@ class TestCreateManualBooleanParsing:
         assert tracker.generate_thumbnails_for_linked_files is False
 
 
+# ============================================================================
+# CREATE MANUAL / ADD FILES — BULK INSERT TESTS
+# ============================================================================
+
+@pytest.mark.django_db
+class TestTrackerFileBulkInsert:
+    """New files are inserted in one query, with what their save signals did."""
+
+    def test_create_manual_sets_stats_and_queues_thumbnails(self, api_client):
+        files = [
+            {'name': 'a.stl', 'url': 'https://example.com/a.stl', 'category': 'Body', 'quantity': 2},
+            {'name': 'b.stl', 'url': 'https://example.com/b.stl', 'category': 'Body', 'quantity': 3},
+        ]
+        with mock.patch('django_q.tasks.async_task') as mock_async_task:
+            response = api_client.post(
+                '/api/trackers/create-manual/',
+                {'name': 'Bulk', 'generate_thumbnails_for_linked_files': True, 'files': files},
+                format='json',
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        tracker = Tracker.objects.get(name='Bulk')
+        assert tracker.total_quantity == 5
+        assert sorted(f['filename'] for f in response.data['tracker']['files']) == ['a.stl', 'b.stl']
+        assert mock_async_task.call_count == 2
+
+    def test_create_manual_query_count_is_constant(self, api_client):
+        """The response tracker is re-read with its files, not a query per file."""
+        def create_queries(name, count):
+            # .gcode files skip the per-file auto-thumbnail check
+            files = [{'name': f'part_{n}.gcode', 'url': 'https://example.com/p.gcode'} for n in range(count)]
+            with CaptureQueriesContext(connection) as ctx:
+                response = api_client.post('/api/trackers/create-manual/', {'name': name, 'files': files}, format='json')
+            assert len(response.data['tracker']['files']) == count
+            return len(ctx.captured_queries)
+
+        assert create_queries('Five', 5) == create_queries('One', 1)
+
+    def test_add_files_creates_new_and_updates_existing(self, api_client):
+        tracker = TrackerFactory(storage_type='link')
+        existing = TrackerFileFactory(tracker=tracker, filename='a.stl', directory_path='Body', quantity=1)
+        files = [
+            {'name': 'a.stl', 'category': 'Body', 'url': 'https://example.com/a2.stl', 'quantity': 4},
+            {'name': 'b.stl', 'category': 'Body', 'url': 'https://example.com/b.stl'},
+            {'name': 'b.stl', 'category': 'Body', 'url': 'https://example.com/b2.stl'},
+        ]
+
+        response = api_client.post(f'/api/trackers/{tracker.pk}/add-files/', {'files': files}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (response.data['created_count'], response.data['updated_count']) == (1, 1)
+        existing.refresh_from_db()
+        assert (existing.github_url, existing.quantity) == ('https://example.com/a2.stl', 4)
+        new_file = tracker.files.get(filename='b.stl')
+        assert new_file.github_url == 'https://example.com/b2.stl'
+        tracker.refresh_from_db()
+        assert tracker.total_quantity == 5
+
+
 # ============================================================================
 # THUMBNAIL INVALIDATION THROUGH THE REAL ENDPOINTS
 #
@@ -490,3 +629,413 @@ class TestThumbnailInvalidationThroughRealEndpoints:
         mock_async_task.assert_called_once_with(
             'inventory.tasks.generate_auto_thumbnail_task', tracker_file.pk
         )
+
+
+# ============================================================================
+# DOWNLOAD ZIP TESTS
+# ============================================================================
+
+def _fake_download(service, url, destination, max_retries=None, progress_callback=None):
+    if url.endswith('missing.stl'):
+        raise DownloadError('HTTP error 404: Not Found')
+    with open(destination, 'wb') as f:
+        f.write(url.encode())
+    return {'success': True, 'bytes_downloaded': len(url)}
+
+
+def _zip_infos(response):
+    with zipfile.ZipFile(BytesIO(b''.join(response.streaming_content))) as zf:
+        return {info.filename: (info, zf.read(info)) for info in zf.infolist()}
+
+
+def _zip_contents(response):
+    return {name: data for name, (_info, data) in _zip_infos(response).items()}
+
+
+@pytest.mark.django_db
+class TestDownloadZipAction:
+    """Test GET /api/trackers/{id}/download-zip/"""
+
+    def test_remote_files_are_downloaded_into_the_zip(self, api_client):
+        tracker = TrackerFactory()
+        for name in ('a.stl', 'b.stl', 'missing.stl'):
+            TrackerFileFactory(
+                tracker=tracker, filename=name, directory_path='Body',
+                github_url=f'https://example.com/{name}',
+            )
+
+        with mock.patch.object(FileDownloadService, 'download_with_retry', autospec=True,
+                               side_effect=_fake_download):
+            response = api_client.get(f'/api/trackers/{tracker.pk}/download-zip/')
+
+        assert response.status_code == status.HTTP_200_OK
+        contents = _zip_contents(response)
+        assert contents['Body/a.stl'] == b'https://example.com/a.stl'
+        assert contents['Body/b.stl'] == b'https://example.com/b.stl'
+        assert b'HTTP error 404' in contents['Body/missing.stl.error.txt']
+
+    def test_store_param_stores_every_entry(self, api_client):
+        tracker = TrackerFactory()
+        TrackerFileFactory(tracker=tracker, filename='a.stl', directory_path='Body',
+                           github_url='https://example.com/a.stl')
+
+        with mock.patch.object(FileDownloadService, 'download_with_retry', autospec=True,
+                               side_effect=_fake_download):
+            default = _zip_infos(api_client.get(f'/api/trackers/{tracker.pk}/download-zip/'))
+            stored = _zip_infos(api_client.get(f'/api/trackers/{tracker.pk}/download-zip/?store=true'))
+
+        assert default['Body/a.stl'][0].compress_type == zipfile.ZIP_DEFLATED
+        assert stored['Body/a.stl'][0].compress_type == zipfile.ZIP_STORED
+        assert stored['Body/a.stl'][1] == b'https://example.com/a.stl'
+
+    def test_local_copies_are_used_and_missing_ones_downloaded(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        tracker = TrackerFactory()
+        TrackerFileFactory(tracker=tracker, filename='a.stl', directory_path='Body',
+                           github_url='https://example.com/a.stl',
+                           local_file=SimpleUploadedFile('a.stl', b'local copy'))
+        gone = TrackerFileFactory(tracker=tracker, filename='b.stl', directory_path='Body',
+                                  github_url='https://example.com/b.stl',
+                                  local_file=SimpleUploadedFile('b.stl', b'deleted copy'))
+        os.remove(gone.local_file.path)
+
+        with mock.patch.object(FileDownloadService, 'download_with_retry', autospec=True,
+                               side_effect=_fake_download) as mock_download:
+            contents = _zip_contents(api_client.get(f'/api/trackers/{tracker.pk}/download-zip/'))
+
+        assert contents['Body/a.stl'] == b'local copy'
+        assert contents['Body/b.stl'] == b'https://example.com/b.stl'
+        mock_download.assert_called_once()
+
+    def test_tracker_without_files_returns_404(self, api_client):
+        tracker = TrackerFactory()
+
+        response = api_client.get(f'/api/trackers/{tracker.pk}/download-zip/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_remote_downloads_stay_a_bounded_window_ahead(self):
+        service = mock.Mock(download_workers=1)
+        service.download_with_retry.side_effect = lambda url, dest, **kwargs: _fake_download(None, url, dest)
+        files = [SimpleNamespace(id=n, github_url=f'https://example.com/{n}.stl', local_file=None) for n in range(5)]
+
+        with mock.patch.object(ThreadPoolExecutor, 'submit', autospec=True,
+                               side_effect=ThreadPoolExecutor.submit) as submit, \
+                _prefetched_remote_files(service, files) as take_remote:
+            assert submit.call_count == 2
+            temp_path, download = take_remote(files[0])
+            download.result()
+            assert submit.call_count == 3
+            assert take_remote(files[0]) is None
+        assert not os.path.exists(temp_path)
+
+
+@pytest.mark.django_db
+class TestDownloadFilesAction:
+    """Test GET /api/trackers/{id}/download-files/"""
+
+    def test_downloaded_files_are_streamed_into_the_zip(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        tracker = TrackerFactory(storage_type='local', files_downloaded=True)
+        TrackerFileFactory(tracker=tracker, filename='a.stl', directory_path='Body', download_status='completed',
+                           local_file=SimpleUploadedFile('a.stl', b'solid a'))
+        TrackerFileFactory(tracker=tracker, filename='b.3mf', directory_path='', download_status='completed',
+                           local_file=SimpleUploadedFile('b.3mf', b'3mf data'))
+        gone = TrackerFileFactory(tracker=tracker, filename='c.stl', download_status='completed',
+                                  local_file=SimpleUploadedFile('c.stl', b'deleted'))
+        os.remove(gone.local_file.path)
+
+        with mock.patch('inventory.views.logger') as mock_logger:
+            response = api_client.get(f'/api/trackers/{tracker.pk}/download-files/')
+
+        mock_logger.warning.assert_called_once()
+        assert gone.local_file.path in mock_logger.warning.call_args.args[0]
+
+        assert response.streaming
+        infos = _zip_infos(response)
+        assert set(infos) == {'Body/a.stl', 'b.3mf'}
+        assert infos['Body/a.stl'][1] == b'solid a'
+        assert infos['b.3mf'][0].compress_type == zipfile.ZIP_STORED
+
+    def test_small_files_are_deflated_off_the_writer(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        tracker = TrackerFactory(storage_type='local', files_downloaded=True)
+        for name in ('a.stl', 'b.stl', 'c.3mf'):
+            TrackerFileFactory(tracker=tracker, filename=name, download_status='completed',
+                               local_file=SimpleUploadedFile(name, b'solid ' * 100))
+
+        with mock.patch('inventory.services.zip_archives.deflate_file', wraps=deflate_file) as deflate:
+            infos = _zip_infos(api_client.get(f'/api/trackers/{tracker.pk}/download-files/'))
+
+        assert sorted(call.args[0].rsplit(os.sep, 1)[1] for call in deflate.call_args_list) == ['a.stl', 'b.stl']
+        assert infos['a.stl'][0].compress_type == zipfile.ZIP_DEFLATED
+        assert infos['a.stl'][1] == b'solid ' * 100
+
+    def test_archive_built_in_the_background_is_served_from_disk(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path / 'media')
+        tracker = TrackerFactory(storage_type='local', files_downloaded=True)
+        tracker_file = TrackerFileFactory(tracker=tracker, filename='a.stl', directory_path='Body',
+                                          download_status='completed',
+                                          local_file=SimpleUploadedFile('a.stl', b'solid a'))
+        url = f'/api/trackers/{tracker.pk}/download-files/'
+
+        first_path = build_tracker_zip(tracker)
+        response = api_client.get(url)
+
+        assert isinstance(response, FileResponse)
+        assert _zip_contents(response) == {'Body/a.stl': b'solid a'}
+        with open(tracker_file.local_file.path, 'wb') as f:
+            f.write(b'solid changed')
+        response = api_client.get(url)
+        assert not isinstance(response, FileResponse)
+        assert _zip_contents(response) == {'Body/a.stl': b'solid changed'}
+        # The streamed archive replaced the stale one and is served next time
+        cached = os.listdir(settings.TRACKER_ZIP_CACHE_DIR)
+        assert len(cached) == 1 and cached[0] != os.path.basename(first_path)
+        assert isinstance(api_client.get(url), FileResponse)
+
+    def test_each_file_is_stat_once(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path / 'media')
+        tracker = TrackerFactory(storage_type='local', files_downloaded=True)
+        tracker_file = TrackerFileFactory(tracker=tracker, filename='a.stl', download_status='completed',
+                                          local_file=SimpleUploadedFile('a.stl', b'solid a'))
+
+        with mock.patch('os.stat', wraps=os.stat) as stat:
+            _zip_contents(api_client.get(f'/api/trackers/{tracker.pk}/download-files/'))
+
+        assert [c for c in stat.call_args_list if c.args[0] == tracker_file.local_file.path] == [
+            mock.call(tracker_file.local_file.path)
+        ]
+
+    def test_cached_archive_is_handed_to_nginx_when_configured(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path / 'media')
+        settings.ZIP_CACHE_ACCEL_REDIRECT_URL = '/internal/cache/'
+        tracker = TrackerFactory(storage_type='local', files_downloaded=True)
+        TrackerFileFactory(tracker=tracker, filename='a.stl', download_status='completed',
+                           local_file=SimpleUploadedFile('a.stl', b'solid a'))
+
+        cache_path = build_tracker_zip(tracker)
+        response = api_client.get(f'/api/trackers/{tracker.pk}/download-files/')
+
+        assert response['X-Accel-Redirect'] == f'/internal/cache/tracker_zips/{os.path.basename(cache_path)}'
+        assert response.content == b''
+        assert response['Content-Disposition'].startswith('attachment;')
+
+
+@pytest.mark.django_db
+class TestDownloadProgressAction:
+    """Test GET /api/trackers/{id}/download-progress/"""
+
+    def test_reports_counts_and_current_file(self, api_client):
+        tracker = TrackerFactory(storage_type='local')
+        TrackerFileFactory(tracker=tracker, download_status='completed')
+        TrackerFileFactory(tracker=tracker, download_status='failed', download_error='Timed out')
+        TrackerFileFactory(tracker=tracker, filename='b.stl', directory_path='Body', download_status='downloading')
+        TrackerFileFactory(tracker=tracker, filename='a.stl', directory_path='Body', download_status='downloading')
+
+        response = api_client.get(f'/api/trackers/{tracker.pk}/download-progress/')
+
+        assert response.data['status'] == 'downloading'
+        assert (response.data['total_files'], response.data['downloaded_files'], response.data['failed_files']) == (4, 1, 1)
+        assert response.data['current_file'] == 'a.stl'
+        assert response.data['progress_percent'] == 25
+        assert [f['error'] for f in response.data['files']] == [None, 'Timed out', None, None]
+
+    def test_unchanged_progress_is_not_modified(self, api_client):
+        tracker = TrackerFactory(storage_type='local')
+        tracker_file = TrackerFileFactory(tracker=tracker, download_status='downloading')
+        url = f'/api/trackers/{tracker.pk}/download-progress/'
+
+        first = api_client.get(url)
+        repeat = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        tracker_file.download_status = 'completed'
+        tracker_file.save()
+        changed = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert repeat.status_code == status.HTTP_304_NOT_MODIFIED
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.data['status'] == 'completed'
+
+    def test_query_count_is_constant(self, api_client):
+        tracker = TrackerFactory(storage_type='local')
+
+        def progress_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                api_client.get(f'/api/trackers/{tracker.pk}/download-progress/')
+            return len(ctx.captured_queries)
+
+        TrackerFileFactory(tracker=tracker, download_status='completed')
+        baseline = progress_queries()
+        TrackerFileFactory.create_batch(3, tracker=tracker, download_status='downloading')
+
+        assert progress_queries() == baseline
+
+
+@pytest.mark.django_db
+class TestUploadFilesAction:
+    """Test POST /api/trackers/{id}/upload-files/"""
+
+    def _upload(self, api_client, tracker, names):
+        files = [SimpleUploadedFile(name, b'gcode') for name in names]
+        return api_client.post(
+            f'/api/trackers/{tracker.pk}/upload-files/',
+            {'files': files, 'category': 'Uploads'},
+            format='multipart',
+        )
+
+    def test_creates_new_files_and_replaces_existing(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        tracker = TrackerFactory()
+        existing = TrackerFileFactory(tracker=tracker, filename='a.gcode', directory_path='Uploads')
+
+        response = self._upload(api_client, tracker, ['a.gcode', 'b.gcode', 'c.gcode', 'c.gcode'])
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert (response.data['created_count'], response.data['updated_count']) == (2, 1)
+        assert sorted(tracker.files.values_list('filename', flat=True)) == ['a.gcode', 'b.gcode', 'c.gcode']
+        existing.refresh_from_db()
+        assert existing.download_status == 'completed'
+
+    def test_tracker_stats_cover_new_and_replaced_files(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        tracker = TrackerFactory()
+        TrackerFileFactory(tracker=tracker, filename='a.gcode', directory_path='Uploads', quantity=5)
+
+        self._upload(api_client, tracker, ['a.gcode', 'b.gcode'])
+
+        tracker.refresh_from_db()
+        assert tracker.total_quantity == 2
+
+    def test_upload_is_checksummed_and_renamed_into_place(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+        tracker = TrackerFactory()
+
+        self._upload(api_client, tracker, ['a.gcode'])
+
+        tracker_file = tracker.files.get()
+        assert tracker_file.file_checksum == hashlib.sha256(b'gcode').hexdigest()
+        directory = os.path.dirname(tracker_file.local_file.path)
+        assert os.listdir(directory) == ['a.gcode']
+
+    def test_query_count_does_not_grow_with_new_files(self, api_client, settings, tmp_path):
+        settings.MEDIA_ROOT = str(tmp_path)
+
+        def upload_queries(count):
+            tracker = TrackerFactory()
+            # .gcode files skip the per-file auto-thumbnail check
+            with CaptureQueriesContext(connection) as ctx:
+                self._upload(api_client, tracker, [f'part_{n}.gcode' for n in range(count)])
+            return len(ctx.captured_queries)
+
+        assert upload_queries(5) == upload_queries(1)
+
+
+# ============================================================================
+# DOWNLOAD ALL FILES TESTS
+# ============================================================================
+
+@pytest.mark.django_db
+class TestDownloadAllFilesAction:
+    """Test POST /api/trackers/{id}/download-all-files/"""
+
+    def test_only_linked_files_without_a_local_copy_are_downloaded(self, api_client):
+        tracker = TrackerFactory(storage_type='link')
+        pending = TrackerFileFactory(tracker=tracker, filename='a.stl', github_url='https://example.com/a.stl')
+        TrackerFileFactory(tracker=tracker, filename='b.stl', github_url='')
+
+        with mock.patch('inventory.views.TrackerViewSet._download_new_files',
+                        return_value={'successful': [{}], 'failed': []}) as mock_download:
+            response = api_client.post(f'/api/trackers/{tracker.pk}/download-all-files/')
+
+        assert [f.pk for f in mock_download.call_args.args[1]] == [pending.pk]
+        assert response.data['total_files'] == 1
+        tracker.refresh_from_db()
+        assert tracker.storage_type == 'local'
+
+    def test_nothing_to_download(self, api_client):
+        tracker = TrackerFactory()
+        TrackerFileFactory(tracker=tracker, github_url='')
+
+        with mock.patch('inventory.views.TrackerViewSet._download_new_files') as mock_download:
+            response = api_client.post(f'/api/trackers/{tracker.pk}/download-all-files/')
+
+        assert response.data['count'] == 0
+        mock_download.assert_not_called()
+
+
+# ============================================================================
+# CRAWL GITHUB TESTS
+# ============================================================================
+
+@pytest.mark.django_db
+class TestCrawlGithubAction:
+    """Test POST /api/trackers/crawl-github/"""
+
+    URL = '/api/trackers/crawl-github/'
+    REPO_URL = 'https://github.com/VoronDesign/Voron-0'
+    RESULT = {'success': True, 'file_tree': [], 'cached': False, 'cache_timestamp': None}
+
+    def test_repeat_crawl_is_served_from_cache(self, api_client):
+        with mock.patch('inventory.views.crawl_github_repository', return_value=dict(self.RESULT)) as mock_crawl:
+            first = api_client.post(self.URL, {'github_url': self.REPO_URL}, format='json')
+            second = api_client.post(self.URL, {'github_url': self.REPO_URL}, format='json')
+
+        mock_crawl.assert_called_once()
+        assert first.data['cached'] is False
+        assert second.data == {**first.data, 'cached': True}
+
+    def test_force_refresh_bypasses_cache(self, api_client):
+        with mock.patch('inventory.views.crawl_github_repository', return_value=dict(self.RESULT)) as mock_crawl:
+            api_client.post(self.URL, {'github_url': self.REPO_URL}, format='json')
+            api_client.post(self.URL, {'github_url': self.REPO_URL, 'force_refresh': True}, format='json')
+
+        assert mock_crawl.call_count == 2
+        assert mock_crawl.call_args.args == (self.REPO_URL, True)
+
+
+# ============================================================================
+# FETCH URL METADATA TESTS
+# ============================================================================
+
+@pytest.mark.django_db
+class TestFetchUrlMetadata:
+    """Test POST /api/trackers/fetch-url-metadata/"""
+
+    URL = '/api/trackers/fetch-url-metadata/'
+    FILE_URL = 'https://github.com/user/repo/blob/main/stls/part%5Ba%5D.stl'
+
+    def _head_response(self, ok=True, size='2048'):
+        return mock.Mock(ok=ok, headers={'Content-Length': size})
+
+    def test_returns_filename_size_and_source(self, api_client):
+        with mock.patch('inventory.views._url_metadata_session.head', return_value=self._head_response()):
+            response = api_client.post(self.URL, {'url': self.FILE_URL}, format='json')
+
+        assert response.data == {'filename': 'part[a].stl', 'size': 2048, 'source': 'GitHub'}
+
+    @pytest.mark.parametrize('url, source', [
+        ('https://www.Printables.com:443/model/1/a.stl', 'Printables'),
+        ('https://gist.github.com/user/a.stl', 'GitHub'),
+        ('https://raw.githubusercontent.com/user/repo/main/a.stl', 'URL'),
+    ])
+    def test_source_is_matched_on_registered_domain(self, api_client, url, source):
+        with mock.patch('inventory.views._url_metadata_session.head', return_value=self._head_response()):
+            response = api_client.post(self.URL, {'url': url}, format='json')
+
+        assert response.data['source'] == source
+
+    def test_repeat_lookup_is_served_from_cache(self, api_client):
+        with mock.patch('inventory.views._url_metadata_session.head', return_value=self._head_response()) as mock_head:
+            first = api_client.post(self.URL, {'url': self.FILE_URL}, format='json')
+            second = api_client.post(self.URL, {'url': self.FILE_URL}, format='json')
+
+        assert first.data == second.data
+        mock_head.assert_called_once()
+
+    def test_failed_lookup_is_cached_briefly(self, api_client):
+        with mock.patch('inventory.views._url_metadata_session.head', side_effect=OSError('unreachable')), \
+                mock.patch('inventory.views.cache.set') as mock_cache_set:
+            response = api_client.post(self.URL, {'url': self.FILE_URL}, format='json')
+
+        assert response.data['size'] == 0
+        assert mock_cache_set.call_args.args[2] == 60
@@ -7,12 +7,23 @@ import tempfile
 import hashlib
 import json
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from decimal import Decimal, InvalidOperation
-from io import BytesIO, StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from datetime import date, timedelta
-from django.http import HttpResponse
+from json.encoder import encode_basestring_ascii
+import requests
+from requests.adapters import HTTPAdapter
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework import viewsets, filters, mixins
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
@@ -20,9 +31,10 @@ from rest_framework import status
 from rest_framework.fields import BooleanField
 from rest_framework.views import APIView
 from django.conf import settings
-from django.db import connection, models
+from django.core.cache import cache
+from django.db import connection, models, transaction
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import F, Sum, Q
+from django.db.models import F, Sum, Q, Count, Max, Case, When, Value, Exists, OuterRef, Prefetch, ExpressionWrapper, prefetch_related_objects
 from rest_framework.decorators import action
 
 logger = logging.getLogger(__name__)
@@ -31,7 +43,8 @@ from .models import (
     Brand, PartType, Location, Material, MaterialPhoto, MaterialFeature, Vendor, Printer, Mod, ModFile,
     InventoryItem, Project, ProjectLink, ProjectFile, ProjectInventory, ProjectPrinters,
     ProjectBOMItem, Tracker, TrackerFile, TrackerFileImage, AlertDismissal, FilamentSpool,
-    AppConfiguration, HIDEABLE_MODULE_KEYS
+    AppConfiguration, HIDEABLE_MODULE_KEYS, get_dashboard_cache_version, invalidate_dashboard_cache,
+    get_tracker_detail_cache_version, invalidate_tracker_detail_cache, queue_auto_thumbnail_generation
 )
 from .serializers import (
     BrandSerializer, PartTypeSerializer, LocationSerializer, MaterialSerializer, MaterialPhotoSerializer, MaterialFeatureSerializer, VendorSerializer, PrinterSerializer, ModSerializer, ModFileSerializer,
@@ -41,8 +54,9 @@ from .serializers import (
     TrackerCreateSerializer, TrackerListSerializer,
     FilamentSpoolSerializer, AppConfigurationSerializer
 )
-from .filters import InventoryItemFilter, PrinterFilter, ProjectFilter, MaterialFilter
+from .filters import InventoryItemFilter, PrinterFilter, ProjectFilter, MaterialFilter, QueryParamFilterBackend, IndexedSearchFilter
 from .services.github_service import (
+    CACHE_TIMEOUT as GITHUB_CACHE_TIMEOUT,
     crawl_github_repository,
     GitHubCrawlerError,
     InvalidURLError,
@@ -51,8 +65,22 @@ from .services.github_service import (
     NetworkError,
     EmptyResultError
 )
+from .services.mod_file_cache import DEFLATE_SUFFIX, is_compressed_file
 from .services.storage_manager import StorageManager, InsufficientStorageError, StoragePermissionError
-from .services.file_download_service import FileDownloadService, DownloadError, FileTooLargeError, DownloadTimeoutError
+from .services.file_download_service import FileDownloadService
+from .services.tracker_downloads import set_download_state, apply_download_results
+from .services.zip_archives import (
+    cache_zip,
+    downloaded_tracker_files,
+    prune_zip_cache,
+    remove_cached_zips,
+    stat_downloaded_files,
+    stat_mod_files,
+    stream_downloaded_files_zip,
+    stream_tracker_zip,
+    stream_zip,
+    tracker_zip_cache_path,
+)
 
 # A viewset that only allows listing and retrieving (read-only)
 class ReadOnlyViewSet(mixins.RetrieveModelMixin,
@@ -60,6 +88,226 @@ class ReadOnlyViewSet(mixins.RetrieveModelMixin,
                       viewsets.GenericViewSet):
     pass
 
+
+class OptionalLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Pages a list only when the client sends ?limit= (capped at max_limit).
+
+    The frontend reads these endpoints as plain arrays, so requests without
+    a limit keep getting the full, unwrapped list.
+    """
+    default_limit = None
+    max_limit = 200
+
+
+@contextmanager
+def _csv_writer(raw):
+    """
+    Yield a csv.writer that encodes rows straight onto a binary stream.
+
+    Rows are encoded as they are written, so a section is never held in
+    memory as one big string before it reaches the archive.
+    """
+    text = TextIOWrapper(raw, encoding='utf-8', newline='', write_through=True)
+    try:
+        yield csv.writer(text)
+    finally:
+        text.flush()
+        # Leave the underlying stream open for the caller
+        text.detach()
+
+
+# Export media read-ahead: files read concurrently, and the largest file that
+# is buffered in memory rather than streamed from disk by zipfile.
+MEDIA_READ_AHEAD = 8
+MEDIA_READ_AHEAD_MAX_SIZE = 16 * 1024 * 1024
+
+
+# Formats that are already compressed; deflating them again costs CPU for
+# next to no size reduction, so they are stored as-is. STL is left out on
+# purpose - ASCII STLs in particular still deflate well.
+PRECOMPRESSED_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.webp', '.gif',
+    '.mp4', '.mov', '.gz', '.zip', '.7z', '.3mf',
+})
+
+
+def _media_compress_type(file_path):
+    """ZIP compression method for a media file, based on its extension."""
+    if os.path.splitext(file_path)[1].lower() in PRECOMPRESSED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _read_media_file(file_path, media_root):
+    """
+    Build the archive entry for a media file and read its contents.
+
+    Returns (zinfo, data); data is None for files above
+    MEDIA_READ_AHEAD_MAX_SIZE, which the caller writes straight from disk.
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, os.path.relpath(file_path, media_root))
+    if zinfo.file_size > MEDIA_READ_AHEAD_MAX_SIZE:
+        return zinfo, None
+    with open(file_path, 'rb') as f:
+        return zinfo, f.read()
+
+
+# CSV sections of the backup archive, in archive order:
+# (member name, error key, model, [(CSV column, values_list() lookup), ...]).
+# Rows come straight from values_list(), so no model instances are built and
+# related names are fetched in the same query.
+EXPORT_CSV_SECTIONS = [
+    ('inventory.csv', 'inventory_section', InventoryItem, [
+        ('id', 'id'), ('title', 'title'), ('brand', 'brand__name'),
+        ('part_type', 'part_type__name'), ('location', 'location__name'),
+        ('quantity', 'quantity'), ('cost', 'cost'), ('notes', 'notes'), ('photo', 'photo'),
+        ('is_consumable', 'is_consumable'), ('low_stock_threshold', 'low_stock_threshold'),
+        ('vendor', 'vendor__name'), ('vendor_link', 'vendor_link'), ('model', 'model'),
+    ]),
+    ('printers.csv', 'printers_section', Printer, [
+        ('id', 'id'), ('title', 'title'), ('manufacturer', 'manufacturer__name'),
+        ('serial_number', 'serial_number'), ('purchase_date', 'purchase_date'),
+        ('status', 'status'), ('notes', 'notes'), ('purchase_price', 'purchase_price'),
+        ('photo', 'photo'), ('last_maintained_date', 'last_maintained_date'),
+        ('maintenance_reminder_date', 'maintenance_reminder_date'),
+        ('last_carbon_replacement_date', 'last_carbon_replacement_date'),
+        ('carbon_reminder_date', 'carbon_reminder_date'), ('maintenance_notes', 'maintenance_notes'),
+    ]),
+    ('mods.csv', 'mods_section', Mod, [
+        ('id', 'id'), ('printer_id', 'printer_id'), ('name', 'name'), ('link', 'link'), ('status', 'status'),
+    ]),
+    ('modfiles.csv', 'modfiles_section', ModFile, [
+        ('id', 'id'), ('mod_id', 'mod_id'), ('file', 'file'),
+    ]),
+    ('projects.csv', 'projects_section', Project, [
+        ('id', 'id'), ('project_name', 'project_name'), ('description', 'description'),
+        ('status', 'status'), ('start_date', 'start_date'), ('due_date', 'due_date'),
+        ('notes', 'notes'), ('photo', 'photo'),
+    ]),
+    ('project_links.csv', 'projectlinks_section', ProjectLink, [
+        ('id', 'id'), ('project_id', 'project_id'), ('name', 'name'), ('url', 'url'),
+    ]),
+    ('project_files.csv', 'projectfiles_section', ProjectFile, [
+        ('id', 'id'), ('project_id', 'project_id'), ('file', 'file'),
+    ]),
+    ('project_inventory.csv', 'projectinventory_section', ProjectInventory, [
+        ('project_id', 'project_id'), ('inventory_item_id', 'inventory_item_id'),
+        ('quantity_used', 'quantity_used'),
+    ]),
+    ('project_printers.csv', 'projectprinters_section', ProjectPrinters, [
+        ('project_id', 'project_id'), ('printer_id', 'printer_id'),
+    ]),
+    ('trackers.csv', 'trackers_section', Tracker, [
+        ('id', 'id'), ('name', 'name'), ('project_id', 'project_id'),
+        ('github_url', 'github_url'), ('storage_type', 'storage_type'),
+        ('primary_color', 'primary_color'), ('accent_color', 'accent_color'),
+        ('total_quantity', 'total_quantity'), ('printed_quantity_total', 'printed_quantity_total'),
+        ('progress_percentage', 'progress_percentage'), ('created_date', 'created_date'),
+        ('updated_date', 'updated_date'), ('storage_path', 'storage_path'),
+        ('total_storage_used', 'total_storage_used'), ('files_downloaded', 'files_downloaded'),
+        ('generate_thumbnails_for_linked_files', 'generate_thumbnails_for_linked_files'),
+        ('viewer_background', 'viewer_background'),
+    ]),
+    ('tracker_files.csv', 'trackerfiles_section', TrackerFile, [
+        ('id', 'id'), ('tracker_id', 'tracker_id'), ('storage_type', 'storage_type'),
+        ('filename', 'filename'), ('directory_path', 'directory_path'),
+        ('github_url', 'github_url'), ('local_file', 'local_file'), ('file_size', 'file_size'),
+        ('sha', 'sha'), ('color', 'color'), ('material', 'material'), ('quantity', 'quantity'),
+        ('is_selected', 'is_selected'), ('status', 'status'), ('printed_quantity', 'printed_quantity'),
+        ('created_date', 'created_date'), ('updated_date', 'updated_date'),
+        ('download_date', 'download_date'), ('download_status', 'download_status'),
+        ('download_error', 'download_error'), ('downloaded_at', 'downloaded_at'),
+        ('file_checksum', 'file_checksum'), ('actual_file_size', 'actual_file_size'),
+    ]),
+]
+
+
+def _storage_basename(name):
+    """
+    Final path component of a FileField name ('' when unset).
+
+    Storage names are always forward-slashed, so a single rsplit matches
+    os.path.basename without its per-call separator handling.
+    """
+    return name.rsplit('/', 1)[-1] if name else ''
+
+
+# values_list() lookups that hold storage names; exported as bare filenames
+EXPORT_FILE_LOOKUPS = frozenset({'photo', 'file', 'local_file'})
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _export_rows(model, lookups):
+    """Yield CSV rows for ``model`` as raw value tuples."""
+    rows = model.objects.values_list(*lookups).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    file_indexes = [i for i, lookup in enumerate(lookups) if lookup in EXPORT_FILE_LOOKUPS]
+    if not file_indexes:
+        return rows
+
+    def strip_paths(row):
+        row = list(row)
+        for i in file_indexes:
+            row[i] = _storage_basename(row[i])
+        return row
+
+    return map(strip_paths, rows)
+
+
+# CSV sections render concurrently, each to a spooled temp file that moves to
+# disk past EXPORT_SPOOL_MAX_SIZE; the archive is then assembled serially.
+EXPORT_CSV_WORKERS = 4
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def _render_export_section(model, columns):
+    """Render one CSV section into a rewound spooled temp file."""
+    spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+    try:
+        with _csv_writer(spool) as writer:
+            writer.writerow([header for header, _ in columns])
+            writer.writerows(_export_rows(model, [lookup for _, lookup in columns]))
+    except Exception:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def _render_export_section_on_worker(model, columns):
+    """Worker-thread wrapper that releases the thread's own DB connection."""
+    try:
+        return _render_export_section(model, columns)
+    finally:
+        connection.close()
+
+
+def _render_export_sections(sections):
+    """
+    Render every CSV section, in parallel where the database allows it.
+
+    Returns a list of (section, spool or exception) in section order. Inside
+    a transaction, other connections cannot see its uncommitted rows, so the
+    sections are rendered on the caller's connection instead.
+    """
+    if connection.in_atomic_block:
+        results = []
+        for section in sections:
+            name, error_key, model, columns = section
+            try:
+                results.append((section, _render_export_section(model, columns)))
+            except Exception as e:
+                results.append((section, e))
+        return results
+    
+    with ThreadPoolExecutor(max_workers=EXPORT_CSV_WORKERS) as executor:
+        futures = [
+            (section, executor.submit(_render_export_section_on_worker, section[2], section[3]))
+            for section in sections
+        ]
+    return [(section, future.exception() or future.result()) for section, future in futures]
+
+
 class ExportDataView(APIView):
     permission_classes = [AllowAny]
     
@@ -72,232 +320,16 @@ class ExportDataView(APIView):
         export_errors = []  # Track which sections failed
         
         with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            # Export Inventory Items
-            try:
-                inv_buffer = StringIO()
-                inv_writer = csv.writer(inv_buffer)
-                inv_writer.writerow(['id', 'title', 'brand', 'part_type', 'location', 'quantity', 'cost', 'notes', 'photo', 'is_consumable', 'low_stock_threshold', 'vendor', 'vendor_link', 'model'])
-                for item in InventoryItem.objects.all():
-                    try:
-                        inv_writer.writerow([
-                            item.id, item.title, item.brand.name if item.brand else '',
-                            item.part_type.name if item.part_type else '',
-                            item.location.name if item.location else '',
-                            item.quantity, item.cost, item.notes,
-                            os.path.basename(item.photo.name) if item.photo else '',
-                            item.is_consumable, item.low_stock_threshold,
-                            item.vendor.name if item.vendor else '',
-                            item.vendor_link or '',
-                            item.model or ''
-                        ])
-                    except Exception as e:
-                        logger.error(f"Failed to export inventory item {item.id}: {e}", exc_info=True)
-                        export_errors.append(f"inventory_item_{item.id}")
-                zf.writestr('inventory.csv', inv_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export inventory section: {e}", exc_info=True)
-                export_errors.append("inventory_section")
-
-            # Export Printers
-            try:
-                printer_buffer = StringIO()
-                printer_writer = csv.writer(printer_buffer)
-                printer_writer.writerow(['id', 'title', 'manufacturer', 'serial_number', 'purchase_date', 'status', 'notes', 'purchase_price', 'photo', 'last_maintained_date', 'maintenance_reminder_date', 'last_carbon_replacement_date', 'carbon_reminder_date', 'maintenance_notes'])
-                for printer in Printer.objects.all():
-                    try:
-                        printer_writer.writerow([
-                            printer.id, printer.title, printer.manufacturer.name if printer.manufacturer else '',
-                            printer.serial_number, printer.purchase_date, printer.status, printer.notes,
-                            printer.purchase_price, os.path.basename(printer.photo.name) if printer.photo else '',
-                            printer.last_maintained_date, printer.maintenance_reminder_date,
-                            printer.last_carbon_replacement_date, printer.carbon_reminder_date,
-                            printer.maintenance_notes
-                        ])
-                    except Exception as e:
-                        logger.error(f"Failed to export printer {printer.id}: {e}", exc_info=True)
-                        export_errors.append(f"printer_{printer.id}")
-                zf.writestr('printers.csv', printer_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export printers section: {e}", exc_info=True)
-                export_errors.append("printers_section")
-            
-            # Export Mods
-            try:
-                mod_buffer = StringIO()
-                mod_writer = csv.writer(mod_buffer)
-                mod_writer.writerow(['id', 'printer_id', 'name', 'link', 'status'])
-                for mod in Mod.objects.all():
-                    try:
-                        mod_writer.writerow([mod.id, mod.printer.id, mod.name, mod.link, mod.status])
-                    except Exception as e:
-                        logger.error(f"Failed to export mod {mod.id}: {e}", exc_info=True)
-                        export_errors.append(f"mod_{mod.id}")
-                zf.writestr('mods.csv', mod_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export mods section: {e}", exc_info=True)
-                export_errors.append("mods_section")
-
-            # Export ModFiles
-            try:
-                modfile_buffer = StringIO()
-                modfile_writer = csv.writer(modfile_buffer)
-                modfile_writer.writerow(['id', 'mod_id', 'file'])
-                for modfile in ModFile.objects.all():
-                    try:
-                        modfile_writer.writerow([modfile.id, modfile.mod.id, os.path.basename(modfile.file.name) if modfile.file else ''])
-                    except Exception as e:
-                        logger.error(f"Failed to export modfile {modfile.id}: {e}", exc_info=True)
-                        export_errors.append(f"modfile_{modfile.id}")
-                zf.writestr('modfiles.csv', modfile_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export modfiles section: {e}", exc_info=True)
-                export_errors.append("modfiles_section")
-
-            # Export Projects
-            try:
-                project_buffer = StringIO()
-                project_writer = csv.writer(project_buffer)
-                project_writer.writerow(['id', 'project_name', 'description', 'status', 'start_date', 'due_date', 'notes', 'photo'])
-                for project in Project.objects.all():
-                    try:
-                        project_writer.writerow([
-                            project.id, project.project_name, project.description, project.status,
-                            project.start_date, project.due_date, project.notes,
-                            os.path.basename(project.photo.name) if project.photo else ''
-                        ])
-                    except Exception as e:
-                        logger.error(f"Failed to export project {project.id}: {e}", exc_info=True)
-                        export_errors.append(f"project_{project.id}")
-                zf.writestr('projects.csv', project_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export projects section: {e}", exc_info=True)
-                export_errors.append("projects_section")
-
-            # Export ProjectLinks
-            try:
-                projectlink_buffer = StringIO()
-                projectlink_writer = csv.writer(projectlink_buffer)
-                projectlink_writer.writerow(['id', 'project_id', 'name', 'url'])
-                for link in ProjectLink.objects.all():
-                    try:
-                        projectlink_writer.writerow([link.id, link.project.id, link.name, link.url])
-                    except Exception as e:
-                        logger.error(f"Failed to export project link {link.id}: {e}", exc_info=True)
-                        export_errors.append(f"projectlink_{link.id}")
-                zf.writestr('project_links.csv', projectlink_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export project links section: {e}", exc_info=True)
-                export_errors.append("projectlinks_section")
-
-            # Export ProjectFiles
-            try:
-                projectfile_buffer = StringIO()
-                projectfile_writer = csv.writer(projectfile_buffer)
-                projectfile_writer.writerow(['id', 'project_id', 'file'])
-                for pfile in ProjectFile.objects.all():
-                    try:
-                        projectfile_writer.writerow([pfile.id, pfile.project.id, os.path.basename(pfile.file.name) if pfile.file else ''])
-                    except Exception as e:
-                        logger.error(f"Failed to export project file {pfile.id}: {e}", exc_info=True)
-                        export_errors.append(f"projectfile_{pfile.id}")
-                zf.writestr('project_files.csv', projectfile_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export project files section: {e}", exc_info=True)
-                export_errors.append("projectfiles_section")
-
-            # Export ProjectInventory
-            try:
-                projectinventory_buffer = StringIO()
-                projectinventory_writer = csv.writer(projectinventory_buffer)
-                projectinventory_writer.writerow(['project_id', 'inventory_item_id', 'quantity_used'])
-                for pi in ProjectInventory.objects.all():
-                    try:
-                        projectinventory_writer.writerow([pi.project.id, pi.inventory_item.id, pi.quantity_used])
-                    except Exception as e:
-                        logger.error(f"Failed to export project inventory {pi.id}: {e}", exc_info=True)
-                        export_errors.append(f"projectinventory_{pi.id}")
-                zf.writestr('project_inventory.csv', projectinventory_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export project inventory section: {e}", exc_info=True)
-                export_errors.append("projectinventory_section")
-
-            # Export ProjectPrinters
-            try:
-                projectprinters_buffer = StringIO()
-                projectprinters_writer = csv.writer(projectprinters_buffer)
-                projectprinters_writer.writerow(['project_id', 'printer_id'])
-                for pp in ProjectPrinters.objects.all():
-                    try:
-                        projectprinters_writer.writerow([pp.project.id, pp.printer.id])
-                    except Exception as e:
-                        logger.error(f"Failed to export project printer {pp.id}: {e}", exc_info=True)
-                        export_errors.append(f"projectprinter_{pp.id}")
-                zf.writestr('project_printers.csv', projectprinters_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export project printers section: {e}", exc_info=True)
-                export_errors.append("projectprinters_section")
-
-            # Export Print Trackers
-            try:
-                tracker_buffer = StringIO()
-                tracker_writer = csv.writer(tracker_buffer)
-                tracker_writer.writerow([
-                    'id', 'name', 'project_id', 'github_url', 'storage_type',
-                    'primary_color', 'accent_color', 'total_quantity', 'printed_quantity_total',
-                    'progress_percentage', 'created_date', 'updated_date', 'storage_path',
-                    'total_storage_used', 'files_downloaded',
-                    'generate_thumbnails_for_linked_files', 'viewer_background'
-                ])
-                for tracker in Tracker.objects.all():
-                    try:
-                        tracker_writer.writerow([
-                            tracker.id, tracker.name,
-                            tracker.project.id if tracker.project else '',
-                            tracker.github_url, tracker.storage_type,
-                            tracker.primary_color, tracker.accent_color,
-                            tracker.total_quantity, tracker.printed_quantity_total,
-                            tracker.progress_percentage, tracker.created_date, tracker.updated_date,
-                            tracker.storage_path, tracker.total_storage_used, tracker.files_downloaded,
-                            tracker.generate_thumbnails_for_linked_files, tracker.viewer_background
-                        ])
-                    except Exception as e:
-                        logger.error(f"Failed to export tracker {tracker.id}: {e}", exc_info=True)
-                        export_errors.append(f"tracker_{tracker.id}")
-                zf.writestr('trackers.csv', tracker_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export trackers section: {e}", exc_info=True)
-                export_errors.append("trackers_section")
-
-            # Export Tracker Files
-            try:
-                trackerfile_buffer = StringIO()
-                trackerfile_writer = csv.writer(trackerfile_buffer)
-                trackerfile_writer.writerow([
-                    'id', 'tracker_id', 'storage_type', 'filename', 'directory_path',
-                    'github_url', 'local_file', 'file_size', 'sha', 'color', 'material',
-                    'quantity', 'is_selected', 'status', 'printed_quantity',
-                    'created_date', 'updated_date', 'download_date', 'download_status',
-                    'download_error', 'downloaded_at', 'file_checksum', 'actual_file_size'
-                ])
-                for tfile in TrackerFile.objects.all():
-                    try:
-                        trackerfile_writer.writerow([
-                            tfile.id, tfile.tracker.id, tfile.storage_type,
-                            tfile.filename, tfile.directory_path, tfile.github_url,
-                            os.path.basename(tfile.local_file.name) if tfile.local_file else '',
-                            tfile.file_size, tfile.sha, tfile.color, tfile.material,
-                            tfile.quantity, tfile.is_selected, tfile.status, tfile.printed_quantity,
-                            tfile.created_date, tfile.updated_date, tfile.download_date,
-                            tfile.download_status, tfile.download_error, tfile.downloaded_at,
-                            tfile.file_checksum, tfile.actual_file_size
-                        ])
-                    except Exception as e:
-                        logger.error(f"Failed to export tracker file {tfile.id}: {e}", exc_info=True)
-                        export_errors.append(f"trackerfile_{tfile.id}")
-                zf.writestr('tracker_files.csv', trackerfile_buffer.getvalue())
-            except Exception as e:
-                logger.error(f"Failed to export tracker files section: {e}", exc_info=True)
-                export_errors.append("trackerfiles_section")
+            # Export every model table as its own CSV
+            for (name, error_key, model, columns), rendered in _render_export_sections(EXPORT_CSV_SECTIONS):
+                try:
+                    if isinstance(rendered, Exception):
+                        raise rendered
+                    with rendered, zf.open(name, 'w', force_zip64=True) as member:
+                        shutil.copyfileobj(rendered, member, 1024 * 1024)
+                except Exception as e:
+                    logger.error(f"Failed to export {name}: {e}", exc_info=True)
+                    export_errors.append(error_key)
 
             # Export App Configuration (global settings singleton: module visibility, etc.)
             try:
@@ -312,17 +344,42 @@ class ExportDataView(APIView):
             # Add media files to zip
             try:
                 media_root = settings.MEDIA_ROOT
+                media_files = []
                 for root, dirs, files in os.walk(media_root):
                     for file in files:
-                        # Skip CSV files - they're already added via writestr() above
+                        # Skip CSV files - they're already added as archive members above
                         if file.endswith('.csv'):
                             continue
+                        # Deflated mod file copies are rebuilt on save, not restored
+                        if file.endswith(DEFLATE_SUFFIX):
+                            continue
+                        media_files.append(os.path.join(root, file))
+                
+                # Disk reads run ahead on a small thread pool while this thread
+                # compresses; the window bounds how many files sit in memory.
+                with ThreadPoolExecutor(max_workers=MEDIA_READ_AHEAD) as executor:
+                    pending = deque()
+                    remaining = iter(media_files)
+                    for file_path in islice(remaining, MEDIA_READ_AHEAD):
+                        pending.append((file_path, executor.submit(_read_media_file, file_path, media_root)))
+                    
+                    while pending:
+                        file_path, future = pending.popleft()
+                        next_path = next(remaining, None)
+                        if next_path is not None:
+                            pending.append((next_path, executor.submit(_read_media_file, next_path, media_root)))
                         
                         try:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, media_root)
-                            zf.write(file_path, arcname)
+                            zinfo, data = future.result()
+                            compress_type = _media_compress_type(file_path)
+                            if data is None:
+                                # Too large to buffer - let zipfile stream it from disk
+                                zf.write(file_path, zinfo.filename, compress_type=compress_type)
+                            else:
+                                zinfo.compress_type = compress_type
+                                zf.writestr(zinfo, data)
                         except Exception as e:
+                            file = os.path.basename(file_path)
                             logger.error(f"Failed to add media file {file}: {e}", exc_info=True)
                             export_errors.append(f"media_{file}")
             except Exception as e:
@@ -351,12 +408,116 @@ class ExportDataView(APIView):
         return response
 
 
+# Printer statuses that make a printer unavailable to the projects using it
+UNAVAILABLE_PRINTER_STATUSES = ['Under Repair', 'Sold', 'Archived']
+# How far ahead "due soon" alerts look
+ALERT_WINDOW = timedelta(days=7)
+
+
+def _flag(condition):
+    """Annotate a boolean column that is True when ``condition`` holds."""
+    return Case(When(condition, then=Value(True)), default=Value(False), output_field=models.BooleanField())
+
+
+def _time_until_due(today):
+    """Annotate ``due_date - today`` as a duration (null when there is no due date)."""
+    return ExpressionWrapper(
+        F('due_date') - Value(today, output_field=models.DateField()),
+        output_field=models.DurationField()
+    )
+
+
+def _days(delta):
+    """Whole days of an annotated duration, or None."""
+    return delta.days if delta is not None else None
+
+
+# Fields that feed the dismissal hash for each alert type
+ALERT_STATE_FIELDS = {
+    'printer_repair': ('status', 'id'),
+    'maintenance_overdue': ('last_maintained_date', 'maintenance_reminder_date', 'id'),
+    'carbon_overdue': ('carbon_reminder_date', 'id'),
+    'carbon_soon': ('carbon_reminder_date', 'id'),
+    'project_overdue': ('due_date', 'id'),
+    'project_blocked': ('printer_states', 'id'),
+    'project_due_soon': ('due_date', 'id'),
+    'tracker_unconfigured': ('github_url', 'id'),
+    'low_stock': ('quantity', 'min_quantity', 'id'),
+}
+
+
+def _encode_state_value(value):
+    """Encode one state value exactly as json.dumps(..., sort_keys=True) would."""
+    if value is None:
+        return 'null'
+    value_type = type(value)
+    if value_type is int:
+        return str(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if isinstance(value, (date, timezone.datetime)):
+        return encode_basestring_ascii(value.isoformat())
+    if value_type is list or value_type is tuple:
+        # project_blocked printer_states: lists of [id, status] pairs
+        return '[' + ', '.join([_encode_state_value(item) for item in value]) + ']'
+    return json.dumps(value, sort_keys=True)
+
+
+def _build_state_encoder(fields):
+    """
+    Specialize a state encoder for a fixed set of fields.
+
+    The output is byte-identical to json.dumps() of the filtered state dict with
+    sorted keys, so hashes stored on existing dismissals keep matching, but the
+    key order and literal key prefixes are worked out once instead of per alert.
+    """
+    fields = tuple(sorted(fields))
+    prefixes = tuple(
+        ('{' if i == 0 else ', ') + encode_basestring_ascii(field) + ': '
+        for i, field in enumerate(fields)
+    )
+    pairs = tuple(zip(prefixes, fields))
+
+    def encode(state_data):
+        get = state_data.get
+        return ''.join([prefix + _encode_state_value(get(field)) for prefix, field in pairs]) + '}'
+
+    return encode
+
+
+_STATE_ENCODERS = {
+    alert_type: _build_state_encoder(fields)
+    for alert_type, fields in ALERT_STATE_FIELDS.items()
+}
+_DEFAULT_STATE_ENCODER = _build_state_encoder(('id',))
+
+
+def _encode_alert_state(alert_type, state_data):
+    """Canonical JSON of the fields that matter for this alert type."""
+    return _STATE_ENCODERS.get(alert_type, _DEFAULT_STATE_ENCODER)(state_data)
+
+
+@lru_cache(maxsize=1024)
+def _hash_state_json(state_json):
+    """
+    SHA256 hex digest of an encoded state (see _encode_alert_state).
+
+    Memoized on the encoded string, which is canonical and hashable even
+    when the state holds lists, so repeated states are hashed once per
+    process rather than once per alert.
+    """
+    return hashlib.sha256(state_json.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+
 class DashboardDataView(APIView):
     """
     API endpoint that provides all data needed for the dashboard view.
     Returns alerts, stats, featured trackers, and active projects.
     """
     permission_classes = [AllowAny]
+    
+    # Safety net for writes that bypass model signals (queryset.update())
+    CACHE_TIMEOUT = 60
 
     def get(self, request):
         """
@@ -380,6 +541,13 @@ class DashboardDataView(APIView):
                 'active_projects': [...]
             }
         """
+        # Cached per day (alerts are date-relative) and per data version, which
+        # model signals bump on every write the dashboard depends on
+        cache_key = f"dashboard:{date.today().isoformat()}:{get_dashboard_cache_version()}"
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        
         # Generate alerts (with state-based invalidation)
         alerts = self._generate_alerts()
         
@@ -392,12 +560,14 @@ class DashboardDataView(APIView):
         # Get active projects
         active_projects = self._get_active_projects()
         
-        return Response({
+        data = {
             'alerts': alerts,
             'stats': stats,
             'featured_trackers': featured_trackers,
             'active_projects': active_projects
-        })
+        }
+        cache.set(cache_key, data, self.CACHE_TIMEOUT)
+        return Response(data)
     
     def _generate_state_hash(self, alert_type, state_data):
         """
@@ -413,36 +583,22 @@ class DashboardDataView(APIView):
         Returns:
             SHA256 hash string (64 characters)
         """
-        # Define which fields matter for each alert type
-        state_field_map = {
-            'printer_repair': ['status', 'id'],
-            'maintenance_overdue': ['last_maintained_date', 'maintenance_reminder_date', 'id'],
-            'carbon_overdue': ['carbon_reminder_date', 'id'],
-            'carbon_soon': ['carbon_reminder_date', 'id'],
-            'project_overdue': ['due_date', 'id'],
-            'project_blocked': ['printer_states', 'id'],
-            'project_due_soon': ['due_date', 'id'],
-            'tracker_unconfigured': ['github_url', 'id'],
-            'low_stock': ['quantity', 'min_quantity', 'id'],
-        }
-        
-        # Get relevant fields for this alert type
-        relevant_fields = state_field_map.get(alert_type, ['id'])
-        
-        # Extract only relevant data
-        filtered_state = {}
-        for field in relevant_fields:
-            value = state_data.get(field)
-            # Convert dates to strings for consistent hashing
-            if isinstance(value, (date, timezone.datetime)):
-                value = value.isoformat()
-            filtered_state[field] = value
-        
-        # Create deterministic JSON string (sorted keys)
-        state_json = json.dumps(filtered_state, sort_keys=True)
+        return self._hash_state_json(self._encode_state(alert_type, state_data))
+    
+    _encode_state = staticmethod(_encode_alert_state)
+    _hash_state_json = staticmethod(_hash_state_json)
+    
+    def _load_dismissals(self):
+        """
+        Index every stored dismissal by (alert_type, alert_id).
         
-        # Generate SHA256 hash
-        return hashlib.sha256(state_json.encode('utf-8')).hexdigest()
+        Loaded once per request so checking an alert is a dict lookup rather
+        than a query; most alerts have no dismissal at all.
+        """
+        self._dismissals = {
+            (dismissal.alert_type, dismissal.alert_id): dismissal
+            for dismissal in AlertDismissal.objects.all()
+        }
     
     def _should_show_alert(self, alert_type, alert_id, state_data):
         """
@@ -459,172 +615,165 @@ class DashboardDataView(APIView):
         Returns:
             Boolean - True if alert should be shown
         """
-        try:
-            dismissal = AlertDismissal.objects.get(
-                alert_type=alert_type,
-                alert_id=alert_id
-            )
-            
-            # Generate hash of current state
-            current_state_hash = self._generate_state_hash(alert_type, state_data)
-            
-            # If dismissal has no state_hash (old record before fix), delete it
-            if dismissal.state_hash is None:
-                dismissal.delete()
-                return True
-            
-            # If state hash matches, alert is still dismissed
-            if dismissal.state_hash == current_state_hash:
-                return False
-            
-            # State changed - delete old dismissal and show alert
-            dismissal.delete()
+        if getattr(self, '_dismissals', None) is None:
+            self._load_dismissals()
+        
+        dismissal = self._dismissals.get((alert_type, alert_id))
+        if dismissal is None:
+            # No dismissal exists - show alert without hashing anything
             return True
-            
-        except AlertDismissal.DoesNotExist:
-            # No dismissal exists - show alert
+        
+        # If dismissal has no state_hash (old record before fix), delete it
+        if dismissal.state_hash is None:
+            dismissal.delete()
+            del self._dismissals[(alert_type, alert_id)]
             return True
+        
+        # If the state is unchanged, alert is still dismissed. Rows that store
+        # the state JSON compare it directly; older rows fall back to the hash
+        # once and then store the JSON, so later loads never hash at all.
+        state_json = self._encode_state(alert_type, state_data)
+        if dismissal.state_json is not None:
+            unchanged = dismissal.state_json == state_json
+        else:
+            unchanged = dismissal.state_hash == self._hash_state_json(state_json)
+            if unchanged:
+                # update() rather than save(): no post_save, so the dashboard
+                # payload being built is not invalidated by its own backfill
+                AlertDismissal.objects.filter(pk=dismissal.pk).update(state_json=state_json)
+                dismissal.state_json = state_json
+        if unchanged:
+            return False
+        
+        # State changed - delete old dismissal and show alert
+        dismissal.delete()
+        del self._dismissals[(alert_type, alert_id)]
+        return True
     
-    def _cleanup_invalid_dismissals(self):
+    def _cleanup_invalid_dismissals(self, today):
         """
         Remove dismissals for conditions that no longer exist.
         
         For example, if a printer was "Under Repair" (alert dismissed),
         then changed to "Active", the dismissal should be removed so the
         alert can reappear if the printer goes back to "Under Repair".
+        
+        Every dismissal and the objects it refers to are loaded up front in a
+        fixed number of queries, stale ones are deleted in one statement, and
+        the survivors are indexed for _should_show_alert.
         """
-        # Get all dismissals
-        dismissals = AlertDismissal.objects.all()
+        soon_cutoff = today + ALERT_WINDOW
+        dismissals = list(AlertDismissal.objects.all())
+        
+        # Extract the target object ID from each alert_id (format: "printer_repair_8")
+        target_ids = {}
+        for dismissal in dismissals:
+            try:
+                target_ids[dismissal.id] = int(dismissal.alert_id.split('_')[-1])
+            except ValueError:
+                pass  # Invalid ID - cleaned up below
+        
+        def ids_for(*alert_types):
+            return [
+                target_ids[dismissal.id] for dismissal in dismissals
+                if dismissal.alert_type in alert_types and dismissal.id in target_ids
+            ]
         
+        printers = Printer.objects.only(
+            'id', 'status', 'maintenance_reminder_date', 'carbon_reminder_date'
+        ).in_bulk(ids_for('printer_repair', 'maintenance_overdue', 'carbon_overdue', 'carbon_soon'))
+        projects = Project.objects.only(
+            'id', 'status', 'due_date'
+        ).in_bulk(ids_for('project_overdue', 'project_due_soon', 'project_blocked'))
+        items = InventoryItem.objects.only(
+            'id', 'is_consumable', 'low_stock_threshold', 'quantity'
+        ).in_bulk(ids_for('low_stock'))
+        # Projects that still have at least one unavailable printer
+        blocked_project_ids = set(ProjectPrinters.objects.filter(
+            project_id__in=ids_for('project_blocked'),
+            printer__status__in=UNAVAILABLE_PRINTER_STATUSES
+        ).values_list('project_id', flat=True))
+        # Trackers that still have files missing color or material
+        unconfigured_tracker_ids = set(TrackerFile.objects.filter(
+            Q(color='') | Q(material=''),
+            tracker_id__in=ids_for('tracker_unconfigured')
+        ).values_list('tracker_id', flat=True))
+        
+        stale_ids = set()
         for dismissal in dismissals:
+            alert_type = dismissal.alert_type
+            target_id = target_ids.get(dismissal.id)
             should_delete = False
             
-            # Check printer_repair dismissals
-            if dismissal.alert_type == 'printer_repair':
-                # Extract printer ID from alert_id (format: "printer_repair_8")
-                try:
-                    printer_id = int(dismissal.alert_id.split('_')[-1])
-                    printer = Printer.objects.get(id=printer_id)
-                    # If printer is no longer under repair, delete dismissal
-                    if printer.status != 'Under Repair':
-                        should_delete = True
-                except (ValueError, Printer.DoesNotExist):
+            if alert_type in ('printer_repair', 'maintenance_overdue', 'carbon_overdue', 'carbon_soon'):
+                printer = printers.get(target_id)
+                if printer is None:
                     # Invalid ID or printer deleted - clean up dismissal
                     should_delete = True
-            
-            # Check maintenance_overdue dismissals
-            elif dismissal.alert_type == 'maintenance_overdue':
-                try:
-                    printer_id = int(dismissal.alert_id.split('_')[-1])
-                    printer = Printer.objects.get(id=printer_id)
+                elif alert_type == 'printer_repair':
+                    # If printer is no longer under repair, delete dismissal
+                    should_delete = printer.status != 'Under Repair'
+                elif alert_type == 'maintenance_overdue':
                     # If maintenance is no longer overdue, delete dismissal
-                    if printer.maintenance_reminder_date is None or printer.maintenance_reminder_date >= date.today():
-                        should_delete = True
-                except (ValueError, Printer.DoesNotExist):
-                    should_delete = True
-            
-            # Check carbon_overdue dismissals
-            elif dismissal.alert_type == 'carbon_overdue':
-                try:
-                    printer_id = int(dismissal.alert_id.split('_')[-1])
-                    printer = Printer.objects.get(id=printer_id)
+                    should_delete = printer.maintenance_reminder_date is None or \
+                        printer.maintenance_reminder_date >= today
+                elif alert_type == 'carbon_overdue':
                     # If carbon filter is no longer overdue, delete dismissal
-                    if printer.carbon_reminder_date is None or printer.carbon_reminder_date >= date.today():
-                        should_delete = True
-                except (ValueError, Printer.DoesNotExist):
-                    should_delete = True
-            
-            # Check carbon_soon dismissals
-            elif dismissal.alert_type == 'carbon_soon':
-                try:
-                    printer_id = int(dismissal.alert_id.split('_')[-1])
-                    printer = Printer.objects.get(id=printer_id)
+                    should_delete = printer.carbon_reminder_date is None or \
+                        printer.carbon_reminder_date >= today
+                else:
                     # If carbon filter is no longer due soon (outside 7-day window), delete dismissal
-                    if printer.carbon_reminder_date is None or \
-                       printer.carbon_reminder_date < date.today() or \
-                       printer.carbon_reminder_date >= date.today() + timedelta(days=7):
-                        should_delete = True
-                except (ValueError, Printer.DoesNotExist):
-                    should_delete = True
+                    should_delete = printer.carbon_reminder_date is None or \
+                        printer.carbon_reminder_date < today or \
+                        printer.carbon_reminder_date >= soon_cutoff
             
-            # Check project_overdue dismissals
-            elif dismissal.alert_type == 'project_overdue':
-                try:
-                    project_id = int(dismissal.alert_id.split('_')[-1])
-                    project = Project.objects.get(id=project_id)
-                    # If project is completed or due date is today or future, delete dismissal
-                    if project.status == 'Completed' or \
-                       project.due_date is None or \
-                       project.due_date >= date.today():
-                        should_delete = True
-                except (ValueError, Project.DoesNotExist):
+            elif alert_type in ('project_overdue', 'project_due_soon', 'project_blocked'):
+                project = projects.get(target_id)
+                if project is None:
                     should_delete = True
-            
-            # Check project_due_soon dismissals
-            elif dismissal.alert_type == 'project_due_soon':
-                try:
-                    project_id = int(dismissal.alert_id.split('_')[-1])
-                    project = Project.objects.get(id=project_id)
+                elif alert_type == 'project_overdue':
+                    # If project is completed or due date is today or future, delete dismissal
+                    should_delete = project.status == 'Completed' or \
+                        project.due_date is None or \
+                        project.due_date >= today
+                elif alert_type == 'project_due_soon':
                     # If project is completed or no longer due soon, delete dismissal
-                    if project.status == 'Completed' or \
-                       project.due_date is None or \
-                       project.due_date < date.today() or \
-                       project.due_date >= date.today() + timedelta(days=7):
-                        should_delete = True
-                except (ValueError, Project.DoesNotExist):
-                    should_delete = True
-            
-            # Check project_blocked dismissals
-            elif dismissal.alert_type == 'project_blocked':
-                try:
-                    project_id = int(dismissal.alert_id.split('_')[-1])
-                    project = Project.objects.get(id=project_id)
+                    should_delete = project.status == 'Completed' or \
+                        project.due_date is None or \
+                        project.due_date < today or \
+                        project.due_date >= soon_cutoff
+                else:
                     # If project is not in progress or has no unavailable printers, delete dismissal
-                    if project.status != 'In Progress':
-                        should_delete = True
-                    else:
-                        unavailable_printers = project.associated_printers.filter(
-                            status__in=['Under Repair', 'Sold', 'Archived']
-                        )
-                        if not unavailable_printers.exists():
-                            should_delete = True
-                except (ValueError, Project.DoesNotExist):
-                    should_delete = True
+                    should_delete = project.status != 'In Progress' or \
+                        project.id not in blocked_project_ids
             
-            # Check low_stock dismissals
-            elif dismissal.alert_type == 'low_stock':
-                try:
-                    item_id = int(dismissal.alert_id.split('_')[-1])
-                    item = InventoryItem.objects.get(id=item_id)
-                    # Delete dismissal if:
-                    # 1. Item is no longer marked as consumable (alert disabled)
-                    # 2. Low stock threshold is not set (alert disabled)
-                    # 3. Quantity is above threshold (restocked)
-                    if not item.is_consumable or \
-                       item.low_stock_threshold is None or \
-                       item.quantity > item.low_stock_threshold:
-                        should_delete = True
-                except (ValueError, InventoryItem.DoesNotExist):
-                    should_delete = True
+            elif alert_type == 'low_stock':
+                item = items.get(target_id)
+                # Delete dismissal if:
+                # 1. Item is gone or no longer marked as consumable (alert disabled)
+                # 2. Low stock threshold is not set (alert disabled)
+                # 3. Quantity is above threshold (restocked)
+                should_delete = item is None or \
+                    not item.is_consumable or \
+                    item.low_stock_threshold is None or \
+                    item.quantity > item.low_stock_threshold
             
-            # Check tracker_unconfigured dismissals
-            elif dismissal.alert_type == 'tracker_unconfigured':
-                try:
-                    tracker_id = int(dismissal.alert_id.split('_')[-1])
-                    tracker = Tracker.objects.get(id=tracker_id)
-                    # If tracker has no files missing color/material, delete dismissal
-                    from django.db.models import Q
-                    unconfigured_count = tracker.files.filter(
-                        Q(color='') | Q(material='')
-                    ).count()
-                    if unconfigured_count == 0:
-                        should_delete = True
-                except (ValueError, Tracker.DoesNotExist):
-                    should_delete = True
+            elif alert_type == 'tracker_unconfigured':
+                # If tracker is gone or has no files missing color/material, delete dismissal
+                should_delete = target_id not in unconfigured_tracker_ids
             
-            # Delete if condition no longer exists
             if should_delete:
-                dismissal.delete()
+                stale_ids.add(dismissal.id)
+        
+        # Delete if condition no longer exists
+        if stale_ids:
+            AlertDismissal.objects.filter(id__in=stale_ids).delete()
+        
+        self._dismissals = {
+            (dismissal.alert_type, dismissal.alert_id): dismissal
+            for dismissal in dismissals
+            if dismissal.id not in stale_ids
+        }
     
     def _generate_alerts(self):
         """
@@ -636,231 +785,290 @@ class DashboardDataView(APIView):
         Returns:
             Dictionary with 'critical', 'warning', and 'info' alert arrays
         """
-        # Clean up dismissals for conditions that no longer exist
-        self._cleanup_invalid_dismissals()
-        
         today = date.today()
-        alerts = {
-            'critical': [],
-            'warning': [],
-            'info': []
+        soon_cutoff = today + ALERT_WINDOW
+        
+        # Clean up dismissals for conditions that no longer exist; this also
+        # indexes the remaining dismissals for _should_show_alert
+        self._cleanup_invalid_dismissals(today)
+        
+        # One query per model; the database evaluates each alert predicate as
+        # an annotated flag and the helpers below pick their rows from it.
+        printers = list(Printer.objects.filter(
+            Q(maintenance_reminder_date__lt=today) |
+            Q(status='Under Repair') |
+            Q(carbon_reminder_date__lt=soon_cutoff)
+        ).annotate(
+            is_maintenance_overdue=_flag(Q(maintenance_reminder_date__lt=today)),
+            is_under_repair=_flag(Q(status='Under Repair')),
+            is_carbon_overdue=_flag(Q(carbon_reminder_date__lt=today)),
+            is_carbon_soon=_flag(Q(carbon_reminder_date__gte=today, carbon_reminder_date__lt=soon_cutoff)),
+        ).only(
+            'id', 'title', 'status', 'last_maintained_date',
+            'maintenance_reminder_date', 'carbon_reminder_date'
+        ))
+        
+        not_completed = ~Q(status='Completed')
+        unavailable_link = ProjectPrinters.objects.filter(
+            project=OuterRef('pk'),
+            printer__status__in=UNAVAILABLE_PRINTER_STATUSES
+        )
+        projects = list(Project.objects.filter(
+            Q(status='In Progress') |
+            (Q(due_date__lt=soon_cutoff) & not_completed)
+        ).annotate(
+            is_overdue=_flag(Q(due_date__lt=today) & not_completed),
+            is_blocked=_flag(Q(status='In Progress') & Exists(unavailable_link)),
+            is_due_soon=_flag(Q(due_date__gte=today, due_date__lt=soon_cutoff) & not_completed),
+            time_until_due=_time_until_due(today),
+        ).only('id', 'project_name', 'status', 'due_date').prefetch_related(Prefetch(
+            'associated_printers',
+            queryset=Printer.objects.filter(status__in=UNAVAILABLE_PRINTER_STATUSES).only('id', 'title', 'status'),
+            to_attr='unavailable_printers'
+        )))
+        
+        # Printer alerts come before project alerts within each severity
+        return {
+            'critical': [
+                *self._maintenance_overdue_alerts(printers, today),
+                *self._printer_repair_alerts(printers),
+                *self._carbon_overdue_alerts(printers, today),
+                *self._project_overdue_alerts(projects, today),
+                *self._project_blocked_alerts(projects),
+            ],
+            'warning': [
+                *self._carbon_soon_alerts(printers, today),
+                *self._project_due_soon_alerts(projects),
+                *self._tracker_unconfigured_alerts(),
+            ],
+            'info': self._low_stock_alerts(),
         }
-        
-        # CRITICAL ALERTS
-        
-        # 1. Maintenance Overdue (Critical)
-        # Show for all printers with overdue maintenance, regardless of status
-        maintenance_overdue = Printer.objects.filter(
-            maintenance_reminder_date__lt=today
-        ).select_related('manufacturer')
-        
-        for printer in maintenance_overdue:
-            alert_id = f"maintenance_overdue_{printer.id}"
-            state_data = {
+    
+    # CRITICAL ALERTS
+    
+    def _maintenance_overdue_alerts(self, printers, today):
+        """1. Maintenance Overdue - shown for every printer, regardless of status."""
+        candidates = (
+            (printer, f"maintenance_overdue_{printer.id}", {
                 'id': printer.id,
                 'last_maintained_date': printer.last_maintained_date.isoformat() if printer.last_maintained_date else None,
                 'maintenance_reminder_date': printer.maintenance_reminder_date.isoformat() if printer.maintenance_reminder_date else None
+            })
+            for printer in printers if printer.is_maintenance_overdue
+        )
+        return [
+            {
+                'alert_type': 'maintenance_overdue',
+                'alert_id': alert_id,
+                'title': f'Maintenance Overdue: {printer.title}',
+                'message': f'Maintenance was due {(today - printer.maintenance_reminder_date).days} days ago',
+                'link': f'/printers/{printer.id}',
+                'state_data': state_data
             }
-            if self._should_show_alert('maintenance_overdue', alert_id, state_data):
-                days_overdue = (today - printer.maintenance_reminder_date).days
-                alerts['critical'].append({
-                    'alert_type': 'maintenance_overdue',
-                    'alert_id': alert_id,
-                    'title': f'Maintenance Overdue: {printer.title}',
-                    'message': f'Maintenance was due {days_overdue} days ago',
-                    'link': f'/printers/{printer.id}',
-                    'state_data': state_data
-                })
-        
-        # 2. Printer Under Repair (Critical)
-        repair_printers = Printer.objects.filter(
-            status='Under Repair'
-        ).select_related('manufacturer')
-        
-        for printer in repair_printers:
-            alert_id = f"printer_repair_{printer.id}"
-            state_data = {'id': printer.id, 'status': printer.status}
-            if self._should_show_alert('printer_repair', alert_id, state_data):
-                alerts['critical'].append({
-                    'alert_type': 'printer_repair',
-                    'alert_id': alert_id,
-                    'title': f'Printer Under Repair: {printer.title}',
-                    'message': 'This printer is currently under repair',
-                    'link': f'/printers/{printer.id}',
-                    'state_data': state_data
-                })
-        
-        # 3. Carbon Filter Overdue (Critical)
-        carbon_overdue = Printer.objects.filter(
-            carbon_reminder_date__lt=today
-        ).select_related('manufacturer')
-        
-        for printer in carbon_overdue:
-            alert_id = f"carbon_overdue_{printer.id}"
-            state_data = {
+            for printer, alert_id, state_data in candidates
+            if self._should_show_alert('maintenance_overdue', alert_id, state_data)
+        ]
+    
+    def _printer_repair_alerts(self, printers):
+        """2. Printer Under Repair."""
+        candidates = (
+            (printer, f"printer_repair_{printer.id}", {'id': printer.id, 'status': printer.status})
+            for printer in printers if printer.is_under_repair
+        )
+        return [
+            {
+                'alert_type': 'printer_repair',
+                'alert_id': alert_id,
+                'title': f'Printer Under Repair: {printer.title}',
+                'message': 'This printer is currently under repair',
+                'link': f'/printers/{printer.id}',
+                'state_data': state_data
+            }
+            for printer, alert_id, state_data in candidates
+            if self._should_show_alert('printer_repair', alert_id, state_data)
+        ]
+    
+    def _carbon_overdue_alerts(self, printers, today):
+        """3. Carbon Filter Overdue."""
+        candidates = (
+            (printer, f"carbon_overdue_{printer.id}", {
                 'id': printer.id,
                 'carbon_reminder_date': printer.carbon_reminder_date.isoformat() if printer.carbon_reminder_date else None
+            })
+            for printer in printers if printer.is_carbon_overdue
+        )
+        return [
+            {
+                'alert_type': 'carbon_overdue',
+                'alert_id': alert_id,
+                'title': f'Carbon Filter Overdue: {printer.title}',
+                'message': f'Carbon filter replacement was due {(today - printer.carbon_reminder_date).days} days ago',
+                'link': f'/printers/{printer.id}',
+                'state_data': state_data
             }
-            if self._should_show_alert('carbon_overdue', alert_id, state_data):
-                days_overdue = (today - printer.carbon_reminder_date).days
-                alerts['critical'].append({
-                    'alert_type': 'carbon_overdue',
-                    'alert_id': alert_id,
-                    'title': f'Carbon Filter Overdue: {printer.title}',
-                    'message': f'Carbon filter replacement was due {days_overdue} days ago',
-                    'link': f'/printers/{printer.id}',
-                    'state_data': state_data
-                })
-        
-        # WARNING ALERTS
-        
-        # 4. Carbon Filter Due Soon (Warning)
-        # Show for all printers with carbon filter due within 7 days
-        carbon_due_soon = Printer.objects.filter(
-            carbon_reminder_date__gte=today,
-            carbon_reminder_date__lt=today + timedelta(days=7)
-        ).select_related('manufacturer')
-        
-        for printer in carbon_due_soon:
-            alert_id = f"carbon_soon_{printer.id}"
-            state_data = {'id': printer.id, 'carbon_reminder_date': printer.carbon_reminder_date.isoformat() if printer.carbon_reminder_date else None}
-            if self._should_show_alert('carbon_soon', alert_id, state_data):
-                days_until = (printer.carbon_reminder_date - today).days
-                alerts['warning'].append({
-                    'alert_type': 'carbon_soon',
-                    'alert_id': alert_id,
-                    'title': f'Carbon Filter Due Soon: {printer.title}',
-                    'message': f'Carbon filter replacement due in {days_until} days',
-                    'link': f'/printers/{printer.id}',
-                    'state_data': state_data
-                })
-        
-        # 5. Project Overdue (Critical)
-        projects_overdue = Project.objects.filter(
-            due_date__lt=today
-        ).exclude(status='Completed')
-        
-        for project in projects_overdue:
-            alert_id = f"project_overdue_{project.id}"
-            state_data = {'id': project.id, 'due_date': project.due_date.isoformat() if project.due_date else None}
-            if self._should_show_alert('project_overdue', alert_id, state_data):
-                days_overdue = (today - project.due_date).days if project.due_date else 0
-                alerts['critical'].append({
-                    'alert_type': 'project_overdue',
-                    'alert_id': alert_id,
-                    'title': f'Project Overdue: {project.project_name}',
-                    'message': f'Overdue by {days_overdue} {"day" if days_overdue == 1 else "days"}',
-                    'link': f'/projects/{project.id}',
-                    'state_data': state_data
-                })
-        
-        # 6. Projects Blocked by Printer Status (Critical)
-        blocked_projects = Project.objects.filter(
-            status='In Progress'
-        ).prefetch_related('associated_printers')
-        
-        for project in blocked_projects:
-            # Check if any associated printers are unavailable
-            unavailable_printers = project.associated_printers.filter(
-                status__in=['Under Repair', 'Sold', 'Archived']
-            )
-            
-            if unavailable_printers.exists():
-                alert_id = f"project_blocked_{project.id}"
-                # Include printer IDs and statuses in state
-                printer_states = list(unavailable_printers.values_list('id', 'status'))
-                state_data = {
-                    'id': project.id,
-                    'printer_states': printer_states
-                }
-                if self._should_show_alert('project_blocked', alert_id, state_data):
-                    printer_names = list(unavailable_printers.values_list('title', flat=True))
-                    if len(printer_names) == 1:
-                        message = f"Printer '{printer_names[0]}' is unavailable"
-                    else:
-                        message = f"{len(printer_names)} printers unavailable: {', '.join(printer_names)}"
-                    
-                    alerts['critical'].append({
-                        'alert_type': 'project_blocked',
-                        'alert_id': alert_id,
-                        'title': f'Project Blocked: {project.project_name}',
-                        'message': message,
-                        'link': f'/projects/{project.id}',
-                        'state_data': state_data
-                    })
-        
-        # 7. Project Due Soon (Warning)
-        projects_due_soon = Project.objects.filter(
-            due_date__gte=today,
-            due_date__lt=today + timedelta(days=7)
-        ).exclude(status='Completed')
-        
-        for project in projects_due_soon:
-            alert_id = f"project_due_soon_{project.id}"
-            state_data = {'id': project.id, 'due_date': project.due_date.isoformat() if project.due_date else None}
-            if self._should_show_alert('project_due_soon', alert_id, state_data):
-                days_until = project.days_until_due
-                alerts['warning'].append({
-                    'alert_type': 'project_due_soon',
-                    'alert_id': alert_id,
-                    'title': f'Project Due Soon: {project.project_name}',
-                    'message': f'Due in {days_until} days',
-                    'link': f'/projects/{project.id}',
-                    'state_data': state_data
-                })
-        
-        # 8. Tracker with Unconfigured Files (Warning)
-        # Unconfigured = missing color or material configuration
-        from django.db.models import Q
-        
-        trackers_unconfigured = Tracker.objects.filter(
-            Q(files__color='') | Q(files__material='')
-        ).distinct()
-        
-        for tracker in trackers_unconfigured:
-            # Count files missing color or material
-            unconfigured_count = tracker.files.filter(
-                Q(color='') | Q(material='')
-            ).count()
+            for printer, alert_id, state_data in candidates
+            if self._should_show_alert('carbon_overdue', alert_id, state_data)
+        ]
+    
+    def _project_overdue_alerts(self, projects, today):
+        """5. Project Overdue."""
+        candidates = (
+            (project, f"project_overdue_{project.id}", {
+                'id': project.id,
+                'due_date': project.due_date.isoformat() if project.due_date else None
+            })
+            for project in projects if project.is_overdue
+        )
+        return [
+            {
+                'alert_type': 'project_overdue',
+                'alert_id': alert_id,
+                'title': f'Project Overdue: {project.project_name}',
+                'message': f'Overdue by {days_overdue} {"day" if days_overdue == 1 else "days"}',
+                'link': f'/projects/{project.id}',
+                'state_data': state_data
+            }
+            for project, alert_id, state_data in candidates
+            if self._should_show_alert('project_overdue', alert_id, state_data)
+            for days_overdue in [(today - project.due_date).days if project.due_date else 0]
+        ]
+    
+    def _project_blocked_alerts(self, projects):
+        """6. Projects Blocked by Printer Status."""
+        alerts = []
+        for project in projects:
+            if not project.is_blocked:
+                continue
+            # Prefetched in _generate_alerts, ordered by title
+            unavailable_printers = project.unavailable_printers
+            alert_id = f"project_blocked_{project.id}"
+            # Include printer IDs and statuses in state
+            printer_states = [(printer.id, printer.status) for printer in unavailable_printers]
+            state_data = {
+                'id': project.id,
+                'printer_states': printer_states
+            }
+            if not self._should_show_alert('project_blocked', alert_id, state_data):
+                continue
             
-            if unconfigured_count == 0:
-                continue  # Skip if no unconfigured files
+            printer_names = [printer.title for printer in unavailable_printers]
+            if len(printer_names) == 1:
+                message = f"Printer '{printer_names[0]}' is unavailable"
+            else:
+                message = f"{len(printer_names)} printers unavailable: {', '.join(printer_names)}"
             
-            alert_id = f"tracker_unconfigured_{tracker.id}"
-            state_data = {'id': tracker.id, 'github_url': tracker.github_url}
-            if self._should_show_alert('tracker_unconfigured', alert_id, state_data):
-                alerts['warning'].append({
-                    'alert_type': 'tracker_unconfigured',
-                    'alert_id': alert_id,
-                    'title': f'Tracker Needs Configuration: {tracker.name}',
-                    'message': f'{unconfigured_count} file(s) need configuration',
-                    'link': f'/trackers/{tracker.id}',
-                    'state_data': state_data
-                })
-        
-        # INFO ALERTS
-        
-        # 9. Low Stock Items (Info)
-        low_stock_items = InventoryItem.objects.filter(
-            is_consumable=True,
-            quantity__lte=F('low_stock_threshold')
-        ).select_related('brand', 'part_type')
-        
-        for item in low_stock_items:
-            alert_id = f"low_stock_{item.id}"
-            state_data = {'id': item.id, 'quantity': item.quantity, 'min_quantity': item.low_stock_threshold}
-            if self._should_show_alert('low_stock', alert_id, state_data):
-                alerts['info'].append({
-                    'alert_type': 'low_stock',
-                    'alert_id': alert_id,
-                    'title': f'Low Stock: {item.title}',
-                    'message': f'Only {item.quantity} remaining (threshold: {item.low_stock_threshold})',
-                    'link': f'/item/{item.id}',
-                    'state_data': state_data
-                })
-        
+            alerts.append({
+                'alert_type': 'project_blocked',
+                'alert_id': alert_id,
+                'title': f'Project Blocked: {project.project_name}',
+                'message': message,
+                'link': f'/projects/{project.id}',
+                'state_data': state_data
+            })
         return alerts
     
+    # WARNING ALERTS
+    
+    def _carbon_soon_alerts(self, printers, today):
+        """4. Carbon Filter Due Soon - within the next 7 days."""
+        candidates = (
+            (printer, f"carbon_soon_{printer.id}", {
+                'id': printer.id,
+                'carbon_reminder_date': printer.carbon_reminder_date.isoformat() if printer.carbon_reminder_date else None
+            })
+            for printer in printers if printer.is_carbon_soon
+        )
+        return [
+            {
+                'alert_type': 'carbon_soon',
+                'alert_id': alert_id,
+                'title': f'Carbon Filter Due Soon: {printer.title}',
+                'message': f'Carbon filter replacement due in {(printer.carbon_reminder_date - today).days} days',
+                'link': f'/printers/{printer.id}',
+                'state_data': state_data
+            }
+            for printer, alert_id, state_data in candidates
+            if self._should_show_alert('carbon_soon', alert_id, state_data)
+        ]
+    
+    def _project_due_soon_alerts(self, projects):
+        """7. Project Due Soon."""
+        candidates = (
+            (project, f"project_due_soon_{project.id}", {
+                'id': project.id,
+                'due_date': project.due_date.isoformat() if project.due_date else None
+            })
+            for project in projects if project.is_due_soon
+        )
+        return [
+            {
+                'alert_type': 'project_due_soon',
+                'alert_id': alert_id,
+                'title': f'Project Due Soon: {project.project_name}',
+                'message': f'Due in {_days(project.time_until_due)} days',
+                'link': f'/projects/{project.id}',
+                'state_data': state_data
+            }
+            for project, alert_id, state_data in candidates
+            if self._should_show_alert('project_due_soon', alert_id, state_data)
+        ]
+    
+    def _tracker_unconfigured_alerts(self):
+        """8. Tracker with Unconfigured Files - missing color or material configuration."""
+        # Count files missing color or material in the same query
+        trackers_unconfigured = Tracker.objects.annotate(
+            unconfigured_count=Count('files', filter=Q(files__color='') | Q(files__material=''))
+        ).filter(unconfigured_count__gt=0)
+        
+        candidates = (
+            (tracker, f"tracker_unconfigured_{tracker.id}", {
+                'id': tracker.id,
+                'github_url': tracker.github_url
+            })
+            for tracker in trackers_unconfigured
+        )
+        return [
+            {
+                'alert_type': 'tracker_unconfigured',
+                'alert_id': alert_id,
+                'title': f'Tracker Needs Configuration: {tracker.name}',
+                'message': f'{tracker.unconfigured_count} file(s) need configuration',
+                'link': f'/trackers/{tracker.id}',
+                'state_data': state_data
+            }
+            for tracker, alert_id, state_data in candidates
+            if self._should_show_alert('tracker_unconfigured', alert_id, state_data)
+        ]
+    
+    # INFO ALERTS
+    
+    def _low_stock_alerts(self):
+        """9. Low Stock Items."""
+        low_stock_items = InventoryItem.objects.filter(
+            is_low_stock=True
+        ).only('id', 'title', 'quantity', 'low_stock_threshold')
+        
+        candidates = (
+            (item, f"low_stock_{item.id}", {
+                'id': item.id,
+                'quantity': item.quantity,
+                'min_quantity': item.low_stock_threshold
+            })
+            for item in low_stock_items
+        )
+        return [
+            {
+                'alert_type': 'low_stock',
+                'alert_id': alert_id,
+                'title': f'Low Stock: {item.title}',
+                'message': f'Only {item.quantity} remaining (threshold: {item.low_stock_threshold})',
+                'link': f'/item/{item.id}',
+                'state_data': state_data
+            }
+            for item, alert_id, state_data in candidates
+            if self._should_show_alert('low_stock', alert_id, state_data)
+        ]
+    
     def _get_stats(self):
         """
         Get count statistics for dashboard.
@@ -868,12 +1076,21 @@ class DashboardDataView(APIView):
         Returns:
             Dictionary with counts for inventory, printers, projects, trackers
         """
-        return {
-            'inventory_count': InventoryItem.objects.count(),
-            'printer_count': Printer.objects.count(),
-            'project_count': Project.objects.count(),
-            'tracker_count': Tracker.objects.count()
-        }
+        counted = [
+            ('inventory_count', InventoryItem),
+            ('printer_count', Printer),
+            ('project_count', Project),
+            ('tracker_count', Tracker),
+        ]
+        # One round-trip: each count is a scalar subquery of a single SELECT
+        quote = connection.ops.quote_name
+        sql = 'SELECT ' + ', '.join(
+            f'(SELECT COUNT(*) FROM {quote(model._meta.db_table)})' for _, model in counted
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            counts = cursor.fetchone()
+        return {key: count for (key, _), count in zip(counted, counts)}
     
     def _get_featured_trackers(self):
         """
@@ -882,20 +1099,25 @@ class DashboardDataView(APIView):
         Returns:
             List of tracker dictionaries with basic info and progress
         """
+        # Only the displayed columns are fetched; the project name comes
+        # through the join rather than a full Project instance
         trackers = Tracker.objects.filter(
             show_on_dashboard=True
-        ).select_related('project')
+        ).values(
+            'id', 'name', 'project__project_name', 'progress_percentage',
+            'printed_quantity_total', 'total_quantity'
+        )
         
         featured = []
         for tracker in trackers:
             featured.append({
-                'id': tracker.id,
-                'name': tracker.name,
-                'project_name': tracker.project.project_name if tracker.project else None,
-                'progress_percentage': tracker.progress_percentage,
-                'completed_count': tracker.printed_quantity_total,  # Use printed quantity, not status count
-                'total_count': tracker.total_quantity,  # Use total quantity, not file count
-                'status': 'completed' if tracker.progress_percentage == 100 else 'in-progress'
+                'id': tracker['id'],
+                'name': tracker['name'],
+                'project_name': tracker['project__project_name'],
+                'progress_percentage': tracker['progress_percentage'],
+                'completed_count': tracker['printed_quantity_total'],  # Use printed quantity, not status count
+                'total_count': tracker['total_quantity'],  # Use total quantity, not file count
+                'status': 'completed' if tracker['progress_percentage'] == 100 else 'in-progress'
             })
         
         return featured
@@ -904,12 +1126,40 @@ class DashboardDataView(APIView):
         """
         Get active projects (excluding completed, planning, on hold, canceled) with health status.
         
+        The ten projects shown are picked by health (most critical first) and
+        then by start date, so a struggling older project is never pushed out
+        by newer healthy ones.
+        
         Returns:
             List of project dictionaries with basic info and health status
         """
+        today = date.today()
         projects = Project.objects.filter(
             status='In Progress'
-        ).order_by('-start_date', '-id')[:10]
+        ).annotate(
+            time_until_due=_time_until_due(today),
+            printer_count=Count('associated_printers', distinct=True),
+            unavailable_count=Count(
+                'associated_printers', distinct=True,
+                filter=Q(associated_printers__status__in=UNAVAILABLE_PRINTER_STATUSES)
+            ),
+        ).annotate(
+            # Same priority as primary_health below
+            health_weight=Case(
+                When(due_date__lt=today, then=Value(4)),
+                When(unavailable_count__gt=0, unavailable_count=F('printer_count'), then=Value(3)),
+                When(unavailable_count__gt=0, then=Value(2)),
+                When(due_date__lte=today + ALERT_WINDOW, then=Value(1)),
+                default=Value(0),
+                output_field=models.IntegerField()
+            )
+        ).only('id', 'project_name', 'status', 'due_date').order_by(
+            '-health_weight', '-start_date', '-id'
+        ).prefetch_related(Prefetch(
+            'associated_printers',
+            queryset=Printer.objects.filter(status__in=UNAVAILABLE_PRINTER_STATUSES).only('id', 'title', 'status'),
+            to_attr='blocked_printers'
+        ))[:10]
         
         active = []
         
@@ -919,26 +1169,24 @@ class DashboardDataView(APIView):
             health_reasons = []
             
             # Check if project is blocked by printer status
-            blocked_printers = project.associated_printers.filter(
-                status__in=['Under Repair', 'Sold', 'Archived']
-            )
-            total_printers = project.associated_printers.count()
+            blocked_printers = project.blocked_printers
+            total_printers = project.printer_count
 
             is_blocked = False
             is_partially_blocked = False
             is_overdue = False
             is_at_risk = False
 
-            if blocked_printers.exists():
+            if blocked_printers:
                 # Build reason message
-                printer_names = list(blocked_printers.values_list('title', 'status'))
+                printer_names = [(printer.title, printer.status) for printer in blocked_printers]
                 if len(printer_names) == 1:
                     blocked_reason = f"Printer '{printer_names[0][0]}' is {printer_names[0][1]}"
                 else:
                     reasons = [f"{name} ({status})" for name, status in printer_names]
                     blocked_reason = f"Printers: {', '.join(reasons)}"
 
-                if blocked_printers.count() == total_printers:
+                if len(blocked_printers) == total_printers:
                     # All printers unavailable → fully blocked
                     is_blocked = True
                     health_statuses.append('blocked')
@@ -947,24 +1195,23 @@ class DashboardDataView(APIView):
                     # Only some printers unavailable → partially blocked
                     is_partially_blocked = True
                     partial_msg = (
-                        f"{blocked_printers.count()} of {total_printers} printers unavailable"
+                        f"{len(blocked_printers)} of {total_printers} printers unavailable"
                         f" ({blocked_reason})"
                     )
                     health_statuses.append('partially-blocked')
                     health_reasons.append(partial_msg)
             
             # Check due date
-            if project.due_date:
-                days_until = project.days_until_due
-                if days_until is not None:
-                    if days_until < 0:
-                        is_overdue = True
-                        health_statuses.append('overdue')
-                        health_reasons.append(f"Past due by {abs(days_until)} days")
-                    elif days_until <= 7:
-                        is_at_risk = True
-                        health_statuses.append('at-risk')
-                        health_reasons.append(f"Due in {days_until} days")
+            days_until = _days(project.time_until_due)
+            if days_until is not None:
+                if days_until < 0:
+                    is_overdue = True
+                    health_statuses.append('overdue')
+                    health_reasons.append(f"Past due by {abs(days_until)} days")
+                elif days_until <= ALERT_WINDOW.days:
+                    is_at_risk = True
+                    health_statuses.append('at-risk')
+                    health_reasons.append(f"Due in {days_until} days")
             
             # If no issues, it's healthy
             if not health_statuses:
@@ -993,7 +1240,7 @@ class DashboardDataView(APIView):
                 'health_statuses': health_statuses,  # All applicable statuses
                 'health_reason': combined_reason,
                 'due_date': project.due_date.isoformat() if project.due_date else None,
-                'days_until_due': project.days_until_due
+                'days_until_due': days_until
             })
         
         return active
@@ -1030,14 +1277,14 @@ class DismissAlertView(APIView):
             )
         
         # Generate state hash for this alert
-        dashboard_view = DashboardDataView()
-        state_hash = dashboard_view._generate_state_hash(alert_type, state_data)
+        state_json = _encode_alert_state(alert_type, state_data)
+        state_hash = _hash_state_json(state_json)
         
         # Create or update the dismissal record with state hash
         dismissal, created = AlertDismissal.objects.update_or_create(
             alert_type=alert_type,
             alert_id=alert_id,
-            defaults={'state_hash': state_hash}
+            defaults={'state_hash': state_hash, 'state_json': state_json}
         )
         
         return Response({
@@ -1081,8 +1328,10 @@ class DismissAllAlertsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        dashboard_view = DashboardDataView()
         dismissed_count = 0
+        # Keyed by alert so a repeated entry keeps its last state, as a
+        # sequence of update_or_create calls would
+        dismissals = {}
         
         for alert in alerts:
             alert_type = alert.get('alert_type')
@@ -1091,16 +1340,27 @@ class DismissAllAlertsView(APIView):
             
             if alert_type and alert_id:
                 # Generate state hash
-                state_hash = dashboard_view._generate_state_hash(alert_type, state_data)
+                state_json = _encode_alert_state(alert_type, state_data)
+                state_hash = _hash_state_json(state_json)
                 
-                # Create or update dismissal with state hash
-                AlertDismissal.objects.update_or_create(
+                dismissals[(alert_type, alert_id)] = AlertDismissal(
                     alert_type=alert_type,
                     alert_id=alert_id,
-                    defaults={'state_hash': state_hash}
+                    state_hash=state_hash,
+                    state_json=state_json
                 )
                 dismissed_count += 1
         
+        # Create or update every dismissal in one upsert
+        AlertDismissal.objects.bulk_create(
+            dismissals.values(),
+            update_conflicts=True,
+            unique_fields=['alert_type', 'alert_id'],
+            update_fields=['state_hash', 'state_json']
+        )
+        # bulk_create sends no post_save, so drop the cached dashboard here
+        invalidate_dashboard_cache()
+        
         return Response({
             'success': True,
             'dismissed_count': dismissed_count
@@ -1140,6 +1400,22 @@ def parse_date(date_string):
         return None
 
 
+def _read_csv_from_zip(zipfile_obj, filename):
+    """
+    Yield the rows of a CSV member as header -> value dicts.
+
+    Rows are decoded straight off the archive stream, so memory stays
+    bounded by one row however large the section is.
+    """
+    with zipfile_obj.open(filename, 'r') as f:
+        reader = csv.reader(TextIOWrapper(f, encoding='utf-8', newline=''))
+        header = next(reader, None)
+        if header is None:
+            return
+        for row in reader:
+            yield dict(zip(header, row))
+
+
 class ValidateBackupView(APIView):
     """
     Validate a backup ZIP file before importing.
@@ -1162,15 +1438,9 @@ class ValidateBackupView(APIView):
             }
             
             with zipfile.ZipFile(backup_file, 'r') as zf:
-                def read_csv_from_zip(zipfile_obj, filename):
-                    with zipfile_obj.open(filename, 'r') as f:
-                        reader = csv.reader(StringIO(f.read().decode('utf-8')))
-                        header = next(reader)
-                        return [dict(zip(header, row)) for row in reader]
-                
                 # Validate Projects (base dependency)
                 if 'projects.csv' in zf.namelist():
-                    project_rows = read_csv_from_zip(zf, 'projects.csv')
+                    project_rows = _read_csv_from_zip(zf, 'projects.csv')
                     project_ids = set()
                     section_valid = 0
                     section_invalid = 0
@@ -1209,7 +1479,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate Printers (base dependency)
                 if 'printers.csv' in zf.namelist():
-                    printer_rows = read_csv_from_zip(zf, 'printers.csv')
+                    printer_rows = _read_csv_from_zip(zf, 'printers.csv')
                     printer_ids = set()
                     section_valid = 0
                     section_invalid = 0
@@ -1239,7 +1509,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate Inventory Items (base dependency)
                 if 'inventory.csv' in zf.namelist():
-                    inventory_rows = read_csv_from_zip(zf, 'inventory.csv')
+                    inventory_rows = _read_csv_from_zip(zf, 'inventory.csv')
                     inventory_ids = set()
                     section_valid = 0
                     section_invalid = 0
@@ -1269,7 +1539,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate Trackers (base dependency)
                 if 'trackers.csv' in zf.namelist():
-                    tracker_rows = read_csv_from_zip(zf, 'trackers.csv')
+                    tracker_rows = _read_csv_from_zip(zf, 'trackers.csv')
                     tracker_ids = set()
                     section_valid = 0
                     section_invalid = 0
@@ -1306,7 +1576,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate ProjectLinks (depends on projects)
                 if 'project_links.csv' in zf.namelist():
-                    link_rows = read_csv_from_zip(zf, 'project_links.csv')
+                    link_rows = _read_csv_from_zip(zf, 'project_links.csv')
                     section_valid = 0
                     section_invalid = 0
                     
@@ -1332,7 +1602,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate ProjectFiles (depends on projects)
                 if 'project_files.csv' in zf.namelist():
-                    file_rows = read_csv_from_zip(zf, 'project_files.csv')
+                    file_rows = _read_csv_from_zip(zf, 'project_files.csv')
                     section_valid = 0
                     section_invalid = 0
                     
@@ -1358,7 +1628,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate ProjectInventory (depends on projects and inventory)
                 if 'project_inventory.csv' in zf.namelist():
-                    proj_inv_rows = read_csv_from_zip(zf, 'project_inventory.csv')
+                    proj_inv_rows = _read_csv_from_zip(zf, 'project_inventory.csv')
                     section_valid = 0
                     section_invalid = 0
                     
@@ -1390,7 +1660,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate ProjectPrinters (depends on projects and printers)
                 if 'project_printers.csv' in zf.namelist():
-                    proj_printer_rows = read_csv_from_zip(zf, 'project_printers.csv')
+                    proj_printer_rows = _read_csv_from_zip(zf, 'project_printers.csv')
                     section_valid = 0
                     section_invalid = 0
                     
@@ -1422,7 +1692,7 @@ class ValidateBackupView(APIView):
                 
                 # Validate TrackerFiles (depends on trackers)
                 if 'tracker_files.csv' in zf.namelist():
-                    tfile_rows = read_csv_from_zip(zf, 'tracker_files.csv')
+                    tfile_rows = _read_csv_from_zip(zf, 'tracker_files.csv')
                     section_valid = 0
                     section_invalid = 0
                     
@@ -1475,6 +1745,188 @@ class ValidateBackupView(APIView):
             return Response({'error': f'Validation failed: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+MEDIA_DELETE_WORKERS = 8
+
+
+def _clear_media_dirs(media_root, keep=None):
+    """
+    Remove every directory under ``media_root`` but ``keep``; top-level
+    files are kept.
+
+    Each folder (inventory_photos/, trackers/, ...) is removed on its own
+    thread so their unlink calls overlap instead of running back to back.
+    """
+    if not os.path.isdir(media_root):
+        return
+    with os.scandir(media_root) as entries:
+        paths = [entry.path for entry in entries if entry.is_dir() and entry.path != keep]
+    with ThreadPoolExecutor(max_workers=MEDIA_DELETE_WORKERS) as executor:
+        list(executor.map(shutil.rmtree, paths))
+
+
+def _clear_zip_caches():
+    """
+    Remove every cached mod and tracker download ZIP.
+
+    For delete-all and a committed restore: the archives belong to rows
+    that are gone, and a restored row may reuse an old id.
+    """
+    prune_zip_cache(settings.MOD_ZIP_CACHE_DIR, 0)
+    prune_zip_cache(settings.TRACKER_ZIP_CACHE_DIR, 0)
+
+
+# Tables emptied before a restore, children before parents
+RESTORED_MODELS = [
+    TrackerFile, Tracker, ProjectPrinters, ProjectInventory, ProjectFile, ProjectLink,
+    Project, InventoryItem, ModFile, Mod, Printer, Brand, PartType, Location,
+]
+
+
+def _delete_all_rows(models_to_empty):
+    """
+    Empty the tables of ``models_to_empty`` with one DELETE per table.
+
+    Rows in other tables that point at them are resolved first through the
+    ORM according to their on_delete, so those keep their usual semantics:
+    CASCADE rows are deleted (with their own signals and cascades) and
+    SET_NULL columns are cleared. The emptied models' own per-row
+    post_delete handlers are skipped on purpose: they only remove media
+    files and refresh tracker totals and the dashboard cache, and callers
+    clear MEDIA_ROOT and the dashboard cache themselves.
+    """
+    emptied = set(models_to_empty)
+    through_models = set()
+    for model in models_to_empty:
+        for relation in model._meta.related_objects:
+            if relation.related_model in emptied:
+                continue
+            if relation.many_to_many:
+                through_models.add(relation.through)
+                continue
+            field_name = relation.field.name
+            referencing = relation.related_model._base_manager.filter(**{f'{field_name}__isnull': False})
+            if relation.on_delete is models.CASCADE:
+                referencing.delete()
+            elif relation.on_delete is models.SET_NULL:
+                referencing.update(**{field_name: None})
+            elif relation.on_delete is not models.DO_NOTHING:
+                raise ValueError(f"Cannot bulk-delete {model.__name__}: unhandled reference from {relation.related_model.__name__}")
+        through_models.update(
+            field.remote_field.through for field in model._meta.many_to_many
+        )
+
+    with connection.cursor() as cursor:
+        for model in [*(through_models - emptied), *models_to_empty]:
+            cursor.execute(f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)}')
+
+
+BACKUP_MEDIA_FOLDERS = ('inventory_photos/', 'printer_photos/', 'project_photos/', 'mod_files/', 'project_files/', 'trackers/')
+
+
+def _extract_backup_media(zf, media_root):
+    """
+    Copy the media members of a backup archive into ``media_root``.
+
+    CSV sections, EXPORT_ERRORS.txt and anything outside the known media
+    folders are left in the archive.
+    """
+    for member in zf.namelist():
+        # Skip directory entries (paths ending with /)
+        if member.endswith('/'):
+            continue
+        
+        # Skip CSV files - we'll read them directly from ZIP, not extract to disk
+        if member.endswith('.csv'):
+            continue
+        
+        # Skip EXPORT_ERRORS.txt if present in the backup
+        if member == 'EXPORT_ERRORS.txt':
+            continue
+        
+        # Extract media files from recognized folders
+        if member.startswith(BACKUP_MEDIA_FOLDERS):
+            target_path = os.path.join(media_root, member)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            with zf.open(member) as src, open(target_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def _replace_media_dirs(staging_dir, media_root):
+    """
+    Swap the media folders extracted to ``staging_dir`` in for the ones
+    under ``media_root``, then remove ``staging_dir``.
+
+    ``staging_dir`` must sit inside ``media_root`` so each folder is moved
+    with a rename rather than copied.
+    """
+    _clear_media_dirs(media_root, keep=staging_dir)
+    with os.scandir(staging_dir) as entries:
+        for entry in entries:
+            os.replace(entry.path, os.path.join(media_root, entry.name))
+    os.rmdir(staging_dir)
+
+
+IMPORT_BATCH_SIZE = 500
+
+
+def _as_id(value):
+    """Return ``value`` as an integer primary key, or None if it is not one."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bulk_insert(model, pending, import_errors):
+    """
+    Insert ``pending`` (a list of ``(error_key, instance)`` pairs) in batches.
+
+    A batch the database rejects is retried one row at a time, so a bad row
+    is still reported under its own error key instead of failing its batch.
+    Returns the ids of the rows that were inserted.
+    """
+    inserted_ids = set()
+    for start in range(0, len(pending), IMPORT_BATCH_SIZE):
+        batch = pending[start:start + IMPORT_BATCH_SIZE]
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create([instance for _, instance in batch])
+            inserted_ids.update(_as_id(instance.pk) for _, instance in batch)
+        except Exception:
+            for error_key, instance in batch:
+                try:
+                    with transaction.atomic():
+                        instance.save(force_insert=True)
+                    inserted_ids.add(_as_id(instance.pk))
+                except Exception as e:
+                    logger.error(f"Failed to import {error_key}: {e}", exc_info=True)
+                    import_errors.append(error_key)
+    return inserted_ids
+
+
+def _drop_orphans(pending, import_errors, **parent_ids):
+    """
+    Drop the rows of ``pending`` whose parent was not restored.
+
+    ``parent_ids`` maps a foreign key attribute (``printer_id``) to the ids
+    inserted for that parent; a null key is left alone. Foreign keys are
+    deferred until COMMIT, so an orphan that reached bulk_create would not
+    fail on its own but would roll back the whole restore. Each dropped row
+    is reported under its own error key instead.
+    """
+    kept = []
+    for error_key, instance in pending:
+        for attname, ids in parent_ids.items():
+            value = getattr(instance, attname)
+            if value is not None and _as_id(value) not in ids:
+                logger.error(f"Failed to import {error_key}: {attname} {value} was not restored")
+                import_errors.append(error_key)
+                break
+        else:
+            kept.append((error_key, instance))
+    return kept
+
+
 class ImportDataView(APIView):
     permission_classes = [AllowAny]
     def post(self, request, *args, **kwargs):
@@ -1482,403 +1934,436 @@ class ImportDataView(APIView):
         if not backup_file:
             return Response({'error': 'No backup file provided.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        media_root = settings.MEDIA_ROOT
+        staging_dir = None
         try:
-            # Clear all data in the correct order
-            TrackerFile.objects.all().delete()
-            Tracker.objects.all().delete()
-            ProjectPrinters.objects.all().delete()
-            ProjectInventory.objects.all().delete()
-            ProjectFile.objects.all().delete()
-            ProjectLink.objects.all().delete()
-            Project.objects.all().delete()
-            InventoryItem.objects.all().delete()
-            ModFile.objects.all().delete()
-            Mod.objects.all().delete()
-            Printer.objects.all().delete()
-            Brand.objects.all().delete()
-            PartType.objects.all().delete()
-            Location.objects.all().delete()
-
-            # Clear media directory
-            media_root = settings.MEDIA_ROOT
-            if os.path.isdir(media_root):
-                for item in os.listdir(media_root):
-                    item_path = os.path.join(media_root, item)
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-
-            # Track import errors
-            import_errors = []
+            # Open the archive before anything is deleted, so an upload that
+            # is not a ZIP leaves the current rows and media untouched
+            zf = zipfile.ZipFile(backup_file, 'r')
+
+            # Media is extracted next to the live folders and only swapped in
+            # once the restore commits
+            os.makedirs(media_root, exist_ok=True)
+            staging_dir = tempfile.mkdtemp(prefix='.restore-', dir=media_root)
+
+            # Ids restored per parent table. Foreign keys are created
+            # deferrable and only checked at commit, so child rows are
+            # matched against these before they are inserted.
+            printer_ids, inventory_ids, project_ids, mod_ids, tracker_ids = set(), set(), set(), set(), set()
+
+            # One transaction for the whole restore: a single commit instead of
+            # one per row, and a failed restore leaves the old data in place.
+            with transaction.atomic():
+                # Clear all data in the correct order
+                _delete_all_rows(RESTORED_MODELS)
+
+                # Track import errors
+                import_errors = []
             
-            # Extract all files from ZIP to media directory
-            with zipfile.ZipFile(backup_file, 'r') as zf:
-                for member in zf.namelist():
-                    # Skip directory entries (paths ending with /)
-                    if member.endswith('/'):
-                        continue
-                    
-                    # Skip CSV files - we'll read them directly from ZIP, not extract to disk
-                    if member.endswith('.csv'):
-                        continue
-                    
-                    # Skip EXPORT_ERRORS.txt if present in the backup
-                    if member == 'EXPORT_ERRORS.txt':
-                        continue
-                    
-                    # Extract media files from recognized folders
-                    if member.startswith(('inventory_photos/', 'printer_photos/', 'project_photos/', 'mod_files/', 'project_files/', 'trackers/')):
-                        target_path = os.path.join(media_root, member)
-                        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                        with open(target_path, 'wb') as f:
-                            f.write(zf.read(member))
-
-                # Restore App Configuration (module visibility, etc.) if present.
-                # Optional section — older backups won't have it; never fail the import.
-                try:
-                    if 'app_config.json' in zf.namelist():
-                        cfg_data = json.loads(zf.read('app_config.json').decode('utf-8'))
-                        hidden = cfg_data.get('hidden_modules', [])
-                        if isinstance(hidden, list):
-                            config = AppConfiguration.load()
-                            config.hidden_modules = [k for k in hidden if k in HIDEABLE_MODULE_KEYS]
-                            config.save()
-                except Exception as e:
-                    logger.error(f"Failed to import app configuration: {e}", exc_info=True)
-                    import_errors.append("app_config_section")
-
-                def read_csv_from_zip(zipfile_obj, filename):
-                    with zipfile_obj.open(filename, 'r') as f:
-                        reader = csv.reader(StringIO(f.read().decode('utf-8')))
-                        header = next(reader)
-                        return [dict(zip(header, row)) for row in reader]
+                # Extract all files from ZIP to the staging directory. Extraction
+                # is disk-bound and touches no tables, so it runs on its own thread
+                # while the CSV sections below are imported.
+                with zf, ThreadPoolExecutor(max_workers=1) as media_executor:
+                    media_extraction = media_executor.submit(_extract_backup_media, zf, staging_dir)
+
+                    # Restore App Configuration (module visibility, etc.) if present.
+                    # Optional section — older backups won't have it; never fail the import.
+                    try:
+                        if 'app_config.json' in zf.namelist():
+                            cfg_data = json.loads(zf.read('app_config.json').decode('utf-8'))
+                            hidden = cfg_data.get('hidden_modules', [])
+                            if isinstance(hidden, list):
+                                with transaction.atomic():
+                                    config = AppConfiguration.load()
+                                    config.hidden_modules = [k for k in hidden if k in HIDEABLE_MODULE_KEYS]
+                                    config.save()
+                    except Exception as e:
+                        logger.error(f"Failed to import app configuration: {e}", exc_info=True)
+                        import_errors.append("app_config_section")
 
-                # Import Brands, PartTypes, Locations from inventory.csv
-                try:
-                    if 'inventory.csv' in zf.namelist():
-                        inventory_rows = read_csv_from_zip(zf, 'inventory.csv')
-                        for row in inventory_rows:
-                            try:
+                    # Collect Brand, PartType and Location names from inventory.csv
+                    lookup_names = {Brand: set(), PartType: set(), Location: set()}
+                    try:
+                        if 'inventory.csv' in zf.namelist():
+                            inventory_rows = _read_csv_from_zip(zf, 'inventory.csv')
+                            for row in inventory_rows:
                                 if row.get('brand'):
-                                    Brand.objects.get_or_create(name=row['brand'])
+                                    lookup_names[Brand].add(row['brand'])
                                 if row.get('part_type'):
-                                    PartType.objects.get_or_create(name=row['part_type'])
+                                    lookup_names[PartType].add(row['part_type'])
                                 if row.get('location'):
-                                    Location.objects.get_or_create(name=row['location'])
-                            except Exception as e:
-                                logger.error(f"Failed to import lookup data from inventory row {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"lookup_inventory_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import lookup data from inventory section: {e}", exc_info=True)
-                    import_errors.append("lookup_inventory_section")
+                                    lookup_names[Location].add(row['location'])
+                    except Exception as e:
+                        logger.error(f"Failed to import lookup data from inventory section: {e}", exc_info=True)
+                        import_errors.append("lookup_inventory_section")
 
-                # Import Brands from printers.csv
-                try:
-                    if 'printers.csv' in zf.namelist():
-                        printer_rows = read_csv_from_zip(zf, 'printers.csv')
-                        for row in printer_rows:
-                            try:
+                    # Collect Brands from printers.csv
+                    try:
+                        if 'printers.csv' in zf.namelist():
+                            printer_rows = _read_csv_from_zip(zf, 'printers.csv')
+                            for row in printer_rows:
                                 if row.get('manufacturer'):
-                                    Brand.objects.get_or_create(name=row['manufacturer'])
-                            except Exception as e:
-                                logger.error(f"Failed to import brand from printer row {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"brand_printer_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import brands from printers section: {e}", exc_info=True)
-                    import_errors.append("brand_printers_section")
-
-                # Import Printer objects
-                try:
-                    if 'printers.csv' in zf.namelist():
-                        printer_rows = read_csv_from_zip(zf, 'printers.csv')
-                        for row in printer_rows:
-                            try:
-                                manufacturer = Brand.objects.filter(name=row.get('manufacturer')).first() if row.get('manufacturer') else None
-                                printer = Printer(
-                                    id=row['id'],
-                                    title=row['title'],
-                                    manufacturer=manufacturer,
-                                    serial_number=row.get('serial_number') or None,
-                                    purchase_date=parse_date(row.get('purchase_date')),
-                                    status=row.get('status', ''),
-                                    notes=row.get('notes', ''),
-                                    purchase_price=row.get('purchase_price', None) or None,
-                                    build_size_x=row.get('build_size_x', None) or None,
-                                    build_size_y=row.get('build_size_y', None) or None,
-                                    build_size_z=row.get('build_size_z', None) or None,
-                                    photo=f"printer_photos/{row['photo']}" if row.get('photo') else None,
-                                    last_maintained_date=parse_date(row.get('last_maintained_date')),
-                                    maintenance_reminder_date=parse_date(row.get('maintenance_reminder_date')),
-                                    last_carbon_replacement_date=parse_date(row.get('last_carbon_replacement_date')),
-                                    carbon_reminder_date=parse_date(row.get('carbon_reminder_date')),
-                                    maintenance_notes=row.get('maintenance_notes', ''),
-                                    moonraker_url=row.get('moonraker_url', None)
-                                )
-                                printer.save()
-                            except Exception as e:
-                                logger.error(f"Failed to import printer {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"printer_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import printers section: {e}", exc_info=True)
-                    import_errors.append("printers_section")
+                                    lookup_names[Brand].add(row['manufacturer'])
+                    except Exception as e:
+                        logger.error(f"Failed to import brands from printers section: {e}", exc_info=True)
+                        import_errors.append("brand_printers_section")
+
+                    # Create the missing lookup rows, then resolve names to ids
+                    # from memory while importing printers and inventory
+                    for model, names in lookup_names.items():
+                        existing = set(model.objects.filter(name__in=names).values_list('name', flat=True))
+                        _bulk_insert(model, [
+                            (f"{model.__name__.lower()}_{name}", model(name=name))
+                            for name in sorted(names - existing)
+                        ], import_errors)
+                    brand_ids = dict(Brand.objects.values_list('name', 'id'))
+                    part_type_ids = dict(PartType.objects.values_list('name', 'id'))
+                    location_ids = dict(Location.objects.values_list('name', 'id'))
+                    vendor_ids = dict(Vendor.objects.values_list('name', 'id'))
+
+                    # Import Printer objects
+                    try:
+                        if 'printers.csv' in zf.namelist():
+                            printer_rows = _read_csv_from_zip(zf, 'printers.csv')
+                            printers = []
+                            for row in printer_rows:
+                                try:
+                                    printer = Printer(
+                                        id=row['id'],
+                                        title=row['title'],
+                                        manufacturer_id=brand_ids.get(row.get('manufacturer')),
+                                        serial_number=row.get('serial_number') or None,
+                                        purchase_date=parse_date(row.get('purchase_date')),
+                                        status=row.get('status', ''),
+                                        notes=row.get('notes', ''),
+                                        purchase_price=row.get('purchase_price', None) or None,
+                                        build_size_x=row.get('build_size_x', None) or None,
+                                        build_size_y=row.get('build_size_y', None) or None,
+                                        build_size_z=row.get('build_size_z', None) or None,
+                                        photo=f"printer_photos/{row['photo']}" if row.get('photo') else None,
+                                        last_maintained_date=parse_date(row.get('last_maintained_date')),
+                                        maintenance_reminder_date=parse_date(row.get('maintenance_reminder_date')),
+                                        last_carbon_replacement_date=parse_date(row.get('last_carbon_replacement_date')),
+                                        carbon_reminder_date=parse_date(row.get('carbon_reminder_date')),
+                                        maintenance_notes=row.get('maintenance_notes', ''),
+                                        moonraker_url=row.get('moonraker_url', None)
+                                    )
+                                    printers.append((f"printer_{row['id']}", printer))
+                                except Exception as e:
+                                    logger.error(f"Failed to import printer {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"printer_{row.get('id', 'unknown')}")
+                            printer_ids = _bulk_insert(Printer, printers, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import printers section: {e}", exc_info=True)
+                        import_errors.append("printers_section")
 
-                # Import Inventory Items
-                try:
-                    if 'inventory.csv' in zf.namelist():
-                        inventory_rows = read_csv_from_zip(zf, 'inventory.csv')
-                        for row in inventory_rows:
-                            try:
-                                brand = Brand.objects.filter(name=row.get('brand')).first() if row.get('brand') else None
-                                part_type = PartType.objects.filter(name=row.get('part_type')).first() if row.get('part_type') else None
-                                location = Location.objects.filter(name=row.get('location')).first() if row.get('location') else None
-                                vendor_name = row.get('vendor', '')
-                                vendor = Vendor.objects.filter(name=vendor_name).first() if vendor_name else None
-                                item = InventoryItem(
-                                    id=row['id'],
-                                    title=row['title'],
-                                    brand=brand,
-                                    part_type=part_type,
-                                    location=location,
-                                    quantity=int(row['quantity']) if row['quantity'] else 0,
-                                    cost=float(row['cost']) if row['cost'] else None,
-                                    notes=row.get('notes', ''),
-                                    photo=f"inventory_photos/{row['photo']}" if row.get('photo') else None,
-                                    is_consumable=row.get('is_consumable', 'false').lower() == 'true',
-                                    low_stock_threshold=int(row.get('low_stock_threshold', 0)) if row.get('low_stock_threshold') else None,
-                                    vendor=vendor,
-                                    vendor_link=row.get('vendor_link', '') or None,
-                                    model=row.get('model', '') or None
-                                )
-                                item.save()
-                            except Exception as e:
-                                logger.error(f"Failed to import inventory item {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"inventory_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import inventory section: {e}", exc_info=True)
-                    import_errors.append("inventory_section")
+                    # Import Inventory Items
+                    try:
+                        if 'inventory.csv' in zf.namelist():
+                            inventory_rows = _read_csv_from_zip(zf, 'inventory.csv')
+                            items = []
+                            for row in inventory_rows:
+                                try:
+                                    item = InventoryItem(
+                                        id=row['id'],
+                                        title=row['title'],
+                                        brand_id=brand_ids.get(row.get('brand')),
+                                        part_type_id=part_type_ids.get(row.get('part_type')),
+                                        location_id=location_ids.get(row.get('location')),
+                                        quantity=int(row['quantity']) if row['quantity'] else 0,
+                                        cost=float(row['cost']) if row['cost'] else None,
+                                        notes=row.get('notes', ''),
+                                        photo=f"inventory_photos/{row['photo']}" if row.get('photo') else None,
+                                        is_consumable=row.get('is_consumable', 'false').lower() == 'true',
+                                        low_stock_threshold=int(row.get('low_stock_threshold', 0)) if row.get('low_stock_threshold') else None,
+                                        vendor_id=vendor_ids.get(row.get('vendor')),
+                                        vendor_link=row.get('vendor_link', '') or None,
+                                        model=row.get('model', '') or None
+                                    )
+                                    items.append((f"inventory_{row['id']}", item))
+                                except Exception as e:
+                                    logger.error(f"Failed to import inventory item {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"inventory_{row.get('id', 'unknown')}")
+                            inventory_ids = _bulk_insert(InventoryItem, items, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import inventory section: {e}", exc_info=True)
+                        import_errors.append("inventory_section")
 
-                # Import Projects
-                try:
-                    if 'projects.csv' in zf.namelist():
-                        project_rows = read_csv_from_zip(zf, 'projects.csv')
-                        for row in project_rows:
-                            try:
-                                project = Project(
-                                    id=row['id'],
-                                    project_name=row['project_name'],
-                                    description=row.get('description', ''),
-                                    status=row.get('status', ''),
-                                    start_date=parse_date(row.get('start_date')),
-                                    due_date=parse_date(row.get('due_date')),
-                                    notes=row.get('notes', ''),
-                                    photo=f"project_photos/{row['photo']}" if row.get('photo') else None
-                                )
-                                project.save()
-                            except Exception as e:
-                                logger.error(f"Failed to import project {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"project_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import projects section: {e}", exc_info=True)
-                    import_errors.append("projects_section")
+                    # Import Projects
+                    try:
+                        if 'projects.csv' in zf.namelist():
+                            project_rows = _read_csv_from_zip(zf, 'projects.csv')
+                            projects = []
+                            for row in project_rows:
+                                try:
+                                    project = Project(
+                                        id=row['id'],
+                                        project_name=row['project_name'],
+                                        description=row.get('description', ''),
+                                        status=row.get('status', ''),
+                                        start_date=parse_date(row.get('start_date')),
+                                        due_date=parse_date(row.get('due_date')),
+                                        notes=row.get('notes', ''),
+                                        photo=f"project_photos/{row['photo']}" if row.get('photo') else None
+                                    )
+                                    projects.append((f"project_{row['id']}", project))
+                                except Exception as e:
+                                    logger.error(f"Failed to import project {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"project_{row.get('id', 'unknown')}")
+                            project_ids = _bulk_insert(Project, projects, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import projects section: {e}", exc_info=True)
+                        import_errors.append("projects_section")
 
-                # Import Mods
-                try:
-                    if 'mods.csv' in zf.namelist():
-                        mod_rows = read_csv_from_zip(zf, 'mods.csv')
-                        for row in mod_rows:
-                            try:
-                                Mod.objects.create(
-                                    id=row['id'],
-                                    printer_id=row['printer_id'],
-                                    name=row['name'],
-                                    link=row['link'],
-                                    status=row['status']
-                                )
-                            except Exception as e:
-                                logger.error(f"Failed to import mod {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"mod_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import mods section: {e}", exc_info=True)
-                    import_errors.append("mods_section")
+                    # Import Mods
+                    try:
+                        if 'mods.csv' in zf.namelist():
+                            mod_rows = _read_csv_from_zip(zf, 'mods.csv')
+                            mods = []
+                            for row in mod_rows:
+                                try:
+                                    mods.append((f"mod_{row['id']}", Mod(
+                                        id=row['id'],
+                                        printer_id=row['printer_id'],
+                                        name=row['name'],
+                                        link=row['link'],
+                                        status=row['status']
+                                    )))
+                                except Exception as e:
+                                    logger.error(f"Failed to import mod {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"mod_{row.get('id', 'unknown')}")
+                            mods = _drop_orphans(mods, import_errors, printer_id=printer_ids)
+                            mod_ids = _bulk_insert(Mod, mods, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import mods section: {e}", exc_info=True)
+                        import_errors.append("mods_section")
 
-                # Import ModFiles
-                try:
-                    if 'modfiles.csv' in zf.namelist():
-                        modfile_rows = read_csv_from_zip(zf, 'modfiles.csv')
-                        for row in modfile_rows:
-                            try:
-                                mf = ModFile(
-                                    id=row['id'],
-                                    mod_id=row['mod_id'],
-                                    file=f"mod_files/{row['file']}" if row.get('file') else None
-                                )
-                                mf.save()
-                            except Exception as e:
-                                logger.error(f"Failed to import modfile {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"modfile_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import modfiles section: {e}", exc_info=True)
-                    import_errors.append("modfiles_section")
+                    # Import ModFiles
+                    try:
+                        if 'modfiles.csv' in zf.namelist():
+                            modfile_rows = _read_csv_from_zip(zf, 'modfiles.csv')
+                            modfiles = []
+                            for row in modfile_rows:
+                                try:
+                                    mf = ModFile(
+                                        id=row['id'],
+                                        mod_id=row['mod_id'],
+                                        file=f"mod_files/{row['file']}" if row.get('file') else None
+                                    )
+                                    modfiles.append((f"modfile_{row['id']}", mf))
+                                except Exception as e:
+                                    logger.error(f"Failed to import modfile {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"modfile_{row.get('id', 'unknown')}")
+                            modfiles = _drop_orphans(modfiles, import_errors, mod_id=mod_ids)
+                            _bulk_insert(ModFile, modfiles, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import modfiles section: {e}", exc_info=True)
+                        import_errors.append("modfiles_section")
 
-                # Import ProjectLinks
-                try:
-                    if 'project_links.csv' in zf.namelist():
-                        link_rows = read_csv_from_zip(zf, 'project_links.csv')
-                        for row in link_rows:
-                            try:
-                                ProjectLink.objects.create(
-                                    id=row['id'],
-                                    project_id=row['project_id'],
-                                    name=row['name'],
-                                    url=row['url']
-                                )
-                            except Exception as e:
-                                logger.error(f"Failed to import project link {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"projectlink_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import project links section: {e}", exc_info=True)
-                    import_errors.append("projectlinks_section")
+                    # Import ProjectLinks
+                    try:
+                        if 'project_links.csv' in zf.namelist():
+                            link_rows = _read_csv_from_zip(zf, 'project_links.csv')
+                            links = []
+                            for row in link_rows:
+                                try:
+                                    links.append((f"projectlink_{row['id']}", ProjectLink(
+                                        id=row['id'],
+                                        project_id=row['project_id'],
+                                        name=row['name'],
+                                        url=row['url']
+                                    )))
+                                except Exception as e:
+                                    logger.error(f"Failed to import project link {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"projectlink_{row.get('id', 'unknown')}")
+                            links = _drop_orphans(links, import_errors, project_id=project_ids)
+                            _bulk_insert(ProjectLink, links, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import project links section: {e}", exc_info=True)
+                        import_errors.append("projectlinks_section")
 
-                # Import ProjectFiles
-                try:
-                    if 'project_files.csv' in zf.namelist():
-                        file_rows = read_csv_from_zip(zf, 'project_files.csv')
-                        for row in file_rows:
-                            try:
-                                pf = ProjectFile(
-                                    id=row['id'],
-                                    project_id=row['project_id'],
-                                    file=f"project_files/{row['file']}" if row.get('file') else None
-                                )
-                                pf.save()
-                            except Exception as e:
-                                logger.error(f"Failed to import project file {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"projectfile_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import project files section: {e}", exc_info=True)
-                    import_errors.append("projectfiles_section")
+                    # Import ProjectFiles
+                    try:
+                        if 'project_files.csv' in zf.namelist():
+                            file_rows = _read_csv_from_zip(zf, 'project_files.csv')
+                            project_files = []
+                            for row in file_rows:
+                                try:
+                                    pf = ProjectFile(
+                                        id=row['id'],
+                                        project_id=row['project_id'],
+                                        file=f"project_files/{row['file']}" if row.get('file') else None
+                                    )
+                                    project_files.append((f"projectfile_{row['id']}", pf))
+                                except Exception as e:
+                                    logger.error(f"Failed to import project file {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"projectfile_{row.get('id', 'unknown')}")
+                            project_files = _drop_orphans(project_files, import_errors, project_id=project_ids)
+                            _bulk_insert(ProjectFile, project_files, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import project files section: {e}", exc_info=True)
+                        import_errors.append("projectfiles_section")
 
-                # Import ProjectInventory
-                try:
-                    if 'project_inventory.csv' in zf.namelist():
-                        proj_inv_rows = read_csv_from_zip(zf, 'project_inventory.csv')
-                        for row in proj_inv_rows:
-                            try:
-                                ProjectInventory.objects.create(
-                                    project_id=row['project_id'],
-                                    inventory_item_id=row['inventory_item_id'],
-                                    quantity_used=int(row.get('quantity_used', 0)) or 0
-                                )
-                            except Exception as e:
-                                logger.error(f"Failed to import project inventory {row.get('project_id', 'unknown')}_{row.get('inventory_item_id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"projectinventory_{row.get('project_id', 'unknown')}_{row.get('inventory_item_id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import project inventory section: {e}", exc_info=True)
-                    import_errors.append("projectinventory_section")
+                    # Import ProjectInventory
+                    try:
+                        if 'project_inventory.csv' in zf.namelist():
+                            proj_inv_rows = _read_csv_from_zip(zf, 'project_inventory.csv')
+                            project_inventory = []
+                            for row in proj_inv_rows:
+                                try:
+                                    project_inventory.append((
+                                        f"projectinventory_{row['project_id']}_{row['inventory_item_id']}",
+                                        ProjectInventory(
+                                            project_id=row['project_id'],
+                                            inventory_item_id=row['inventory_item_id'],
+                                            quantity_used=int(row.get('quantity_used', 0)) or 0
+                                        )
+                                    ))
+                                except Exception as e:
+                                    logger.error(f"Failed to import project inventory {row.get('project_id', 'unknown')}_{row.get('inventory_item_id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"projectinventory_{row.get('project_id', 'unknown')}_{row.get('inventory_item_id', 'unknown')}")
+                            project_inventory = _drop_orphans(
+                                project_inventory, import_errors, project_id=project_ids, inventory_item_id=inventory_ids
+                            )
+                            _bulk_insert(ProjectInventory, project_inventory, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import project inventory section: {e}", exc_info=True)
+                        import_errors.append("projectinventory_section")
 
-                # Import ProjectPrinters
-                try:
-                    if 'project_printers.csv' in zf.namelist():
-                        proj_printer_rows = read_csv_from_zip(zf, 'project_printers.csv')
-                        for row in proj_printer_rows:
-                            try:
-                                ProjectPrinters.objects.create(
-                                    project_id=row['project_id'],
-                                    printer_id=row['printer_id']
-                                )
-                            except Exception as e:
-                                logger.error(f"Failed to import project printer {row.get('project_id', 'unknown')}_{row.get('printer_id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"projectprinter_{row.get('project_id', 'unknown')}_{row.get('printer_id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import project printers section: {e}", exc_info=True)
-                    import_errors.append("projectprinters_section")
+                    # Import ProjectPrinters
+                    try:
+                        if 'project_printers.csv' in zf.namelist():
+                            proj_printer_rows = _read_csv_from_zip(zf, 'project_printers.csv')
+                            project_printers = []
+                            for row in proj_printer_rows:
+                                try:
+                                    project_printers.append((
+                                        f"projectprinter_{row['project_id']}_{row['printer_id']}",
+                                        ProjectPrinters(
+                                            project_id=row['project_id'],
+                                            printer_id=row['printer_id']
+                                        )
+                                    ))
+                                except Exception as e:
+                                    logger.error(f"Failed to import project printer {row.get('project_id', 'unknown')}_{row.get('printer_id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"projectprinter_{row.get('project_id', 'unknown')}_{row.get('printer_id', 'unknown')}")
+                            project_printers = _drop_orphans(
+                                project_printers, import_errors, project_id=project_ids, printer_id=printer_ids
+                            )
+                            _bulk_insert(ProjectPrinters, project_printers, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import project printers section: {e}", exc_info=True)
+                        import_errors.append("projectprinters_section")
 
-                # Import Print Trackers
-                try:
-                    if 'trackers.csv' in zf.namelist():
-                        tracker_rows = read_csv_from_zip(zf, 'trackers.csv')
-                        for row in tracker_rows:
-                            try:
-                                tracker = Tracker(
-                                    id=row['id'],
-                                    name=row['name'],
-                                    project_id=row.get('project_id') or None,
-                                    github_url=row.get('github_url', ''),
-                                    storage_type=row.get('storage_type', 'links'),
-                                    primary_color=row.get('primary_color', '#3B82F6'),
-                                    accent_color=row.get('accent_color', '#EF4444'),
-                                    total_quantity=int(row.get('total_quantity', 0)) or 0,
-                                    printed_quantity_total=int(row.get('printed_quantity_total', 0)) or 0,
-                                    progress_percentage=int(row.get('progress_percentage', 0)) or 0,
-                                    created_date=row.get('created_date'),
-                                    updated_date=row.get('updated_date'),
-                                    storage_path=row.get('storage_path', ''),
-                                    total_storage_used=int(row.get('total_storage_used', 0)) or 0,
-                                    files_downloaded=row.get('files_downloaded', 'false').lower() == 'true',
-                                    # .get() defaults keep backups from before these
-                                    # columns existed importable
-                                    generate_thumbnails_for_linked_files=(
-                                        row.get('generate_thumbnails_for_linked_files', 'false').lower() == 'true'
-                                    ),
-                                    viewer_background=row.get('viewer_background') or 'dark'
-                                )
-                                tracker.save()
-                            except Exception as e:
-                                logger.error(f"Failed to import tracker {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"tracker_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import trackers section: {e}", exc_info=True)
-                    import_errors.append("trackers_section")
+                    # Import Print Trackers
+                    try:
+                        if 'trackers.csv' in zf.namelist():
+                            tracker_rows = _read_csv_from_zip(zf, 'trackers.csv')
+                            trackers = []
+                            for row in tracker_rows:
+                                try:
+                                    tracker = Tracker(
+                                        id=row['id'],
+                                        name=row['name'],
+                                        project_id=row.get('project_id') or None,
+                                        github_url=row.get('github_url', ''),
+                                        storage_type=row.get('storage_type', 'links'),
+                                        primary_color=row.get('primary_color', '#3B82F6'),
+                                        accent_color=row.get('accent_color', '#EF4444'),
+                                        total_quantity=int(row.get('total_quantity', 0)) or 0,
+                                        printed_quantity_total=int(row.get('printed_quantity_total', 0)) or 0,
+                                        progress_percentage=int(row.get('progress_percentage', 0)) or 0,
+                                        created_date=row.get('created_date'),
+                                        updated_date=row.get('updated_date'),
+                                        storage_path=row.get('storage_path', ''),
+                                        total_storage_used=int(row.get('total_storage_used', 0)) or 0,
+                                        files_downloaded=row.get('files_downloaded', 'false').lower() == 'true',
+                                        # .get() defaults keep backups from before these
+                                        # columns existed importable
+                                        generate_thumbnails_for_linked_files=(
+                                            row.get('generate_thumbnails_for_linked_files', 'false').lower() == 'true'
+                                        ),
+                                        viewer_background=row.get('viewer_background') or 'dark'
+                                    )
+                                    trackers.append((f"tracker_{row['id']}", tracker))
+                                except Exception as e:
+                                    logger.error(f"Failed to import tracker {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"tracker_{row.get('id', 'unknown')}")
+                            trackers = _drop_orphans(trackers, import_errors, project_id=project_ids)
+                            tracker_ids = _bulk_insert(Tracker, trackers, import_errors)
+                    except Exception as e:
+                        logger.error(f"Failed to import trackers section: {e}", exc_info=True)
+                        import_errors.append("trackers_section")
 
-                # Import Tracker Files
-                try:
-                    if 'tracker_files.csv' in zf.namelist():
-                        trackerfile_rows = read_csv_from_zip(zf, 'tracker_files.csv')
-                        for row in trackerfile_rows:
-                            try:
-                                # Build the local file path if it exists
-                                local_file_path = None
-                                if row.get('local_file'):
-                                    # Files are stored in trackers/{tracker_id}/files/{directory_path}/{filename}
-                                    tracker_id = row['tracker_id']
-                                    directory_path = row.get('directory_path', '')
+                    # Import Tracker Files
+                    try:
+                        if 'tracker_files.csv' in zf.namelist():
+                            trackerfile_rows = _read_csv_from_zip(zf, 'tracker_files.csv')
+                            tracker_files = []
+                            for row in trackerfile_rows:
+                                try:
+                                    # Build the local file path if it exists
+                                    local_file_path = None
+                                    if row.get('local_file'):
+                                        # Files are stored in trackers/{tracker_id}/files/{directory_path}/{filename}
+                                        tracker_id = row['tracker_id']
+                                        directory_path = row.get('directory_path', '')
                                     
-                                    if directory_path:
-                                        local_file_path = f"trackers/{tracker_id}/files/{directory_path}/{row['local_file']}"
-                                    else:
-                                        local_file_path = f"trackers/{tracker_id}/files/{row['local_file']}"
+                                        if directory_path:
+                                            local_file_path = f"trackers/{tracker_id}/files/{directory_path}/{row['local_file']}"
+                                        else:
+                                            local_file_path = f"trackers/{tracker_id}/files/{row['local_file']}"
                                 
-                                tfile = TrackerFile(
-                                    id=row['id'],
-                                    tracker_id=row['tracker_id'],
-                                    storage_type=row.get('storage_type', 'link'),
-                                    filename=row['filename'],
-                                    directory_path=row.get('directory_path', ''),
-                                    github_url=row.get('github_url', ''),
-                                    local_file=local_file_path,
-                                    file_size=int(row.get('file_size', 0)) or 0,
-                                    sha=row.get('sha', ''),
-                                    color=row.get('color', ''),
-                                    material=row.get('material', ''),
-                                    quantity=int(row.get('quantity', 1)) or 1,
-                                    is_selected=row.get('is_selected', 'true').lower() == 'true',
-                                    status=row.get('status', 'not_started'),
-                                    printed_quantity=int(row.get('printed_quantity', 0)) or 0,
-                                    created_date=row.get('created_date'),
-                                    updated_date=row.get('updated_date'),
-                                    download_date=row.get('download_date') or None,
-                                    download_status=row.get('download_status', 'pending'),
-                                    download_error=row.get('download_error', ''),
-                                    downloaded_at=row.get('downloaded_at') or None,
-                                    file_checksum=row.get('file_checksum', ''),
-                                    actual_file_size=int(row.get('actual_file_size', 0)) if row.get('actual_file_size') else None
-                                )
-                                tfile.save()
-                            except Exception as e:
-                                logger.error(f"Failed to import tracker file {row.get('id', 'unknown')}: {e}", exc_info=True)
-                                import_errors.append(f"trackerfile_{row.get('id', 'unknown')}")
-                except Exception as e:
-                    logger.error(f"Failed to import tracker files section: {e}", exc_info=True)
-                    import_errors.append("trackerfiles_section")
+                                    tfile = TrackerFile(
+                                        id=row['id'],
+                                        tracker_id=row['tracker_id'],
+                                        storage_type=row.get('storage_type', 'link'),
+                                        filename=row['filename'],
+                                        directory_path=row.get('directory_path', ''),
+                                        github_url=row.get('github_url', ''),
+                                        local_file=local_file_path,
+                                        file_size=int(row.get('file_size', 0)) or 0,
+                                        sha=row.get('sha', ''),
+                                        color=row.get('color', ''),
+                                        material=row.get('material', ''),
+                                        quantity=int(row.get('quantity', 1)) or 1,
+                                        is_selected=row.get('is_selected', 'true').lower() == 'true',
+                                        status=row.get('status', 'not_started'),
+                                        printed_quantity=int(row.get('printed_quantity', 0)) or 0,
+                                        created_date=row.get('created_date'),
+                                        updated_date=row.get('updated_date'),
+                                        download_date=row.get('download_date') or None,
+                                        download_status=row.get('download_status', 'pending'),
+                                        download_error=row.get('download_error', ''),
+                                        downloaded_at=row.get('downloaded_at') or None,
+                                        file_checksum=row.get('file_checksum', ''),
+                                        actual_file_size=int(row.get('actual_file_size', 0)) if row.get('actual_file_size') else None
+                                    )
+                                    tracker_files.append((f"trackerfile_{row['id']}", tfile))
+                                except Exception as e:
+                                    logger.error(f"Failed to import tracker file {row.get('id', 'unknown')}: {e}", exc_info=True)
+                                    import_errors.append(f"trackerfile_{row.get('id', 'unknown')}")
+                            tracker_files = _drop_orphans(tracker_files, import_errors, tracker_id=tracker_ids)
+                            _bulk_insert(TrackerFile, tracker_files, import_errors)
+                            with transaction.atomic():
+                                self._finish_tracker_files()
+                    except Exception as e:
+                        logger.error(f"Failed to import tracker files section: {e}", exc_info=True)
+                        import_errors.append("trackerfiles_section")
+
+                    # Media failures fail the restore, as they did when
+                    # extraction ran first
+                    media_extraction.result()
+
+                # The old media folders are only replaced by a committed
+                # restore; a rolled-back one keeps rows and media together
+                transaction.on_commit(lambda: _replace_media_dirs(staging_dir, media_root))
+                transaction.on_commit(_clear_zip_caches)
+
+            # bulk_create sends no post_save, so the dashboard and tracker
+            # detail caches would otherwise keep serving what was cached mid-import
+            invalidate_dashboard_cache()
+            invalidate_tracker_detail_cache()
 
             # Reset database sequences to prevent duplicate key errors
             # Only reset sequences for PostgreSQL (SQLite doesn't need this)
@@ -1924,8 +2409,30 @@ class ImportDataView(APIView):
                 
         except Exception as e:
             logger.error(f"Import failed completely: {e}", exc_info=True)
+            if staging_dir:
+                shutil.rmtree(staging_dir, ignore_errors=True)
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    @staticmethod
+    def _finish_tracker_files():
+        """
+        Do the TrackerFile post_save work that bulk_create skips: refresh each
+        tracker's cached totals and queue STL/3MF auto-thumbnails.
+        """
+        from django_q.tasks import async_task
+
+        for tracker in Tracker.objects.filter(files__isnull=False).distinct():
+            tracker.recalculate_stats()
+            tracker.save(update_fields=['total_quantity', 'printed_quantity_total', 'progress_percentage', 'updated_date'])
+
+        thumbnail_files = TrackerFile.objects.filter(
+            Q(filename__iendswith='.stl') | Q(filename__iendswith='.3mf')
+        ).exclude(
+            storage_type='link', tracker__generate_thumbnails_for_linked_files=False
+        ).values_list('id', flat=True)
+        for tracker_file_id in thumbnail_files:
+            async_task('inventory.tasks.generate_auto_thumbnail_task', tracker_file_id)
+
 class AppConfigurationView(APIView):
     """
     Global app configuration singleton (currently sidebar module visibility).
@@ -1955,28 +2462,13 @@ class DeleteAllData(APIView):
     permission_classes = [AllowAny]
     def post(self, request, *args, **kwargs):
         try:
-            TrackerFile.objects.all().delete()
-            Tracker.objects.all().delete()
-            ProjectPrinters.objects.all().delete()
-            ProjectInventory.objects.all().delete()
-            ProjectFile.objects.all().delete()
-            ProjectLink.objects.all().delete()
-            Project.objects.all().delete()
-            InventoryItem.objects.all().delete()
-            ModFile.objects.all().delete()
-            Mod.objects.all().delete()
-            Printer.objects.all().delete()
-            Brand.objects.all().delete()
-            PartType.objects.all().delete()
-            Location.objects.all().delete()
-            Vendor.objects.all().delete()
-
-            media_path = settings.MEDIA_ROOT
-            if os.path.isdir(media_path):
-                for item in os.listdir(media_path):
-                    item_path = os.path.join(media_path, item)
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
+            with transaction.atomic():
+                _delete_all_rows([*RESTORED_MODELS, Vendor])
+            invalidate_dashboard_cache()
+            invalidate_tracker_detail_cache()
+
+            _clear_media_dirs(settings.MEDIA_ROOT)
+            _clear_zip_caches()
             
             return Response({'status': 'All data deleted'}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -2489,6 +2981,43 @@ class VendorViewSet(viewsets.ModelViewSet):
     serializer_class = VendorSerializer
     permission_classes = [AllowAny]
 
+
+def _cached_zip_response(cache_path):
+    """
+    Response for a cached download ZIP; raises FileNotFoundError when it is not cached.
+
+    Behind the bundled nginx (ZIP_CACHE_ACCEL_REDIRECT_URL set) only the
+    headers come from Django and nginx sends the file, so the worker is free
+    as soon as they are written. Otherwise FileResponse lets the server use
+    sendfile.
+    """
+    accel_url = settings.ZIP_CACHE_ACCEL_REDIRECT_URL
+    if not accel_url:
+        return FileResponse(open(cache_path, 'rb'), content_type='application/zip')
+    os.stat(cache_path)
+    cache_dir, name = os.path.split(cache_path)
+    response = HttpResponse(content_type='application/zip')
+    response['X-Accel-Redirect'] = f"{accel_url.rstrip('/')}/{os.path.basename(cache_dir)}/{name}"
+    return response
+
+
+def _mod_download_validators(mod, stated_files):
+    """
+    Return (etag, last_modified) for a mod's download from its files' stat.
+
+    Mod files are replaced by uploading new ones, so path, size and mtime
+    identify the archive contents without reading any file bytes.
+    """
+    digest = hashlib.blake2b(mod.name.encode(), digest_size=16)
+    last_modified = None
+    for mod_file, stat in stated_files:
+        if stat is None:
+            continue
+        digest.update(f"{mod_file.pk}:{mod_file.file.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        last_modified = max(last_modified or 0, int(stat.st_mtime))
+    return quote_etag(digest.hexdigest()), last_modified
+
+
 class ModViewSet(viewsets.ModelViewSet):
     queryset = Mod.objects.all()
     serializer_class = ModSerializer
@@ -2497,21 +3026,51 @@ class ModViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'], url_path='download-files')
     def download_files(self, request, pk=None):
         mod = self.get_object()
-        mod_files = mod.files.all()
-
-        if not mod_files:
+        # Rows are streamed straight into the stat pass (one query, no
+        # queryset result cache); one stat per file is shared by the
+        # validators and the ZIP headers. Ordering by id keeps the ETag and
+        # the archive layout stable between requests.
+        mod_files = mod.files.only('file', 'deflate_crc32', 'deflate_source_size').order_by('id')
+        stated_files = stat_mod_files(mod_files.iterator(chunk_size=50))
+
+        if not stated_files:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        buffer = BytesIO()
-        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for mod_file in mod_files:
-                file_path = mod_file.file.path
-                if os.path.exists(file_path):
-                    zf.write(file_path, os.path.basename(file_path))
+        # Repeat downloads of unchanged files get a 304 before any zipping.
+        etag, last_modified = _mod_download_validators(mod, stated_files)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = None
+        if len(stated_files) == 1 and stated_files[0][1] is not None:
+            # A lone archive/3MF gains nothing from a ZIP wrapper; serve it as-is
+            # so the server can use sendfile.
+            file_path = stated_files[0][0].file.path
+            if is_compressed_file(file_path):
+                response = FileResponse(
+                    open(file_path, 'rb'),
+                    as_attachment=True,
+                    filename=os.path.basename(file_path),
+                )
 
-        buffer.seek(0)
-        response = HttpResponse(buffer, content_type='application/zip')
-        response['Content-Disposition'] = f'attachment; filename={mod.name}_files.zip'
+        if response is None:
+            # The ETag already identifies the archive contents, so it names
+            # the cached copy; a repeat download is a stat and a sendfile.
+            # The mod id prefix lets the new archive replace older ones.
+            digest = etag.strip('"')
+            cache_path = os.path.join(settings.MOD_ZIP_CACHE_DIR, f"{mod.pk}-{digest}.zip")
+            try:
+                response = _cached_zip_response(cache_path)
+            except FileNotFoundError:
+                response = StreamingHttpResponse(
+                    cache_zip(stream_zip(stated_files), cache_path, settings.MOD_ZIP_CACHE_MAX_BYTES),
+                    content_type='application/zip',
+                )
+            response['Content-Disposition'] = f'attachment; filename={mod.name}_files.zip'
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
         return response
 
 class ModFileViewSet(viewsets.ModelViewSet):
@@ -2533,18 +3092,24 @@ class InventoryItemViewSet(viewsets.ModelViewSet):
     queryset = InventoryItem.objects.none()  # Required for DRF router basename; actual data from get_queryset()
     serializer_class = InventoryItemSerializer
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, IndexedSearchFilter, filters.OrderingFilter]
     filterset_class = InventoryItemFilter
+    pagination_class = OptionalLimitOffsetPagination
     search_fields = ['title', 'brand__name', 'part_type__name', 'location__name', 'notes']
     ordering_fields = ['title', 'quantity', 'cost']
 
     ACTIVE_BOM_STATUSES = ['Planning', 'In Progress', 'On Hold']
 
     def get_queryset(self):
+        # The serializer renders every item column, but only id/name of each
+        # related row; projects are the wide rows worth trimming.
         return (
             InventoryItem.objects
-            .select_related('brand', 'part_type', 'location')
-            .prefetch_related('associated_projects')
+            .select_related('brand', 'part_type', 'location', 'vendor')
+            .prefetch_related(Prefetch(
+                'associated_projects',
+                queryset=Project.objects.only('id', 'project_name'),
+            ))
             .annotate(
                 qty_needed=Sum(
                     'bom_items__quantity_needed',
@@ -2730,27 +3295,83 @@ class InventoryItemViewSet(viewsets.ModelViewSet):
         )
 
 
+# PrinterSerializer only lists project ids, which the link table already holds.
+_PRINTER_PROJECT_LINKS = ProjectPrinters.objects.only('printer', 'project').order_by('project_id')
+
+
 class PrinterViewSet(viewsets.ModelViewSet):
-    queryset = Printer.objects.select_related('manufacturer').prefetch_related('mods__files', 'associated_projects').all().order_by('title')
+    queryset = Printer.objects.none()  # Required for DRF router basename; actual data from get_queryset()
     serializer_class = PrinterSerializer
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, IndexedSearchFilter, filters.OrderingFilter]
     filterset_class = PrinterFilter
+    pagination_class = OptionalLimitOffsetPagination
     search_fields = ['title', 'manufacturer__name', 'serial_number', 'status', 'notes']
     ordering_fields = ['title', 'manufacturer__name', 'status', 'purchase_date']
 
+    def get_queryset(self):
+        queryset = Printer.objects.select_related('manufacturer').order_by('title')
+        if self.action == 'destroy':
+            # Nothing is serialized; the relations would be loaded for nothing.
+            return queryset
+        # PrinterSerializer renders mods with their files, project ids and
+        # assigned spools on list and detail alike.
+        return queryset.prefetch_related(
+            'mods__files',
+            Prefetch('projectprinters_set', queryset=_PRINTER_PROJECT_LINKS),
+            Prefetch(
+                'filamentspool_set',
+                queryset=FilamentSpool.objects.select_related(
+                    'filament_type__brand', 'filament_type__base_material', 'location',
+                ),
+            ),
+        )
+
 class ProjectViewSet(viewsets.ModelViewSet):
-    queryset = Project.objects.prefetch_related('associated_inventory_items__brand', 'associated_printers', 'links', 'files').all().order_by('project_name')
+    queryset = Project.objects.none()  # Required for DRF router basename; actual data from get_queryset()
     serializer_class = ProjectSerializer
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, IndexedSearchFilter, filters.OrderingFilter]
     filterset_class = ProjectFilter
+    pagination_class = OptionalLimitOffsetPagination
     search_fields = ['project_name', 'description', 'status', 'notes']
     ordering_fields = ['project_name', 'status', 'start_date', 'due_date']
 
     _BOM_ACTIVE_STATUSES = ['Planning', 'In Progress', 'On Hold']
     _BOM_CANCELLED = 'Canceled'
 
+    def get_queryset(self):
+        queryset = Project.objects.order_by('project_name')
+        if self.action in ('destroy', 'remove_inventory'):
+            return queryset
+        # Everything ProjectSerializer nests, down to the relations its nested
+        # inventory item and printer serializers render, so a project list is
+        # a fixed number of queries rather than several per project.
+        return queryset.prefetch_related(
+            Prefetch(
+                'associated_inventory_items',
+                queryset=InventoryItem.objects.select_related('brand', 'part_type', 'location', 'vendor'),
+            ),
+            Prefetch(
+                'associated_inventory_items__associated_projects',
+                queryset=Project.objects.only('id', 'project_name'),
+            ),
+            Prefetch('associated_printers', queryset=Printer.objects.select_related('manufacturer')),
+            'associated_printers__mods__files',
+            Prefetch('associated_printers__projectprinters_set', queryset=_PRINTER_PROJECT_LINKS),
+            'associated_printers__filamentspool_set',
+            'links',
+            'files',
+            'trackers',
+            Prefetch('bom_items', queryset=ProjectBOMItem.objects.select_related('inventory_item')),
+            Prefetch(
+                'filaments_used',
+                queryset=FilamentSpool.objects.select_related(
+                    'filament_type__brand', 'filament_type__base_material', 'location',
+                ),
+            ),
+        )
+
     def perform_update(self, serializer):
         """
         Reservation model: qty_on_hand is decremented when a BOM item is created
@@ -2776,12 +3397,14 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 InventoryItem.objects.filter(pk=bom_item.inventory_item.pk).update(
                     quantity=F('quantity') + bom_item.quantity_needed
                 )
+                invalidate_dashboard_cache()
         elif old_status == self._BOM_CANCELLED and new_status in self._BOM_ACTIVE_STATUSES:
             # Cancelled project re-opened: re-reserve stock from inventory
             for bom_item in bom_items:
                 InventoryItem.objects.filter(pk=bom_item.inventory_item.pk).update(
                     quantity=F('quantity') - bom_item.quantity_needed
                 )
+                invalidate_dashboard_cache()
 
     def perform_destroy(self, instance):
         """
@@ -2802,6 +3425,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 InventoryItem.objects.filter(pk=bom_item.inventory_item_id).update(
                     quantity=F('quantity') + bom_item.quantity_needed
                 )
+                invalidate_dashboard_cache()
         instance.delete()
 
     @action(detail=True, methods=['post'], url_path='remove-inventory')
@@ -2855,6 +3479,9 @@ class ProjectBOMItemViewSet(viewsets.ModelViewSet):
     def _adjust_inv(self, inventory_item_id, delta):
         """Adjust qty_on_hand by delta (+restore / -reserve)."""
         InventoryItem.objects.filter(pk=inventory_item_id).update(quantity=F('quantity') + delta)
+        # update() sends no post_save, so drop the cached dashboard here; a
+        # reservation can take an item below its low-stock threshold
+        invalidate_dashboard_cache()
 
     def get_queryset(self):
         qs = ProjectBOMItem.objects.select_related('inventory_item', 'project').all()
@@ -3122,10 +3749,15 @@ class LowStockItemsViewSet(ReadOnlyViewSet):
     permission_classes = [AllowAny]
 
     def get_queryset(self):
-        return InventoryItem.objects.filter(
-            is_consumable=True,
-            low_stock_threshold__isnull=False,
-            quantity__lte=F('low_stock_threshold')
+        return (
+            InventoryItem.objects
+            .filter(is_low_stock=True)
+            .select_related('brand', 'part_type', 'location', 'vendor')
+            .prefetch_related(Prefetch(
+                'associated_projects',
+                queryset=Project.objects.only('id', 'project_name'),
+            ))
+            .order_by('title')
         )
 
 
@@ -3133,6 +3765,23 @@ class LowStockItemsViewSet(ReadOnlyViewSet):
 # PRINT TRACKER VIEWSETS
 # ============================================================================
 
+# fetch_url_metadata results; lookups that failed are retried much sooner.
+URL_METADATA_CACHE_TIMEOUT = 3600
+URL_METADATA_FAILURE_CACHE_TIMEOUT = 60
+# fetch_url_metadata's "source" label, keyed by the host's registered domain
+URL_METADATA_SOURCES = {
+    'github.com': 'GitHub',
+    'printables.com': 'Printables',
+    'thingiverse.com': 'Thingiverse',
+}
+
+# Shared by fetch_url_metadata so repeated lookups against the same host
+# (nearly always GitHub) reuse a kept-alive TLS connection.
+_url_metadata_session = requests.Session()
+_url_metadata_session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+_url_metadata_session.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+
+
 class TrackerViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing Print Trackers.
@@ -3151,6 +3800,10 @@ class TrackerViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'created_date', 'updated_date']
     ordering = ['-created_date']
     
+    # Detail responses are cached until a model signal bumps the version;
+    # the timeout is the safety net for writes that bypass signals
+    DETAIL_CACHE_TIMEOUT = 60
+    
     def get_serializer_class(self):
         """Use different serializers for different actions."""
         if self.action == 'create':
@@ -3161,12 +3814,58 @@ class TrackerViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Allow filtering by project."""
-        queryset = Tracker.objects.prefetch_related('files__images').all()
+        if self.action == 'list':
+            # TrackerListSerializer shows two file counts but no file rows;
+            # counting in the same query avoids two COUNTs per tracker. Only
+            # the columns it renders are loaded (notes, storage and filament
+            # fields stay in the database).
+            queryset = Tracker.objects.select_related('project').only(
+                'name', 'project__project_name', 'github_url', 'storage_type',
+                'progress_percentage', 'total_quantity', 'printed_quantity_total', 'created_date',
+            ).annotate(
+                file_count=Count('files'),
+                completed_file_count=Count('files', filter=Q(files__status='completed')),
+            )
+        else:
+            queryset = self._detail_queryset()
         project_id = self.request.query_params.get('project', None)
         if project_id is not None:
             queryset = queryset.filter(project_id=project_id)
         return queryset
 
+    @staticmethod
+    def _detail_queryset():
+        """Trackers with the relations TrackerSerializer walks for every file."""
+        return Tracker.objects.select_related('project').prefetch_related('files__images')
+
+    @staticmethod
+    def _detail_cache_key(pk):
+        """
+        Cache key for a tracker's TrackerSerializer output.
+
+        Take the key before reading the tracker, so a write that lands while
+        it is being serialized leaves the entry under the old version.
+        """
+        return f"tracker:{pk}:detail:{get_tracker_detail_cache_version()}"
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Get tracker detail, served from cache when nothing has changed.
+
+        Create fills the cache, so the detail view a client opens right
+        after creating a tracker doesn't serialize the whole file tree again.
+        """
+        # ?project= can turn a detail lookup into a 404; leave that to get_object
+        if 'project' in request.query_params:
+            return super().retrieve(request, *args, **kwargs)
+
+        cache_key = self._detail_cache_key(kwargs['pk'])
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            cache.set(cache_key, data, self.DETAIL_CACHE_TIMEOUT)
+        return Response(data)
+
     def create(self, request, *args, **kwargs):
         """
         Create a new tracker and optionally download files if storage_type is 'download'.
@@ -3177,11 +3876,14 @@ class TrackerViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         tracker = serializer.save()
         
-        # Get tracker data for response
-        response_serializer = TrackerSerializer(tracker)
+        # Get tracker data for response, re-read in one pass with its files
+        # and their images rather than a few queries per file
+        cache_key = self._detail_cache_key(tracker.pk)
+        response_serializer = TrackerSerializer(self._detail_queryset().get(pk=tracker.pk))
         response_data = {
             'tracker': response_serializer.data
         }
+        cache.set(cache_key, response_data['tracker'], self.DETAIL_CACHE_TIMEOUT)
         
         # Add download results if available (set by serializer during file downloads)
         if hasattr(tracker, '_download_results'):
@@ -3216,7 +3918,9 @@ class TrackerViewSet(viewsets.ModelViewSet):
         }
         
         Returns file tree with all printable files, categorized by size.
-        Results are cached for 1 hour unless force_refresh=true.
+        Results are cached for 1 hour unless force_refresh=true. The whole
+        response is cached per URL here as well, since the crawler has to
+        ask GitHub for the default branch before it can check its own cache.
         """
         github_url = request.data.get('github_url')
         force_refresh = request.data.get('force_refresh', False)
@@ -3230,8 +3934,15 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        cache_key = f"crawl_github:{hashlib.sha256(str(github_url).encode()).hexdigest()}"
+        if not force_refresh:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return Response({**cached, 'cached': True}, status=status.HTTP_200_OK)
+        
         try:
             result = crawl_github_repository(github_url, force_refresh)
+            cache.set(cache_key, result, GITHUB_CACHE_TIMEOUT)
             return Response(result, status=status.HTTP_200_OK)
             
         except InvalidURLError as e:
@@ -3309,9 +4020,12 @@ class TrackerViewSet(viewsets.ModelViewSet):
             "size": 12345,
             "source": "GitHub"
         }
+        
+        Results are cached per URL for an hour (a minute when the HEAD
+        request failed), so re-validating a file list doesn't re-query
+        every host.
         """
         from urllib.parse import urlparse, unquote
-        import requests
         
         url = request.data.get('url')
         if not url:
@@ -3320,19 +4034,16 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        cache_key = f"url_metadata:{hashlib.sha1(url.encode()).hexdigest()}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+        
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Detect source
-            if 'github.com' in domain:
-                source = 'GitHub'
-            elif 'printables.com' in domain:
-                source = 'Printables'
-            elif 'thingiverse.com' in domain:
-                source = 'Thingiverse'
-            else:
-                source = 'URL'
+            # Detect source from the last two labels of the host, so
+            # www./gist. subdomains and an explicit port still match
+            hostname = urlparse(url).hostname or ''
+            source = URL_METADATA_SOURCES.get('.'.join(hostname.rsplit('.', 2)[-2:]), 'URL')
             
             # Extract filename from URL and decode URL encoding
             filename = url.split('/')[-1].split('?')[0]
@@ -3342,16 +4053,24 @@ class TrackerViewSet(viewsets.ModelViewSet):
             
             # Try to get file size with HEAD request
             try:
-                head_response = requests.head(url, timeout=5, allow_redirects=True)
+                head_response = _url_metadata_session.head(url, timeout=5, allow_redirects=True)
                 size = int(head_response.headers.get('Content-Length', 0))
+                head_ok = head_response.ok
             except:
                 size = 0
+                head_ok = False
             
-            return Response({
+            metadata = {
                 'filename': filename,
                 'size': size,
                 'source': source
-            })
+            }
+            cache.set(
+                cache_key,
+                metadata,
+                URL_METADATA_CACHE_TIMEOUT if head_ok else URL_METADATA_FAILURE_CACHE_TIMEOUT
+            )
+            return Response(metadata)
             
         except Exception as e:
             return Response(
@@ -3415,9 +4134,8 @@ class TrackerViewSet(viewsets.ModelViewSet):
             )
             
             # Create tracker files
-            created_files = []
-            for file_data in files:
-                tracker_file = TrackerFile.objects.create(
+            created_files = self._bulk_create_files(tracker, [
+                TrackerFile(
                     tracker=tracker,
                     filename=file_data.get('name', 'unknown'),
                     directory_path=file_data.get('category', ''),
@@ -3431,19 +4149,22 @@ class TrackerViewSet(viewsets.ModelViewSet):
                     quantity=file_data.get('quantity', 1),
                     printed_quantity=0
                 )
-                created_files.append(tracker_file)
+                for file_data in files
+            ])
             
             # If storage_type is 'local', download the files
             download_results = None
             if storage_type == 'local' and created_files:
                 download_results = self._download_tracker_files_for_manual(tracker, created_files)
             
-            # Get updated tracker data
-            serializer = TrackerSerializer(tracker)
+            # Get updated tracker data, re-read with its files and images
+            cache_key = self._detail_cache_key(tracker.pk)
+            serializer = TrackerSerializer(self._detail_queryset().get(pk=tracker.pk))
             response_data = {
                 'success': True,
                 'tracker': serializer.data
             }
+            cache.set(cache_key, response_data['tracker'], self.DETAIL_CACHE_TIMEOUT)
             
             # Add download results if available
             if download_results:
@@ -3484,10 +4205,11 @@ class TrackerViewSet(viewsets.ModelViewSet):
         try:
             space_check = storage_manager.check_available_space(total_size)
             if not space_check['sufficient']:
-                for tf in tracker_files:
-                    tf.download_status = 'failed'
-                    tf.download_error = f"Insufficient disk space. Need {storage_manager._format_bytes(total_size)}, only {storage_manager._format_bytes(space_check['available'])} available."
-                    tf.save()
+                set_download_state(
+                    tracker_files,
+                    download_status='failed',
+                    download_error=f"Insufficient disk space. Need {storage_manager._format_bytes(total_size)}, only {storage_manager._format_bytes(space_check['available'])} available."
+                )
                 
                 return {
                     'successful': [],
@@ -3496,10 +4218,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
                     'error': 'Insufficient disk space'
                 }
         except (InsufficientStorageError, StoragePermissionError) as e:
-            for tf in tracker_files:
-                tf.download_status = 'failed'
-                tf.download_error = str(e)
-                tf.save()
+            set_download_state(tracker_files, download_status='failed', download_error=str(e))
             
             return {
                 'successful': [],
@@ -3514,10 +4233,11 @@ class TrackerViewSet(viewsets.ModelViewSet):
             tracker.storage_path = storage_path
             tracker.save()
         except Exception as e:
-            for tf in tracker_files:
-                tf.download_status = 'failed'
-                tf.download_error = f"Failed to create storage path: {str(e)}"
-                tf.save()
+            set_download_state(
+                tracker_files,
+                download_status='failed',
+                download_error=f"Failed to create storage path: {str(e)}"
+            )
             
             return {
                 'successful': [],
@@ -3531,12 +4251,11 @@ class TrackerViewSet(viewsets.ModelViewSet):
         file_list = []
         file_path_mapping = {}  # Maps tracker_file_id to relative path from MEDIA_ROOT
         
+        category_paths, safe_categories = storage_manager.prepare_category_paths(tracker.id, tracker_files)
+        
         for tracker_file in tracker_files:
-            category_path = storage_manager.get_category_path(
-                tracker.id,
-                tracker_file.directory_path or 'uncategorized',
-                create=True
-            )
+            category = tracker_file.directory_path or 'uncategorized'
+            category_path = category_paths[category]
             
             safe_filename = storage_manager.sanitize_filename(tracker_file.filename)
             destination = f"{category_path}/{safe_filename}"
@@ -3544,8 +4263,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
             # Build relative path for FileField (relative to MEDIA_ROOT)
             # destination is absolute, e.g., C:\...\media\trackers\8\files\test\file.stl
             # We need: trackers/8/files/test/file.stl
-            category = tracker_file.directory_path or 'uncategorized'
-            safe_category = storage_manager.sanitize_filename(category)
+            safe_category = safe_categories[category]
             relative_path = f"trackers/{tracker.id}/files/{safe_category}/{safe_filename}"
             file_path_mapping[tracker_file.id] = relative_path
             
@@ -3555,65 +4273,31 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 'name': tracker_file.filename,
                 'tracker_file_id': tracker_file.id
             })
-            
-            tracker_file.download_status = 'downloading'
-            tracker_file.save()
+        
+        set_download_state(tracker_files, download_status='downloading')
         
         # Download files in batch
         results = download_service.download_files_batch(file_list)
+        storage_manager.forget_disk_usage()
         
-        # Process results and update tracker files
-        successful_downloads = []
-        failed_downloads = []
-        total_bytes_downloaded = 0
-        
-        for success_info in results['successful']:
-            tracker_file = next((tf for tf in tracker_files if tf.id == success_info.get('tracker_file_id')), None)
-            
-            if tracker_file:
-                tracker_file.download_status = 'completed'
-                tracker_file.downloaded_at = timezone.now()
-                tracker_file.file_checksum = success_info.get('checksum', '')
-                tracker_file.actual_file_size = success_info.get('bytes_downloaded', 0)
-                tracker_file.download_error = ''
-                # Set the local_file path (relative to MEDIA_ROOT)
-                tracker_file.local_file = file_path_mapping.get(tracker_file.id, '')
-                tracker_file.storage_type = 'local'
-                tracker_file.save()
-                
-                total_bytes_downloaded += success_info.get('bytes_downloaded', 0)
-                successful_downloads.append({
-                    'file_id': tracker_file.id,
-                    'filename': tracker_file.filename,
-                    'bytes_downloaded': success_info.get('bytes_downloaded', 0),
-                    'duration': success_info.get('duration', 0)
-                })
-        
-        for fail_info in results['failed']:
-            tracker_file = next((tf for tf in tracker_files if tf.id == fail_info.get('tracker_file_id')), None)
-            
-            if tracker_file:
-                tracker_file.download_status = 'failed'
-                tracker_file.download_error = fail_info.get('error', 'Unknown error')
-                tracker_file.save()
-                
-                failed_downloads.append({
-                    'file_id': tracker_file.id,
-                    'filename': tracker_file.filename,
-                    'error': fail_info.get('error', 'Unknown error')
-                })
-        
-        # Update tracker totals
-        tracker.total_storage_used = total_bytes_downloaded
-        tracker.files_downloaded = len(failed_downloads) == 0
-        tracker.save()
-        
-        return {
-            'successful': successful_downloads,
-            'failed': failed_downloads,
-            'total_bytes': total_bytes_downloaded,
-            'duration': results.get('duration', 0)
-        }
+        return apply_download_results(tracker, tracker_files, results, file_path_mapping)
+    
+    @staticmethod
+    def _bulk_create_files(tracker, tracker_files):
+        """
+        Insert new tracker files in one query and return them with their ids.
+
+        bulk_create sends no post_save, so this does what the per-file
+        signals would have: recalculate the tracker's cached stats (once,
+        not per file) and queue each file's auto-thumbnail check.
+        """
+        created = TrackerFile.objects.bulk_create(tracker_files)
+        if created:
+            tracker.recalculate_stats()
+            tracker.save(update_fields=['total_quantity', 'printed_quantity_total', 'progress_percentage', 'updated_date'])
+            for tracker_file in created:
+                queue_auto_thumbnail_generation(TrackerFile, tracker_file)
+        return created
     
     @action(detail=True, methods=['post'], url_path='download-all-files')
     def download_all_files(self, request, pk=None):
@@ -3625,17 +4309,18 @@ class TrackerViewSet(viewsets.ModelViewSet):
         """
         tracker = self.get_object()
         
-        # Get all files that have github_url but no local_file
-        files_to_download = TrackerFile.objects.filter(
+        # Get all files that have github_url but no local_file, read once so
+        # the check, the downloads and the count all see the same rows
+        files_to_download = list(TrackerFile.objects.filter(
             tracker=tracker,
             github_url__isnull=False
         ).exclude(
             github_url=''
         ).filter(
             local_file=''
-        )
+        ))
         
-        if not files_to_download.exists():
+        if not files_to_download:
             return Response({
                 'success': True,
                 'message': 'No files need to be downloaded',
@@ -3644,7 +4329,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
         
         # Download the files
         try:
-            download_results = self._download_new_files(tracker, list(files_to_download))
+            download_results = self._download_new_files(tracker, files_to_download)
             
             # Update tracker storage_type to 'local' if it isn't already
             if tracker.storage_type != 'local':
@@ -3672,92 +4357,35 @@ class TrackerViewSet(viewsets.ModelViewSet):
         - For link files: download from URL and include
         
         GET /api/trackers/{id}/download-zip/
+        Query params:
+        - store: true to store every entry uncompressed (faster for large
+          G-code/STL sets); already-compressed formats are always stored
+        
+        The archive is streamed as it is built, so the download starts with
+        the first file instead of after the last one.
         """
         import traceback
         import logging
         logger = logging.getLogger(__name__)
         
+        store_all = parse_bool(request.query_params.get('store'))
+        
         try:
             tracker = self.get_object()
             
-            # Create in-memory ZIP file
-            zip_buffer = BytesIO()
+            # Get all files for this tracker
+            files = TrackerFile.objects.filter(tracker=tracker).order_by('directory_path', 'filename')
             
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                # Get all files for this tracker
-                files = TrackerFile.objects.filter(tracker=tracker).order_by('directory_path', 'filename')
-                
-                if not files.exists():
-                    return Response(
-                        {'error': 'No files found for this tracker'},
-                        status=status.HTTP_404_NOT_FOUND
-                    )
-                
-                # Track files added to avoid duplicates
-                added_files = set()
-                
-                for file in files:
-                    # Generate a unique filename with category prefix (using directory_path)
-                    category_prefix = file.directory_path.replace('/', '_').replace('\\', '_') if file.directory_path else 'Uncategorized'
-                    safe_filename = f"{category_prefix}/{file.filename}"
-                    
-                    # Avoid duplicate filenames
-                    counter = 1
-                    original_safe_filename = safe_filename
-                    while safe_filename in added_files:
-                        name, ext = os.path.splitext(original_safe_filename)
-                        safe_filename = f"{name}_{counter}{ext}"
-                        counter += 1
-                    
-                    try:
-                        # Check if file exists locally
-                        if file.local_file and os.path.exists(file.local_file.path):
-                            # Add local file to ZIP
-                            zip_file.write(file.local_file.path, safe_filename)
-                            added_files.add(safe_filename)
-                        elif file.github_url:
-                            # Download from URL and add to ZIP
-                            download_service = FileDownloadService()
-                            
-                            # Create temporary file
-                            with tempfile.NamedTemporaryFile(delete=False, suffix='.stl') as temp_file:
-                                temp_path = temp_file.name
-                            
-                            try:
-                                # Download to temp file
-                                result = download_service.download_with_retry(
-                                    file.github_url,
-                                    temp_path,
-                                    max_retries=2
-                                )
-                                
-                                # Add to ZIP
-                                zip_file.write(temp_path, safe_filename)
-                                added_files.add(safe_filename)
-                            except (DownloadError, DownloadTimeoutError, FileTooLargeError) as download_err:
-                                # Add error note instead of failing completely
-                                error_filename = f"{safe_filename}.error.txt"
-                                error_msg = f"Failed to download: {file.github_url}\nError: {str(download_err)}\n"
-                                zip_file.writestr(error_filename, error_msg)
-                            finally:
-                                # Clean up temp file
-                                if os.path.exists(temp_path):
-                                    try:
-                                        os.remove(temp_path)
-                                    except:
-                                        pass  # Ignore cleanup errors
-                    except Exception as e:
-                        # Log error but continue with other files
-                        logger.error(f"Error processing file {file.filename}: {str(e)}")
-                        logger.error(traceback.format_exc())
-                        error_filename = f"{safe_filename}.error.txt"
-                        error_msg = f"Error processing file: {str(e)}\nURL: {file.github_url or 'N/A'}\n"
-                        zip_file.writestr(error_filename, error_msg)
-                        continue
+            if not files.exists():
+                return Response(
+                    {'error': 'No files found for this tracker'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
             
-            # Prepare response
-            zip_buffer.seek(0)
-            response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+            response = StreamingHttpResponse(
+                stream_tracker_zip(files, FileDownloadService(), store_all),
+                content_type='application/zip'
+            )
             safe_tracker_name = tracker.name.replace(' ', '_').replace('/', '_').replace('\\', '_')
             response['Content-Disposition'] = f'attachment; filename="{safe_tracker_name}_files.zip"'
             
@@ -3804,14 +4432,23 @@ class TrackerViewSet(viewsets.ModelViewSet):
         try:
             added_files = []
             updated_files = []
+            new_files = {}  # (directory_path, filename) -> unsaved TrackerFile
             
-            for file_data in files:
-                # Check if file already exists
-                existing_file = TrackerFile.objects.filter(
-                    tracker=tracker,
-                    directory_path=file_data.get('category', ''),
-                    filename=file_data.get('name', 'unknown')
-                ).first()
+            # Look up every file that already exists in one query; rows are
+            # unique per (tracker, directory_path, filename)
+            keys = [(file_data.get('category', ''), file_data.get('name', 'unknown')) for file_data in files]
+            existing_files = {
+                (tf.directory_path, tf.filename): tf
+                for tf in TrackerFile.objects.filter(tracker=tracker, filename__in={name for _, name in keys})
+            }
+            
+            for key, file_data in zip(keys, files):
+                if key in new_files:
+                    # Listed twice in this request: keep a single new row,
+                    # built from the later entry
+                    added_files.remove(new_files[key])
+                
+                existing_file = existing_files.get(key)
                 
                 if existing_file:
                     # Update existing file
@@ -3822,15 +4459,17 @@ class TrackerViewSet(viewsets.ModelViewSet):
                     existing_file.material = file_data.get('material', existing_file.material)
                     existing_file.status = 'not_started'
                     existing_file.is_selected = True
+                    # save(), not bulk_update: a color change here must clear
+                    # and requeue the file's auto-thumbnail via its signals
                     existing_file.save()
                     updated_files.append(existing_file)
                     added_files.append(existing_file)  # Include in added_files for download
                 else:
-                    # Create new TrackerFile
-                    tracker_file = TrackerFile.objects.create(
+                    # New TrackerFile, inserted with the others below
+                    tracker_file = TrackerFile(
                         tracker=tracker,
-                        filename=file_data.get('name', 'unknown'),
-                        directory_path=file_data.get('category', ''),
+                        filename=key[1],
+                        directory_path=key[0],
                         github_url=file_data.get('url', ''),
                         file_size=file_data.get('size', 0),
                         quantity=file_data.get('quantity', 1),
@@ -3839,8 +4478,11 @@ class TrackerViewSet(viewsets.ModelViewSet):
                         status='not_started',
                         is_selected=True
                     )
+                    new_files[key] = tracker_file
                     added_files.append(tracker_file)
             
+            self._bulk_create_files(tracker, list(new_files.values()))
+            
             # If tracker storage_type is 'local', download the new files
             download_results = None
             if tracker.storage_type == 'local' and added_files:
@@ -3900,10 +4542,11 @@ class TrackerViewSet(viewsets.ModelViewSet):
             space_check = storage_manager.check_available_space(total_size)
             if not space_check['sufficient']:
                 # Mark all files as failed due to insufficient space
-                for tf in tracker_files:
-                    tf.download_status = 'failed'
-                    tf.download_error = f"Insufficient disk space. Need {storage_manager._format_bytes(total_size)}, only {space_check['available_formatted']} available."
-                    tf.save()
+                set_download_state(
+                    tracker_files,
+                    download_status='failed',
+                    download_error=f"Insufficient disk space. Need {storage_manager._format_bytes(total_size)}, only {space_check['available_formatted']} available."
+                )
                 
                 return {
                     'successful': [],
@@ -3918,10 +4561,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
                     'error': 'Insufficient disk space'
                 }
         except (InsufficientStorageError, StoragePermissionError) as e:
-            for tf in tracker_files:
-                tf.download_status = 'failed'
-                tf.download_error = str(e)
-                tf.save()
+            set_download_state(tracker_files, download_status='failed', download_error=str(e))
             
             return {
                 'successful': [],
@@ -3943,10 +4583,11 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 tracker.storage_path = storage_path
                 tracker.save()
         except Exception as e:
-            for tf in tracker_files:
-                tf.download_status = 'failed'
-                tf.download_error = f"Failed to access storage path: {str(e)}"
-                tf.save()
+            set_download_state(
+                tracker_files,
+                download_status='failed',
+                download_error=f"Failed to access storage path: {str(e)}"
+            )
             
             return {
                 'successful': [],
@@ -3966,21 +4607,18 @@ class TrackerViewSet(viewsets.ModelViewSet):
         file_list = []
         file_path_mapping = {}  # Maps tracker_file_id to relative path from MEDIA_ROOT
         
+        category_paths, safe_categories = storage_manager.prepare_category_paths(tracker.id, tracker_files)
+        
         for tracker_file in tracker_files:
-            # Get category path
-            category_path = storage_manager.get_category_path(
-                tracker.id,
-                tracker_file.directory_path or 'uncategorized',
-                create=True
-            )
+            category = tracker_file.directory_path or 'uncategorized'
+            category_path = category_paths[category]
             
             # Sanitize filename
             safe_filename = storage_manager.sanitize_filename(tracker_file.filename)
             destination = f"{category_path}/{safe_filename}"
             
             # Build relative path for FileField (relative to MEDIA_ROOT)
-            category = tracker_file.directory_path or 'uncategorized'
-            safe_category = storage_manager.sanitize_filename(category)
+            safe_category = safe_categories[category]
             relative_path = f"trackers/{tracker.id}/files/{safe_category}/{safe_filename}"
             file_path_mapping[tracker_file.id] = relative_path
             
@@ -3990,79 +4628,15 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 'name': tracker_file.filename,
                 'tracker_file_id': tracker_file.id
             })
-            
-            # Mark as downloading
-            tracker_file.download_status = 'downloading'
-            tracker_file.save()
+        
+        # Mark as downloading
+        set_download_state(tracker_files, download_status='downloading')
         
         # Download files in batch
         results = download_service.download_files_batch(file_list)
+        storage_manager.forget_disk_usage()
         
-        # Process results and update tracker files
-        successful_downloads = []
-        failed_downloads = []
-        total_bytes_downloaded = 0
-        
-        for success_info in results['successful']:
-            tracker_file = next(
-                (tf for tf in tracker_files if tf.id == success_info.get('tracker_file_id')),
-                None
-            )
-            
-            if tracker_file:
-                tracker_file.download_status = 'completed'
-                tracker_file.downloaded_at = timezone.now()
-                tracker_file.file_checksum = success_info.get('checksum', '')
-                tracker_file.actual_file_size = success_info.get('bytes_downloaded', 0)
-                tracker_file.download_error = ''
-                # Set the local_file path (relative to MEDIA_ROOT)
-                tracker_file.local_file = file_path_mapping.get(tracker_file.id, '')
-                tracker_file.storage_type = 'local'
-                tracker_file.save()
-                
-                total_bytes_downloaded += success_info.get('bytes_downloaded', 0)
-                successful_downloads.append({
-                    'file_id': tracker_file.id,
-                    'filename': tracker_file.filename,
-                    'bytes_downloaded': success_info.get('bytes_downloaded', 0),
-                    'duration': success_info.get('duration', 0)
-                })
-        
-        for fail_info in results['failed']:
-            tracker_file = next(
-                (tf for tf in tracker_files if tf.id == fail_info.get('tracker_file_id')),
-                None
-            )
-            
-            if tracker_file:
-                tracker_file.download_status = 'failed'
-                tracker_file.download_error = fail_info.get('error', 'Unknown error')
-                tracker_file.save()
-                
-                failed_downloads.append({
-                    'file_id': tracker_file.id,
-                    'filename': tracker_file.filename,
-                    'error': fail_info.get('error', 'Unknown error')
-                })
-        
-        # Update tracker totals (add to existing storage used)
-        tracker.total_storage_used = (tracker.total_storage_used or 0) + total_bytes_downloaded
-        
-        # Update files_downloaded flag: True only if ALL files (old + new) are downloaded
-        all_files = TrackerFile.objects.filter(tracker=tracker)
-        tracker.files_downloaded = all(
-            f.download_status == 'completed' 
-            for f in all_files 
-            if tracker.storage_type == 'local'
-        )
-        tracker.save()
-        
-        return {
-            'successful': successful_downloads,
-            'failed': failed_downloads,
-            'total_bytes': total_bytes_downloaded,
-            'duration': results.get('duration', 0)
-        }
+        return apply_download_results(tracker, tracker_files, results, file_path_mapping)
     
     @action(detail=True, methods=['get'], url_path='download-files')
     def download_files(self, request, pk=None):
@@ -4073,7 +4647,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
         GET /api/trackers/{id}/download-files/
         
         Returns:
-            ZIP file with all tracker files
+            ZIP file with all tracker files, streamed as it is built
         """
         tracker = self.get_object()
         
@@ -4091,43 +4665,36 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get all tracker files
-        tracker_files = TrackerFile.objects.filter(tracker=tracker, download_status='completed')
+        # Get all tracker files; the rows are read once, not checked with
+        # a separate EXISTS query first
+        tracker_files = list(downloaded_tracker_files(tracker))
         
-        if not tracker_files.exists():
+        if not tracker_files:
             return Response(
                 {'error': 'No completed file downloads found.'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
         try:
-            # Create ZIP file in memory
-            zip_buffer = BytesIO()
-            
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                for tracker_file in tracker_files:
-                    if tracker_file.local_file:
-                        # Get the full file path from FileField
-                        file_path = tracker_file.local_file.path
-                        
-                        if os.path.exists(file_path):
-                            # Preserve directory structure in ZIP
-                            # Use directory_path + filename for the archive path
-                            if tracker_file.directory_path:
-                                archive_name = f"{tracker_file.directory_path}/{tracker_file.filename}"
-                            else:
-                                archive_name = tracker_file.filename
-                            
-                            zip_file.write(file_path, archive_name)
-            
-            # Prepare response
-            zip_buffer.seek(0)
-            
             # Create a safe filename
             safe_tracker_name = "".join(c for c in tracker.name if c.isalnum() or c in (' ', '-', '_')).strip()
             filename = f"{safe_tracker_name}_files.zip"
             
-            response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+            # Normally build_tracker_zip_task has already written the archive
+            # for these files; otherwise it is streamed as it is built and
+            # kept for the next download
+            stated_files = stat_downloaded_files(tracker_files)
+            cache_path = tracker_zip_cache_path(tracker, stated_files)
+            try:
+                response = _cached_zip_response(cache_path)
+            except FileNotFoundError:
+                response = StreamingHttpResponse(
+                    cache_zip(
+                        stream_downloaded_files_zip(stated_files), cache_path,
+                        settings.TRACKER_ZIP_CACHE_MAX_BYTES,
+                    ),
+                    content_type='application/zip'
+                )
             response['Content-Disposition'] = f'attachment; filename="{filename}"'
             
             return response
@@ -4167,9 +4734,17 @@ class TrackerViewSet(viewsets.ModelViewSet):
         """
         tracker = self.get_object()
         
-        # Get all tracker files
+        # Get all tracker files, counted by status in one query
         tracker_files = tracker.files.all()
-        total_files = tracker_files.count()
+        counts = tracker_files.aggregate(
+            total=Count('id'),
+            completed=Count('id', filter=Q(download_status='completed')),
+            failed=Count('id', filter=Q(download_status='failed')),
+            downloading=Count('id', filter=Q(download_status='downloading')),
+            pending=Count('id', filter=Q(download_status='pending')),
+            last_updated=Max('updated_date'),
+        )
+        total_files = counts['total']
         
         if total_files == 0:
             return Response({
@@ -4182,11 +4757,10 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 'files': []
             })
         
-        # Count by status
-        completed = tracker_files.filter(download_status='completed').count()
-        failed = tracker_files.filter(download_status='failed').count()
-        downloading = tracker_files.filter(download_status='downloading').count()
-        pending = tracker_files.filter(download_status='pending').count()
+        completed = counts['completed']
+        failed = counts['failed']
+        downloading = counts['downloading']
+        pending = counts['pending']
         
         # Determine overall status
         if completed + failed == total_files:
@@ -4200,23 +4774,44 @@ class TrackerViewSet(viewsets.ModelViewSet):
         else:
             status_value = 'pending'
         
-        # Get current file being downloaded
-        current_file = tracker_files.filter(download_status='downloading').first()
-        current_filename = current_file.filename if current_file else None
+        # Every download-state write bumps a file's updated_date, so the
+        # counts and the newest updated_date identify the whole response;
+        # a poll that finds nothing new gets a 304 before the file list is read
+        etag = quote_etag(hashlib.blake2b(
+            f"{counts['last_updated']}:{total_files}:{completed}:{failed}:{downloading}:{pending}".encode(),
+            digest_size=16
+        ).hexdigest())
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
         
         # Calculate progress percentage
         progress_percent = int((completed / total_files) * 100) if total_files > 0 else 0
         
+        # Plain rows rather than model instances: only these columns are read
+        files = list(tracker_files.order_by('id').values_list(
+            'id', 'directory_path', 'filename', 'download_status', 'actual_file_size', 'file_size', 'download_error'
+        ))
+        
+        # Get current file being downloaded (first in the model's ordering)
+        current_file = min(
+            ((directory_path, filename) for _, directory_path, filename, download_status, *_ in files
+             if download_status == 'downloading'),
+            default=None
+        )
+        current_filename = current_file[1] if current_file else None
+        
         # Build file list with statuses
-        files_data = []
-        for tf in tracker_files.order_by('id'):
-            files_data.append({
-                'id': tf.id,
-                'filename': tf.filename,
-                'status': tf.download_status,
-                'size': tf.actual_file_size or tf.file_size,
-                'error': tf.download_error if tf.download_status == 'failed' else None
-            })
+        files_data = [
+            {
+                'id': file_id,
+                'filename': filename,
+                'status': download_status,
+                'size': actual_file_size or file_size,
+                'error': download_error if download_status == 'failed' else None
+            }
+            for file_id, _, filename, download_status, actual_file_size, file_size, download_error in files
+        ]
         
         return Response({
             'status': status_value,
@@ -4226,7 +4821,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
             'current_file': current_filename,
             'progress_percent': progress_percent,
             'files': files_data
-        })
+        }, headers={'ETag': etag})
     
     @action(detail=True, methods=['post'], url_path='upload-files')
     def upload_files(self, request, pk=None):
@@ -4282,11 +4877,21 @@ class TrackerViewSet(viewsets.ModelViewSet):
         
         # Use StorageManager to save files
         storage_manager = StorageManager()
-        created_files = []
+        new_files = {}  # filename -> unsaved TrackerFile, inserted together below
         updated_files = []
         skipped_files = []
         total_bytes = 0
         
+        # Files these uploads replace, looked up in one query
+        existing_files = {
+            tf.filename: tf
+            for tf in TrackerFile.objects.filter(
+                tracker=tracker,
+                directory_path=category,
+                filename__in={uploaded_file.name for uploaded_file in uploaded_files}
+            )
+        }
+        
         for uploaded_file in uploaded_files:
             try:
                 # Build file path: trackers/{tracker_id}/files/{category}/{filename}
@@ -4296,20 +4901,17 @@ class TrackerViewSet(viewsets.ModelViewSet):
                     file_path = f"trackers/{tracker.id}/files/{uploaded_file.name}"
                 
                 # Check if file already exists
-                existing_file = TrackerFile.objects.filter(
-                    tracker=tracker,
-                    directory_path=category,
-                    filename=uploaded_file.name
-                ).first()
+                existing_file = existing_files.get(uploaded_file.name)
                 
                 # Save file using StorageManager
-                saved_path = storage_manager.save_uploaded_file(uploaded_file, file_path)
+                saved_path, checksum = storage_manager.save_uploaded_file(uploaded_file, file_path)
                 
                 if existing_file:
                     # Update existing file
                     existing_file.local_file = saved_path
                     existing_file.file_size = uploaded_file.size
                     existing_file.actual_file_size = uploaded_file.size
+                    existing_file.file_checksum = checksum
                     existing_file.storage_type = 'local'
                     existing_file.download_status = 'completed'
                     existing_file.download_date = timezone.now()
@@ -4324,12 +4926,19 @@ class TrackerViewSet(viewsets.ModelViewSet):
                     if quantity:
                         existing_file.quantity = quantity
                     
-                    existing_file.save()
+                    # save(), not bulk_update: a color change here must clear
+                    # and requeue the file's auto-thumbnail via its signals
+                    existing_file.save(update_fields=[
+                        'local_file', 'file_size', 'actual_file_size', 'file_checksum', 'storage_type',
+                        'download_status', 'download_date', 'color', 'material', 'material_ids',
+                        'quantity', 'updated_date'
+                    ])
                     updated_files.append(existing_file)
                     total_bytes += uploaded_file.size
                 else:
-                    # Create new TrackerFile record
-                    tracker_file = TrackerFile.objects.create(
+                    # New TrackerFile record; a name uploaded twice in one
+                    # request keeps the later upload, which overwrote the first
+                    new_files[uploaded_file.name] = TrackerFile(
                         tracker=tracker,
                         storage_type='local',  # Mark as locally uploaded/stored
                         filename=uploaded_file.name,
@@ -4337,6 +4946,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
                         local_file=saved_path,
                         file_size=uploaded_file.size,
                         actual_file_size=uploaded_file.size,
+                        file_checksum=checksum,
                         color=color,
                         material=material,
                         material_ids=material_ids,
@@ -4346,8 +4956,6 @@ class TrackerViewSet(viewsets.ModelViewSet):
                         download_status='completed',  # Already "downloaded" since uploaded
                         download_date=timezone.now()
                     )
-                    
-                    created_files.append(tracker_file)
                     total_bytes += uploaded_file.size
                 
             except Exception as e:
@@ -4361,7 +4969,7 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 })
                 continue
         
-        if not created_files and not updated_files:
+        if not new_files and not updated_files:
             return Response(
                 {
                     'success': False,
@@ -4371,12 +4979,14 @@ class TrackerViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Update tracker stats
-        tracker.recalculate_stats()
-        tracker.save()
+        # Tracker stats are already current: _bulk_create_files recalculates
+        # them for the new files and each replaced file's save() signal did
+        # for that file
+        created_files = self._bulk_create_files(tracker, list(new_files.values()))
         
-        # Serialize created and updated files
+        # Serialize created and updated files, with their images in one query
         all_files = created_files + updated_files
+        prefetch_related_objects(all_files, 'images')
         serializer = TrackerFileSerializer(all_files, many=True)
         
         return Response({
@@ -4401,6 +5011,9 @@ class TrackerViewSet(viewsets.ModelViewSet):
         # Delete the tracker (CASCADE will delete TrackerFile records)
         response = super().destroy(request, *args, **kwargs)
         
+        # Its cached download ZIPs are never served again
+        remove_cached_zips(settings.TRACKER_ZIP_CACHE_DIR, tracker_id)
+        
         # Cleanup local files if tracker had downloaded files
         if storage_type == 'local':
             from .services.storage_manager import StorageManager